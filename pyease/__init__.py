@@ -2,10 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 """The pyease package."""
-from importlib import metadata
 
-try:
-    __version__ = metadata.version("pyease")
-except metadata.PackageNotFoundError:
-    __version__ = "0.0.0+unknown"
-del metadata
+__version__: str  # see __getattr__()
+
+
+def __getattr__(name: str) -> str:
+    # Looking up the version is deferred, as it is slow to import and to
+    # resolve the package metadata:
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import metadata
+
+    global __version__
+    try:
+        __version__ = metadata.version("pyease")
+    except metadata.PackageNotFoundError:
+        __version__ = "0.0.0+unknown"
+    return __version__
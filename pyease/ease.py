@@ -28,6 +28,11 @@ comment in the very first line of this module.
 The environment variable ``EASE_SCRIPTS_LOCATION`` is an absolute
 directory path telling EASE where to look for Python scripts.
 
+The optional environment variable ``EASE_WORKSPACE_TEMPLATE_CACHE``
+points to a directory in which a pristine workspace is cached as a
+template. New workspaces are then copied from that template instead of
+being written file by file.
+
 Both of these environment variables must be set before one executes this
 present module via
 
@@ -38,6 +43,17 @@ present module via
 The current script logs what it does into a log file named ``ease.log``
 in the current working directory.
 
+The optional environment variable ``EASE_T4C_MODEL_CACHE`` points to a
+directory in which models imported from T4C are cached, see
+:func:`import_model_from_remote_repository`.
+
+Set the environment variable ``EASE_QUEUE_LOGGING`` to ``"1"`` to have
+the log records written by a background thread, see
+:func:`enable_queue_logging`.
+
+The environment variable ``EASE_WAIT_MODE`` selects how conditions are
+waited for, see :func:`set_wait_mode`.
+
 .. note::
 
     The module expects, that Eclipse/ Capella is set to English
@@ -50,41 +66,73 @@ in the current working directory.
 
 """
 # Standard library:
+import atexit
+import collections
+import collections.abc as cabc
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
+import signal
+import statistics
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import typing as t
 from pathlib import Path
 
+if sys.platform == "win32":
+    import msvcrt
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
 # local:
 import pyease.easeexceptions as exp
 
-BOT: t.Any = None
-DEBUG: bool = os.getenv("DEBUG", "0") == "1"
-IS_EASE_CTXT: bool = True
-MODULE_DIR: Path = Path(__file__).parents[0]
+# Created on first access by init(), see get_bot() and __getattr__():
+BOT: t.Any
+"""The ``SWTWorkbenchBot`` or None, when not in an EASE context.
 
-try:
-    BOT = org.eclipse.swtbot.eclipse.finder.SWTWorkbenchBot()  # type: ignore
-    """
-    see
-    https://download.eclipse.org/technology/swtbot/galileo/dev-build/apidocs/org/eclipse/swtbot/eclipse/finder/SWTWorkbenchBot.html
-    https://download.eclipse.org/technology/swtbot/galileo/dev-build/apidocs/org/eclipse/swtbot/swt/finder/SWTBot.html
-    https://www.eclipse.org/swt/widgets/
+see
+https://download.eclipse.org/technology/swtbot/galileo/dev-build/apidocs/org/eclipse/swtbot/eclipse/finder/SWTWorkbenchBot.html
+https://download.eclipse.org/technology/swtbot/galileo/dev-build/apidocs/org/eclipse/swtbot/swt/finder/SWTBot.html
+https://www.eclipse.org/swt/widgets/
 
-    """
-    # 3rd party:
-    from eclipse.system.platform import getSystemProperty  # type: ignore
-    from eclipse.system.resources import getWorkspace  # type: ignore
-    from eclipse.system.ui import isHeadless  # type: ignore
-except NameError:
-    IS_EASE_CTXT = False
+"""
+COMPARE_EDITOR_TITLE: str = "Compare ('{left}' - '{right}')"
+"""Title of the editor comparing the projects *left* and *right*"""
+DEBUG: bool = os.getenv("DEBUG", "0") == "1"
+IS_EASE_CTXT: bool
+MODULE_DIR: Path = Path(__file__).parents[0]
+WAIT_TIMES: dict[str, collections.deque[float]] = {}
+"""Recent wait times in ms per condition class, see :func:`wait_until`."""
+
+# Number of wait times kept per condition class in WAIT_TIMES:
+_WAIT_TIMES_MAXLEN: int = 1000
+# Fetch labels of tree items in the UI thread, see tree_item_labels():
+_BULK_TREE_ITEM_LABELS: bool = True
+# Capella processes started by start_capella_process() by their PID:
+_CAPELLA_PROCESSES: dict[int, subprocess.Popen] = {}
+# ioctl request to clone (reflink) a file, see ioctl_ficlone(2):
+_FICLONE: int | None = 0x40049409 if sys.platform == "linux" else None
+_PROC_DIR: Path = Path("/proc")
+_SIGKILL: int = getattr(signal, "SIGKILL", signal.SIGTERM)  # Windows
 
 logger: logging.Logger = logging.getLogger()
-logger.setLevel("DEBUG" if DEBUG else "INFO")
 
 
 class _MyLoggingFilter(logging.Filter):
@@ -121,23 +169,411 @@ else:
     )
 
 
-# logging console handler:
-console_hdl: logging.Handler = logging.StreamHandler(sys.stderr)
-console_hdl.setLevel("DEBUG" if DEBUG else "INFO")
-console_hdl.setFormatter(formatter)
-console_hdl.addFilter(_MyLoggingFilter())
-logger.addHandler(console_hdl)
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """Put records into the queue with their message merged.
+
+    Like :class:`logging.handlers.QueueHandler` the message is merged
+    with its arguments on the calling thread, so that arguments like
+    py4j proxies or mutable objects are not read later from the thread
+    of the :class:`logging.handlers.QueueListener`. Unlike there the
+    record is not formatted, this is left to the sinks. An exception is
+    rendered eagerly, since its traceback cannot outlive the caller.
+
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Listener feeding the sinks, when queue logging is enabled:
+_LOG_LISTENER: logging.handlers.QueueListener | None = None
+# Handlers that write the log records (console, docker, files):
+_LOG_SINKS: list[logging.Handler] = []
+# Set by init_logging():
+_LOGGING_INITIALIZED: bool = False
+
+
+def _add_log_sink(handler: logging.Handler) -> None:
+    handler.setLevel("DEBUG" if DEBUG else "INFO")
+    handler.setFormatter(formatter)
+    handler.addFilter(_MyLoggingFilter())
+    _LOG_SINKS.append(handler)
+    if _LOG_LISTENER is None:
+        logger.addHandler(handler)
+    else:
+        _LOG_LISTENER.handlers = tuple(_LOG_SINKS)
+
 
-# Also log to docker's log:
+# Also log to docker's log, see init_logging():
 DOCKER_LOG_PATH: Path = Path("/proc/1/fd/1")
-if DOCKER_LOG_PATH.exists():
-    docker_hdl: logging.Handler = logging.FileHandler(
-        filename=DOCKER_LOG_PATH, mode="w"
-    )
-    docker_hdl.setLevel("DEBUG" if DEBUG else "INFO")
-    docker_hdl.setFormatter(formatter)
-    docker_hdl.addFilter(_MyLoggingFilter())
-    logger.addHandler(docker_hdl)
+
+
+class _FileLock:
+    """Advisory lock on a lock file shared by processes of the host.
+
+    Attributes
+    ----------
+    path
+        Path to the lock file (created when it does not exist)
+    shared
+        Acquire a shared instead of an exclusive lock. On Windows, where
+        ``msvcrt`` offers no shared locks, the lock is exclusive anyway.
+
+    """
+
+    def __init__(self, path: Path, shared: bool = False):
+        self.path: Path = path
+        self.shared: bool = shared
+        self._file: t.BinaryIO | None = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock and return True if that succeeded.
+
+        With *blocking* set to False the function returns False
+        immediately if another process holds the lock.
+
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_: t.BinaryIO = open(self.path, "a+b")
+        try:
+            if sys.platform == "win32":
+                if self.shared:
+                    logger.debug(
+                        "Lock '%s' exclusively, shared locks are not "
+                        "supported on Windows.",
+                        self.path,
+                    )
+                while True:
+                    try:
+                        msvcrt.locking(file_.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+                        time.sleep(0.1)
+            else:
+                operation: int = (
+                    fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+                )
+                if not blocking:
+                    operation |= fcntl.LOCK_NB
+                fcntl.flock(file_.fileno(), operation)
+        except OSError:
+            file_.close()
+            return False
+        self._file = file_
+        return True
+
+    def release(self):
+        """Release the lock."""
+        if self._file is None:
+            return
+        if sys.platform == "win32":
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "_FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class _BridgeStatistics:
+    """Calls over the py4j bridge recorded per public helper function.
+
+    Attributes
+    ----------
+    latencies
+        Latencies in seconds per helper function and called Java method
+    helper_calls
+        Number of invocations per helper function
+
+    """
+
+    def __init__(self):
+        self.latencies: dict[str, dict[str, list[float]]] = {}
+        self.helper_calls: dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, method: str, latency: float):
+        """Record the *latency* of a call of a Java *method*."""
+        helper: str = _CURRENT_HELPER.get() or "<script>"
+        with self._lock:
+            self.latencies.setdefault(helper, {}).setdefault(
+                method, []
+            ).append(latency)
+
+    def record_helper_call(self, helper: str):
+        """Count an invocation of the public *helper* function."""
+        with self._lock:
+            self.helper_calls[helper] = self.helper_calls.get(helper, 0) + 1
+
+    def summary(self) -> dict[str, t.Any]:
+        """Return the bridge calls and their latencies (in ms) per helper."""
+        summary: dict[str, t.Any] = {}
+        with self._lock:
+            for helper, methods in sorted(self.latencies.items()):
+                latencies: list[float] = sorted(
+                    latency * 1000
+                    for method_latencies in methods.values()
+                    for latency in method_latencies
+                )
+                summary[helper] = {
+                    "invocations": self.helper_calls.get(helper, 0),
+                    "bridge_calls": len(latencies),
+                    "total_ms": sum(latencies),
+                    "min_ms": latencies[0],
+                    "median_ms": statistics.median(latencies),
+                    "p90_ms": latencies[int(0.9 * (len(latencies) - 1))],
+                    "max_ms": latencies[-1],
+                    "calls_per_method": {
+                        method: len(method_latencies)
+                        for method, method_latencies in sorted(methods.items())
+                    },
+                }
+        return summary
+
+
+class _BridgeProxy:
+    """Proxy for a Java object that records every call over the bridge.
+
+    Objects returned by the calls are wrapped by a proxy again, so that
+    calls on widgets found by the ``SWTWorkbenchBot`` are recorded too.
+
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target: t.Any):
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name: str) -> t.Any:
+        attribute: t.Any = getattr(self._target, name)
+        if not callable(attribute):
+            return _bridge_proxy(attribute)
+
+        def call(*args, **kwargs) -> t.Any:
+            args = tuple(_bridge_target(arg) for arg in args)
+            start: float = time.perf_counter()
+            try:
+                return _bridge_proxy(attribute(*args, **kwargs))
+            finally:
+                if _BRIDGE_STATISTICS is not None:
+                    _BRIDGE_STATISTICS.record(
+                        name, time.perf_counter() - start
+                    )
+
+        return call
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        return self._target == _bridge_target(other)
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __iter__(self) -> cabc.Iterator[t.Any]:
+        return (_bridge_proxy(item) for item in self._target)
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        return _bridge_proxy(self._target[key])
+
+    def __repr__(self) -> str:
+        return repr(self._target)
+
+    def __str__(self) -> str:
+        return str(self._target)
+
+
+def _bridge_proxy(value: t.Any) -> t.Any:
+    """Wrap *value* by a :class:`_BridgeProxy` unless it is plain data."""
+    if (
+        isinstance(
+            value,
+            (str, bytes, int, float, bool, list, tuple, dict, _BridgeProxy),
+        )
+        or value is None
+    ):
+        return value
+    return _BridgeProxy(value)
+
+
+def _bridge_target(value: t.Any) -> t.Any:
+    """Return the object wrapped by *value* if it is a proxy."""
+    if isinstance(value, _BridgeProxy):
+        return object.__getattribute__(value, "_target")
+    return value
+
+
+_BRIDGE_STATISTICS: _BridgeStatistics | None = None
+_CURRENT_HELPER: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "_CURRENT_HELPER", default=None
+)
+_F = t.TypeVar("_F", bound=t.Callable[..., t.Any])
+
+
+def _instrumented(func: _F) -> _F:
+    """Attribute bridge calls to the public helper function *func*.
+
+    Calls are attributed to the outermost helper, i.e. the calls of
+    :func:`click_button_with_label` made by
+    :func:`connect_to_remote_t4c_model` count for the latter. Without an
+    enabled instrumentation the decorator only adds a single check.
+
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _BRIDGE_STATISTICS is None or _CURRENT_HELPER.get() is not None:
+            return func(*args, **kwargs)
+        _BRIDGE_STATISTICS.record_helper_call(func.__name__)
+        token: contextvars.Token = _CURRENT_HELPER.set(func.__name__)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _CURRENT_HELPER.reset(token)
+
+    return t.cast(_F, wrapper)
+
+
+class _AllEditorsCloser:
+    """Close all editors of the workbench without saving them.
+
+    Unlike ``SWTWorkbenchBot.closeAllEditors`` this never blocks on a
+    prompt to save a dirty editor. The class implements the SWTBot
+    interface ``VoidResult`` to be run by ``UIThreadRunnable.syncExec``.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/results/VoidResult.html
+
+    """
+
+    def __init__(self, workbench: t.Any):
+        self.workbench: t.Any = workbench
+
+    def run(self) -> None:
+        """Close the editors of all pages of all workbench windows."""
+        for window in self.workbench.getWorkbenchWindows():
+            for page in window.getPages():
+                page.closeAllEditors(False)
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.results.VoidResult"]
+
+
+class AnyConditionIsMet:
+    """Implement condition that any of several conditions is met.
+
+    The conditions are tested in the given order, the first one met is
+    remembered as :attr:`met`. A condition raising an exception counts
+    as not met. Testing for a widget, which is not there, takes up to
+    the SWTBot search timeout, which :func:`wait_for_any` therefore sets
+    to zero while it waits.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+
+    """
+
+    def __init__(self, *conditions: t.Any):
+        """Initialise the condition and introduce/ set class attributes.
+
+        Attributes
+        ----------
+        bot
+            ``SWTBot`` instance that will be set in ``init`` at runtime
+        conditions
+            Conditions implementing the ``ICondition`` interface
+        met
+            The first condition met by the last successful test
+
+        """
+        self.bot = None
+        self.conditions: tuple[t.Any, ...] = conditions
+        self.met: t.Any = None
+
+    def init(self, bot):
+        """Initialise the conditions with a given ``SWTBot`` instance."""
+        self.bot = bot
+        for condition in self.conditions:
+            condition.init(bot)
+
+    def test(self) -> bool:
+        """Test if any of the conditions is met."""
+        for condition in self.conditions:
+            try:
+                if condition.test():
+                    self.met = condition
+                    return True
+            except Exception:
+                pass
+        return False
+
+    def getFailureMessage(self) -> str:
+        """Get the failure message when a test fails (returns False)."""
+        return " ".join(
+            condition.getFailureMessage() for condition in self.conditions
+        )
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
+
+
+class BackoffPolicy(t.NamedTuple):
+    """Polling schedule with adaptive backoff used by :func:`wait_until`.
+
+    The condition is probed immediately. The delay until the next probe
+    starts at *first_interval* and grows by *factor* after every probe
+    until it reaches *max_interval*. The delays never exceed the
+    interval passed to :func:`wait_until`.
+
+    Attributes
+    ----------
+    first_interval
+        Delay in ms after the first probe
+    factor
+        Factor by which the delay grows after every probe
+    max_interval
+        Upper bound in ms for the delay between two probes
+
+    """
+
+    first_interval: int = 10
+    factor: float = 2.0
+    max_interval: int = 500
+
+
+FIXED_WAIT_POLICY: BackoffPolicy = BackoffPolicy(2**31 - 1, 1.0, 2**31 - 1)
+"""Polling schedule probing every *interval* ms like ``SWTBot.waitUntil``"""
+
+WAIT_POLICY: BackoffPolicy | None = BackoffPolicy()
+"""Default polling schedule of :func:`wait_until`.
+
+Set to None to let ``SWTBot.waitUntil`` poll with fixed intervals, see
+:func:`set_wait_mode`.
+"""
 
 
 class ButtonWithLabelIsAvailable:
@@ -159,10 +595,13 @@ class ButtonWithLabelIsAvailable:
         label
             Label of the button for which this condition checks the
             availability
+        widget
+            ``SWTBotButton`` instance found by the last successful test
 
         """
         self.bot = None
         self.label = label
+        self.widget: t.Any = None
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -171,7 +610,7 @@ class ButtonWithLabelIsAvailable:
     def test(self) -> bool:
         """Test if labelled button is available."""
         try:
-            self.bot.button(self.label)  # type: ignore
+            self.widget = self.bot.button(self.label)  # type: ignore
             logger.debug("Button labelled '%s' is available.", self.label)
         except Exception:
             logger.debug("Button labelled '%s' is not available.", self.label)
@@ -188,6 +627,61 @@ class ButtonWithLabelIsAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
+class ButtonWithLabelIsAvailableAndEnabled:
+    """Implement condition that a labelled button is available and enabled.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+
+    """
+
+    def __init__(self, label: str):
+        """Initialise the condition and introduce/ set class attributes.
+
+        Attributes
+        ----------
+        bot
+            ``SWTBot`` instance that will be set in ``init`` at runtime
+        label
+            Label of the button for which this condition checks the
+            availability and state
+        widget
+            ``SWTBotButton`` instance found by the last successful test
+
+        """
+        self.bot = None
+        self.label = label
+        self.widget: t.Any = None
+
+    def init(self, bot):
+        """Initialise the condition with a given ``SWTBot`` instance."""
+        self.bot = bot
+
+    def test(self) -> bool:
+        """Test if labelled button is available and enabled."""
+        try:
+            button: t.Any = self.bot.button(self.label)  # type: ignore
+        except Exception:
+            logger.debug("Button labelled '%s' is not available.", self.label)
+            return False
+        if not button.isEnabled():
+            logger.debug("Button labelled '%s' is not enabled.", self.label)
+            return False
+        logger.debug("Button labelled '%s' is enabled.", self.label)
+        self.widget = button
+        return True
+
+    def getFailureMessage(self) -> str:
+        """Get the failure message when a test fails (returns False)."""
+        return f"Could not find an enabled button labelled '{self.label}'!"
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
+
+
 class ButtonWithLabelIsEnabled:
     """Implement condition that a labelled button is enabled.
 
@@ -207,10 +701,13 @@ class ButtonWithLabelIsEnabled:
         label
             Label of the button for which this condition checks the
             state
+        widget
+            ``SWTBotButton`` instance found by the last test
 
         """
         self.bot = None
         self.label = label
+        self.widget: t.Any = None
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -218,8 +715,8 @@ class ButtonWithLabelIsEnabled:
 
     def test(self) -> bool:
         """Test if labelled button is enabled."""
-        button: t.Any = self.bot.button(self.label)  # type: ignore
-        enabled: bool = button.isEnabled()
+        self.widget = self.bot.button(self.label)  # type: ignore
+        enabled: bool = self.widget.isEnabled()
         logger.debug(
             "Button labelled '%s' is%s enabled.",
             self.label,
@@ -285,6 +782,28 @@ class ButtonWithLabelIsNotAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
+class ClickButton(t.NamedTuple):
+    """Flow step clicking a button, see :func:`click_button_with_label`."""
+
+    label: str
+    timeout: int = 5000
+    interval: int = 500
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        click_button_with_label(self.label, self.timeout, self.interval)
+
+
+class ClickMenu(t.NamedTuple):
+    """Flow step clicking the menu item at the end of a menu path."""
+
+    path: tuple[str, ...]
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        MENU_CACHE.click(self.path, runner.bot)
+
+
 class ComboBoxWithLabelIsAvailable:
     """Implement condition that a labelled combo box is available.
 
@@ -304,10 +823,13 @@ class ComboBoxWithLabelIsAvailable:
         label
             Label of the combo box for which this condition checks the
             availability
+        widget
+            ``SWTBotCombo`` instance found by the last successful test
 
         """
         self.bot = None
         self.label = label
+        self.widget: t.Any = None
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -316,7 +838,7 @@ class ComboBoxWithLabelIsAvailable:
     def test(self) -> bool:
         """Test if labelled combobox is available."""
         try:
-            self.bot.comboBoxWithLabel(self.label)  # type: ignore
+            self.widget = self.bot.comboBoxWithLabel(self.label)  # type: ignore
             logger.debug("Combo box labelled '%s' is available.", self.label)
         except Exception:
             logger.debug(
@@ -335,6 +857,47 @@ class ComboBoxWithLabelIsAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
+class CompareModelsResult(t.NamedTuple):
+    """Result of the comparison of two projects, see :func:`compare_models`.
+
+    Attributes
+    ----------
+    left, right
+        Names of the compared projects
+    duration
+        Wall time of the comparison in seconds
+    items
+        Number of items of the synthesis tree of the compare result
+    jsonl_path
+        JSON Lines file with the items, see :func:`write_compare_result`
+    error
+        The exception raised by the comparison or None, if it succeeded
+
+    """
+
+    left: str
+    right: str
+    duration: float
+    items: int = 0
+    jsonl_path: Path | None = None
+    error: Exception | None = None
+
+
+class CompareRecord(t.NamedTuple):
+    """Item of the synthesis tree of a compare result.
+
+    The *kind* follows from the position of the item in the tree: the
+    top level items are ``"group"``, items with children ``"match"``
+    and the leaves ``"diff"``.
+
+    """
+
+    path: tuple[str, ...]
+    """Labels of the parent items from the top level down"""
+    kind: str
+    label: str
+
+
 class CompareResultIsAvailable:
     """Implement condition that a labelled compare result is available.
 
@@ -358,10 +921,14 @@ class CompareResultIsAvailable:
         label
             Label of the compare result for which this condition checks
             the availability
+        tree
+            ``SWTBotTree`` of the synthesis of the compare result found
+            by the last successful test
 
         """
-        self.bot = None
+        self.bot: t.Any = None
         self.label = label
+        self.tree: t.Any = None
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -370,16 +937,16 @@ class CompareResultIsAvailable:
     def test(self) -> bool:
         """Test if labelled compare result is available."""
         try:
-            BOT.button("OK").click()
+            self.bot.button("OK").click()
         except Exception:
             pass
         try:
             logger.info("Wait for compare result...")
-            compare_editor: t.Any = BOT.editorByTitle(self.label)
-            synthesis_tree: t.Any = compare_editor.bot().tree(0)
+            compare_editor: t.Any = self.bot.editorByTitle(self.label)
+            self.tree = compare_editor.bot().tree(0)
             logger.info(
                 "Identified (handle) compare result tree view '%s'.",
-                synthesis_tree,
+                self.tree,
             )
             return True
         except Exception:
@@ -395,63 +962,337 @@ class CompareResultIsAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
-class MenuIsAvailable:
-    """Implement condition that a menu (item) is available.
+class FillTextFields(t.NamedTuple):
+    """Flow step filling text fields, see :func:`fill_text_fields_with_labels`."""
 
-    .. seealso::
+    texts: dict[str, str]
 
-        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        fill_text_fields_with_labels(self.texts)
+
+
+class FlowRunner:
+    """Run flows, i.e. sequences of declarative UI steps.
+
+    A flow is a sequence of steps like :class:`ClickMenu`,
+    :class:`OpenTreeNode`, :class:`FillTextFields`, :class:`ClickButton`
+    and :class:`WaitFor`. The runner keeps no state between the steps:
+    :class:`ClickMenu` takes its menu items from the session-wide
+    :data:`MENU_CACHE`, the other steps look up their widgets, since
+    dialogs come and go with every click.
+
+    Attributes
+    ----------
+    bot
+        The ``SWTWorkbenchBot``
 
     """
 
-    def __init__(self, label: str):
-        """Initialise the condition and introduce/ set class attributes.
+    def __init__(self, bot: t.Any = None):
+        """Initialise the runner.
 
-        Attributes
+        Parameters
         ----------
-        bot
-            ``SWTBot`` instance that will be set in ``init`` at runtime
-        label
-            Label of the menu (item) for which this condition checks the
-            availability
+        bot : optional
+            The ``SWTWorkbenchBot``, the default is :func:`get_bot`
 
         """
-        self.bot = None
-        self.label = label
+        self.bot: t.Any = bot or get_bot()
+        if self.bot is None:
+            raise exp.EaseNoSWTWorkbenchBotError
 
-    def init(self, bot):
-        """Initialise the condition with a given ``SWTBot`` instance."""
-        self.bot = bot
+    def run(self, steps: cabc.Iterable["FlowStep"]) -> None:
+        """Run the *steps* of a flow."""
+        for step in steps:
+            logger.debug("Run flow step %s...", step)
+            step.run(self)
 
-    def test(self) -> bool:
-        """Test if labelled menu (item) is available."""
-        try:
-            self.bot.menu(self.label)  # type: ignore
-        except Exception:
-            return False
-        return True
 
-    def getFailureMessage(self) -> str:
-        """Get the failure message when a test fails (returns False)."""
-        return f"Could not find the menu labelled '{self.label}'!"
+class FlowStep(t.Protocol):
+    """A step of a flow run by the :class:`FlowRunner`."""
 
-    class Java:
-        """Implement Java interface."""
+    def run(self, runner: FlowRunner) -> None:
+        """Run the step."""
 
-        implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
+class GitCloneJob(t.NamedTuple):
+    """Job to clone a Git repository, see :func:`clone_project_from_git`."""
 
-class TextfieldWithLabelIsAvailable:
-    """Implement condition that a labelled textfield is available.
+    git_repo_url: str
+    git_repo_branch: str
+    target_git_clone_dir: Path
+    depth: int = 1
+    filter_spec: str | None = None
+    sparse_paths: cabc.Sequence[str] | None = None
 
-    .. seealso::
 
-        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+class GitCloneResult(t.NamedTuple):
+    """Result of a :class:`GitCloneJob`.
+
+    Attributes
+    ----------
+    job
+        The job
+    duration
+        Wall time of the job in seconds
+    error
+        The exception raised by the job or None, if the job succeeded
 
     """
 
-    def __init__(self, label: str):
-        """Initialise the condition and introduce/ set class attributes.
+    job: GitCloneJob
+    duration: float
+    error: Exception | None = None
+
+
+class MenuCache:
+    """Cache of resolved menu item handles by their menu paths.
+
+    Every level of a menu path like ``("File", "New", "Other...")`` is a
+    search of SWTBot across the menus of the active shell. The cache
+    resolves every prefix of a path only once and returns the cached
+    handles afterwards. It is invalidated, when the ``SWTWorkbenchBot``
+    or the title of the active shell changes, and when a cached handle
+    turns out to be disposed, i.e. clicking it fails.
+
+    """
+
+    def __init__(self):
+        """Initialise an empty cache."""
+        self._bot: t.Any = None
+        self._shell: str | None = None
+        self._handles: dict[tuple[str, ...], t.Any] = {}
+
+    def clear(self) -> None:
+        """Forget all cached menu item handles."""
+        self._handles.clear()
+        self._bot = self._shell = None
+
+    def click(self, path: cabc.Sequence[str], bot: t.Any = None) -> None:
+        """Click the menu item at the end of the menu *path*.
+
+        If the cached handle cannot be clicked, the cache is cleared and
+        the *path* is resolved once more.
+
+        Parameters
+        ----------
+        path
+            Labels of the menus down to the menu item
+        bot : optional
+            The ``SWTWorkbenchBot``, the default is :func:`get_bot`
+
+        """
+        path = tuple(path)
+        self._check_shell(bot)
+        cached: bool = path[:1] in self._handles
+        try:
+            self._resolve(path).click()
+        except Exception:
+            if not cached:
+                raise
+            logger.debug("Cached handle of menu %s is stale.", path)
+            self._handles.clear()
+            self._resolve(path).click()
+
+    def resolve(self, path: cabc.Sequence[str], bot: t.Any = None) -> t.Any:
+        """Return the (cached) handle of the menu item at *path*.
+
+        Parameters
+        ----------
+        path
+            Labels of the menus down to the menu item
+        bot : optional
+            The ``SWTWorkbenchBot``, the default is :func:`get_bot`
+
+        """
+        self._check_shell(bot)
+        return self._resolve(tuple(path))
+
+    def _check_shell(self, bot: t.Any) -> None:
+        bot = bot or get_bot()
+        if bot is None:
+            raise exp.EaseNoSWTWorkbenchBotError
+        shell: str = bot.activeShell().getText()
+        if bot is not self._bot or shell != self._shell:
+            self.clear()
+            self._bot, self._shell = bot, shell
+
+    def _resolve(self, path: tuple[str, ...]) -> t.Any:
+        handle: t.Any = self._handles.get(path)
+        if handle is None:
+            parent: t.Any = (
+                self._bot if len(path) == 1 else self._resolve(path[:-1])
+            )
+            handle = self._handles[path] = parent.menu(path[-1])
+        return handle
+
+
+MENU_CACHE: MenuCache = MenuCache()
+"""Menu item handles cached for the session, see :func:`click_menu`"""
+
+
+class MenuIsAvailable:
+    """Implement condition that a menu (item) is available.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+
+    """
+
+    def __init__(self, label: str):
+        """Initialise the condition and introduce/ set class attributes.
+
+        Attributes
+        ----------
+        bot
+            ``SWTBot`` instance that will be set in ``init`` at runtime
+        label
+            Label of the menu (item) for which this condition checks the
+            availability
+        widget
+            ``SWTBotMenu`` instance found by the last successful test
+
+        """
+        self.bot = None
+        self.label = label
+        self.widget: t.Any = None
+
+    def init(self, bot):
+        """Initialise the condition with a given ``SWTBot`` instance."""
+        self.bot = bot
+
+    def test(self) -> bool:
+        """Test if labelled menu (item) is available."""
+        try:
+            self.widget = self.bot.menu(self.label)  # type: ignore
+        except Exception:
+            return False
+        return True
+
+    def getFailureMessage(self) -> str:
+        """Get the failure message when a test fails (returns False)."""
+        return f"Could not find the menu labelled '{self.label}'!"
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
+
+
+class OpenTreeNode(t.NamedTuple):
+    """Flow step double-clicking a node of the tree in the active shell.
+
+    The nodes on the *path* are expanded, the first one is selected
+    before if *select* is True.
+
+    """
+
+    path: tuple[str, ...]
+    select: bool = False
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        node: t.Any = runner.bot.tree().getTreeItem(self.path[0])
+        if self.select:
+            node.select()
+        for label in self.path[1:]:
+            node.expand()
+            node = node.getNode(label)
+        node.doubleClick()
+
+
+class SelectComboItem(t.NamedTuple):
+    """Flow step selecting an item of a combo box found by its label."""
+
+    label: str
+    item: str
+    timeout: int = 5000
+    interval: int = 500
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        condition: ComboBoxWithLabelIsAvailable = ComboBoxWithLabelIsAvailable(
+            self.label
+        )
+        wait_until(condition, self.timeout, self.interval)
+        condition.widget.setSelection(self.item)
+
+
+class SelectTableItem(t.NamedTuple):
+    """Flow step selecting the first of *items* in the table."""
+
+    items: tuple[str, ...]
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step.
+
+        Raises
+        ------
+        RuntimeError
+            When the table contains none of the items
+
+        """
+        table: t.Any = runner.bot.table()
+        for item in self.items:
+            if table.containsItem(item):
+                table.getTableItem(item).select()
+                return
+            logger.debug("Cannot find table item '%s'.", item)
+        raise RuntimeError(
+            f"Cannot find any of the table items {list(self.items)}!"
+        )
+
+
+class SetComboText(t.NamedTuple):
+    """Flow step setting the text of the combo box at a position.
+
+    The *position* is the index of the combo box in the active shell.
+
+    """
+
+    position: int
+    text: str
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        runner.bot.comboBox(self.position).setText(self.text)
+
+
+class T4CImportResult(t.NamedTuple):
+    """Result of the import of a T4C model.
+
+    Attributes
+    ----------
+    project
+        Name of the T4C project
+    duration
+        Wall time of the import in seconds
+    cached
+        True, if the model was imported from the model cache
+    error
+        The exception raised by the import or None, if it succeeded
+
+    """
+
+    project: str
+    duration: float
+    cached: bool = False
+    error: Exception | None = None
+
+
+class TextfieldWithLabelIsAvailable:
+    """Implement condition that a labelled textfield is available.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
+
+    """
+
+    def __init__(self, label: str):
+        """Initialise the condition and introduce/ set class attributes.
 
         Attributes
         ----------
@@ -460,10 +1301,13 @@ class TextfieldWithLabelIsAvailable:
         label
             Label of the textfield for which this condition checks the
             availability
+        widget
+            ``SWTBotText`` instance found by the last successful test
 
         """
         self.bot = None
         self.label = label
+        self.widget: t.Any = None
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -472,7 +1316,7 @@ class TextfieldWithLabelIsAvailable:
     def test(self) -> bool:
         """Test if labelled textfield is available."""
         try:
-            self.bot.textWithLabel(self.label)  # type: ignore
+            self.widget = self.bot.textWithLabel(self.label)  # type: ignore
             logger.debug("Text field labelled '%s' is available.", self.label)
         except Exception:
             logger.debug(
@@ -491,16 +1335,207 @@ class TextfieldWithLabelIsAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
+def _swt_item_labels(items: t.Any, to_string: t.Any) -> list[str]:
+    """Return the labels of an array of SWT items.
+
+    The array is rendered by ``java.util.Arrays.toString`` (passed as
+    *to_string*) in one call, which renders every item as ``TreeItem
+    {<label>}`` (see ``Widget.toString``). When a label contains the
+    separator of that rendering, the labels are fetched item by item.
+    The function must be called in the UI thread.
+
+    """
+    count: int = len(items)
+    if not count:
+        return []
+    text: str = to_string(items)
+    name: str = text[1 : text.find(" {")]
+    labels: list[str] = text[len(name) + 3 : -2].split(f"}}, {name} {{")
+    if len(labels) == count:
+        return labels
+    return [item.getText() for item in items]
+
+
+class _TreeItemLabels:
+    """Collect the labels of the items of an SWT tree in the UI thread.
+
+    The labels are kept in :attr:`labels`, see :func:`_swt_item_labels`.
+    The class implements the SWTBot interface ``VoidResult`` to be run
+    by ``UIThreadRunnable.syncExec``.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/results/VoidResult.html
+
+    """
+
+    def __init__(self, tree_widget: t.Any, to_string: t.Any):
+        self.tree_widget: t.Any = tree_widget
+        self.to_string: t.Any = to_string
+        self.labels: list[str] = []
+
+    def run(self) -> None:
+        """Collect the labels of the tree items."""
+        self.labels = _swt_item_labels(
+            self.tree_widget.getItems(), self.to_string
+        )
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.results.VoidResult"]
+
+
+def _get_java_field(java_object: t.Any, name: str) -> t.Any:
+    """Return a public field of a Java object.
+
+    Unless the py4j gateway converts fields automatically, fields of py4j
+    proxies read like Python attributes are ``JavaMember`` objects, so
+    they are read with ``py4j.java_gateway.get_field``. Fields of other
+    objects are read by reflection. A :class:`_BridgeProxy` is unwrapped
+    first.
+
+    """
+    java_object = _bridge_target(java_object)
+    try:
+        from py4j.java_gateway import JavaObject, get_field
+    except ImportError:
+        JavaObject = None
+    if JavaObject is not None and isinstance(java_object, JavaObject):
+        return get_field(java_object, name)
+    return java_object.getClass().getField(name).get(java_object)
+
+
+def _set_java_field(java_object: t.Any, name: str, value: t.Any) -> None:
+    """Set a public field of a Java object.
+
+    Fields of py4j proxies cannot be assigned like Python attributes.
+
+    """
+    try:
+        from py4j.java_gateway import JavaObject, set_field
+    except ImportError:
+        JavaObject = None
+    if JavaObject is not None and isinstance(java_object, JavaObject):
+        set_field(java_object, name, value)
+    else:
+        setattr(java_object, name, value)
+
+
+class _TreeRecordsWalk:
+    """Walk the items of an SWT tree depth first in the UI thread.
+
+    Every :meth:`run` collects the records of the next page of up to
+    *page_size* items in :attr:`records` and keeps the position of the
+    walk for the next page. The labels of the children of an item are
+    fetched at once, see :func:`_swt_item_labels`. A collapsed item is
+    expanded on the way, like SWTBot does it, by notifying the
+    ``SWT.Expand`` listeners of the tree (which create the children of
+    lazy trees) with an event created by *new_event* and expanding the
+    item. An item that stays collapsed is recorded without its
+    children. The class implements the SWTBot interface ``VoidResult``
+    to be run by ``UIThreadRunnable.syncExec``.
+
+    .. seealso::
+
+        https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/results/VoidResult.html
+
+    """
+
+    def __init__(
+        self,
+        tree_widget: t.Any,
+        page_size: int,
+        to_string: t.Any,
+        new_event: t.Any,
+        expand_event_type: int,
+    ):
+        self.tree_widget: t.Any = tree_widget
+        self.page_size: int = page_size
+        self.to_string: t.Any = to_string
+        self.new_event: t.Any = new_event
+        self.expand_event_type: int = expand_event_type
+        self.records: list[CompareRecord] = []
+        self.done: bool = False
+        self._levels: list[tuple[t.Any, list[str]]] = []
+        self._indices: list[int] = []
+        self._path: list[str] = []
+
+    def _descend(self, parent: t.Any) -> None:
+        items: t.Any = parent.getItems()
+        self._levels.append((items, _swt_item_labels(items, self.to_string)))
+        self._indices.append(0)
+
+    def _expand(self, item: t.Any) -> bool:
+        event: t.Any = self.new_event()
+        _set_java_field(event, "item", item)
+        self.tree_widget.notifyListeners(self.expand_event_type, event)
+        item.setExpanded(True)
+        return item.getExpanded()
+
+    def run(self) -> None:
+        """Collect the records of the next page of tree items."""
+        self.records = []
+        if not self._levels and not self.done:
+            self._descend(self.tree_widget)
+        while True:
+            while self._indices and self._indices[-1] >= len(
+                self._levels[-1][1]
+            ):
+                self._levels.pop()
+                self._indices.pop()
+                if self._indices:
+                    self._path.pop()
+                    self._indices[-1] += 1
+            if not self._indices:
+                self.done = True
+                return
+            if len(self.records) >= self.page_size:
+                return
+            items, labels = self._levels[-1]
+            item: t.Any = items[self._indices[-1]]
+            label: str = labels[self._indices[-1]]
+            has_children: bool = item.getItemCount() > 0
+            kind: str = (
+                "group"
+                if not self._path
+                else "match"
+                if has_children
+                else "diff"
+            )
+            self.records.append(CompareRecord(tuple(self._path), kind, label))
+            if has_children and (item.getExpanded() or self._expand(item)):
+                self._path.append(label)
+                self._descend(item)
+            else:
+                if has_children:
+                    logger.warning(
+                        "Tree item '%s' stays collapsed, its children are "
+                        "skipped.",
+                        label,
+                    )
+                self._indices[-1] += 1
+
+    class Java:
+        """Implement Java interface."""
+
+        implements = ["org.eclipse.swtbot.swt.finder.results.VoidResult"]
+
+
 class TreeItemWithLabelMatchingRegExIsAvailable:
     """Implement condition that a tree item is available.
 
+    The labels of all tree items are fetched at once per test, see
+    :func:`tree_item_labels`, and matched against the precompiled
+    regular expressions. The condition is met when any of them matches.
+
     .. seealso::
 
         https://download.eclipse.org/technology/swtbot/helios/dev-build/apidocs/org/eclipse/swtbot/swt/finder/waits/ICondition.html
 
     """
 
-    def __init__(self, tree: t.Any, label_regex: str):
+    def __init__(self, tree: t.Any, label_regex: str, *label_regexes: str):
         """Initialise the condition and introduce/ set class attributes.
 
         Attributes
@@ -513,11 +1548,20 @@ class TreeItemWithLabelMatchingRegExIsAvailable:
         label_regex
             RegEx for a label of a tree item in the *tree* for which
             this condition checks the availability
+        label_regexes
+            Further RegExes of which any label may match instead
+        matched_label
+            Label of the tree item found by the last successful test
 
         """
         self.bot = None
         self.tree = tree
         self.label_regex = label_regex
+        self.label_regexes: tuple[str, ...] = (label_regex, *label_regexes)
+        self.matched_label: str | None = None
+        self._patterns: list[re.Pattern] = [
+            re.compile(regex) for regex in self.label_regexes
+        ]
 
     def init(self, bot):
         """Initialise the condition with a given ``SWTBot`` instance."""
@@ -525,27 +1569,29 @@ class TreeItemWithLabelMatchingRegExIsAvailable:
 
     def test(self) -> bool:
         """Test if labelled tree item is available."""
-        tree_item: t.Any
         tree_item_name: str
-        for tree_item in self.tree.getAllItems():
-            tree_item_name = tree_item.getText()
-            if re.match(self.label_regex, tree_item_name) is not None:
-                logger.debug(
-                    "Tree item with label matching '%s' is available.",
-                    self.label_regex,
-                )
-                return True
+        pattern: re.Pattern
+        for tree_item_name in tree_item_labels(self.tree):
+            for pattern in self._patterns:
+                if pattern.match(tree_item_name) is not None:
+                    logger.debug(
+                        "Tree item with label matching '%s' is available.",
+                        pattern.pattern,
+                    )
+                    self.matched_label = tree_item_name
+                    return True
         logger.debug(
             "Tree item with label matching '%s' is not available.",
-            self.label_regex,
+            "' or '".join(self.label_regexes),
         )
         return False
 
     def getFailureMessage(self) -> str:
         """Get the failure message when a test fails (returns False)."""
+        label_regexes: str = "' or '".join(self.label_regexes)
         return (
             "Could not find a tree item with a label matching "
-            f"the regular expression '{self.label_regex}'!"
+            f"the regular expression '{label_regexes}'!"
         )
 
     class Java:
@@ -554,13 +1600,459 @@ class TreeItemWithLabelMatchingRegExIsAvailable:
         implements = ["org.eclipse.swtbot.swt.finder.waits.ICondition"]
 
 
+class WaitFor(t.NamedTuple):
+    """Flow step waiting for a condition, see :func:`wait_until`."""
+
+    condition: t.Any
+    timeout: int = 5000
+    interval: int = 500
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        wait_until(self.condition, self.timeout, self.interval, bot=runner.bot)
+
+
+class WaitForAny(t.NamedTuple):
+    """Flow step waiting for the first of several conditions.
+
+    Every branch is a pair of a condition and the steps to run, when it
+    is the first condition met, see :func:`wait_for_any`.
+
+    """
+
+    branches: tuple[tuple[t.Any, tuple[FlowStep, ...]], ...]
+    timeout: int = 5000
+    interval: int = 500
+
+    def run(self, runner: "FlowRunner") -> None:
+        """Run the step."""
+        conditions: list[t.Any] = [condition for condition, _ in self.branches]
+        met: t.Any = wait_for_any(
+            conditions, self.timeout, self.interval, bot=runner.bot
+        )
+        runner.run(self.branches[conditions.index(met)][1])
+
+
+class _WorkbenchListener:
+    """Part, perspective and window listener marking a state stale.
+
+    Windows opened later are watched as well.
+
+    .. seealso::
+
+        https://help.eclipse.org/latest/topic/org.eclipse.platform.doc.isv/reference/api/org/eclipse/ui/IPartListener2.html
+
+    """
+
+    def __init__(self, state: "WorkbenchState"):
+        self.state: WorkbenchState = state
+
+    def partActivated(self, part_ref: t.Any) -> None:
+        """Ignore the activation of a part."""
+
+    def partBroughtToTop(self, part_ref: t.Any) -> None:
+        """Ignore that a part is brought to the top."""
+
+    def partClosed(self, part_ref: t.Any) -> None:
+        """Mark the open views stale."""
+        self.state.invalidate(views=True)
+
+    def partDeactivated(self, part_ref: t.Any) -> None:
+        """Ignore the deactivation of a part."""
+
+    def partHidden(self, part_ref: t.Any) -> None:
+        """Ignore that a part is hidden."""
+
+    def partInputChanged(self, part_ref: t.Any) -> None:
+        """Ignore that the input of a part changed."""
+
+    def partOpened(self, part_ref: t.Any) -> None:
+        """Mark the open views stale."""
+        self.state.invalidate(views=True)
+
+    def partVisible(self, part_ref: t.Any) -> None:
+        """Ignore that a part becomes visible."""
+
+    def perspectiveActivated(self, page: t.Any, perspective: t.Any) -> None:
+        """Mark the open views and the active perspective stale."""
+        self.state.invalidate(views=True, perspective=True)
+
+    def perspectiveChanged(
+        self, page: t.Any, perspective: t.Any, change_id: str
+    ) -> None:
+        """Mark the open views stale."""
+        self.state.invalidate(views=True)
+
+    def windowActivated(self, window: t.Any) -> None:
+        """Ignore the activation of a window."""
+
+    def windowClosed(self, window: t.Any) -> None:
+        """Forget the window and mark the open views stale."""
+        self.state.unwatch(window)
+
+    def windowDeactivated(self, window: t.Any) -> None:
+        """Ignore the deactivation of a window."""
+
+    def windowOpened(self, window: t.Any) -> None:
+        """Watch the window and mark the open views stale."""
+        self.state.watch(window)
+
+    class Java:
+        """Implement Java interfaces."""
+
+        implements = [
+            "org.eclipse.ui.IPartListener2",
+            "org.eclipse.ui.IPerspectiveListener",
+            "org.eclipse.ui.IWindowListener",
+        ]
+
+
+class WorkbenchState:
+    """Cache of the open views and the active perspective of a workbench.
+
+    Listing the open views costs one bridge call per view and getting
+    the active perspective two. The state caches both and is kept
+    current by a part and perspective listener on every workbench
+    window, which marks them stale whenever a view is opened or closed
+    or another perspective is activated. A window listener on the
+    workbench watches windows opened later. Without the listeners (e.g.
+    outside of an EASE context) nothing is cached.
+
+    Attributes
+    ----------
+    bot
+        The ``SWTWorkbenchBot``
+    listening
+        True, when the listeners are registered and the state is cached
+
+    """
+
+    def __init__(self, bot: t.Any, workbench: t.Any = None):
+        """Initialise the state and register the listeners.
+
+        Parameters
+        ----------
+        bot
+            The ``SWTWorkbenchBot``
+        workbench : optional
+            The ``IWorkbench`` to listen to, the default is none
+
+        """
+        self.bot: t.Any = bot
+        self.listening: bool = False
+        self._views: dict[str, t.Any] | None = None
+        self._perspective: str | None = None
+        self._listener: _WorkbenchListener = _WorkbenchListener(self)
+        self._workbench: t.Any = None
+        self._windows: list[t.Any] = []
+        if workbench is None:
+            return
+        try:
+            workbench.addWindowListener(self._listener)
+            self._workbench = workbench
+            for window in workbench.getWorkbenchWindows():
+                self._add_listener(window)
+        except Exception:
+            logger.debug("Cannot listen to the workbench windows.")
+            self.close()
+            return
+        self.listening = True
+
+    def _add_listener(self, window: t.Any) -> None:
+        window.getPartService().addPartListener(self._listener)
+        self._windows.append(window)
+        window.addPerspectiveListener(self._listener)
+
+    def close(self) -> None:
+        """Unregister the listeners and stop caching."""
+        self.listening = False
+        self.invalidate()
+        for window in self._windows:
+            try:
+                window.getPartService().removePartListener(self._listener)
+                window.removePerspectiveListener(self._listener)
+            except Exception:
+                logger.debug("Cannot stop listening to a workbench window.")
+        self._windows.clear()
+        if self._workbench is not None:
+            try:
+                self._workbench.removeWindowListener(self._listener)
+            except Exception:
+                logger.debug("Cannot stop listening to the workbench.")
+            self._workbench = None
+
+    def invalidate(self, views: bool = True, perspective: bool = True):
+        """Mark the open *views* and/ or the active *perspective* stale."""
+        if views:
+            self._views = None
+        if perspective:
+            self._perspective = None
+
+    def perspective(self) -> str:
+        """Return the label of the active perspective."""
+        label: str | None = self._perspective
+        if label is None:
+            label = self.bot.activePerspective().getLabel()
+            if self.listening:
+                self._perspective = label
+        return label
+
+    def views(self) -> dict[str, t.Any]:
+        """Return the ``SWTBotView`` of every open view by its title."""
+        views: dict[str, t.Any] | None = self._views
+        if views is None:
+            views = {}
+            for view in self.bot.views():
+                views.setdefault(view.getTitle(), view)
+            if self.listening:
+                self._views = views
+        return views
+
+    def unwatch(self, window: t.Any) -> None:
+        """Forget a closed *window* and mark the open views stale."""
+        self.invalidate(views=True, perspective=False)
+        self._windows = [w for w in self._windows if w != window]
+
+    def watch(self, window: t.Any) -> None:
+        """Listen to an opened *window* and mark the open views stale.
+
+        If the listener cannot be registered, the state stops caching.
+
+        """
+        self.invalidate(views=True, perspective=False)
+        if not self.listening:
+            return
+        try:
+            self._add_listener(window)
+        except Exception:
+            logger.debug("Cannot listen to the opened workbench window.")
+            self.close()
+
+
+_WORKBENCH_STATE: WorkbenchState | None = None
+
+
+class WorkspaceLease:
+    """Exclusive lease of a workspace handed out by a :class:`WorkspacePool`.
+
+    The lease is released by :meth:`release` or when leaving the
+    ``with`` block in which it has been used.
+
+    Attributes
+    ----------
+    path
+        Path to the leased workspace
+
+    """
+
+    def __init__(self, pool: "WorkspacePool", path: Path):
+        self.path: Path = path
+        self._pool: WorkspacePool | None = pool
+
+    def release(self, reset: bool = True):
+        """Give the workspace back to the pool.
+
+        Parameters
+        ----------
+        reset : optional
+            Recreate the workspace in the background before it is leased
+            again (the default is True). Otherwise the workspace is
+            recycled as it is.
+
+        """
+        if self._pool is None:
+            return
+        self._pool._give_back(self.path, reset)
+        self._pool = None
+
+    def __enter__(self) -> Path:
+        return self.path
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class WorkspacePool:
+    """Pool of ready EASE workspaces for concurrent Capella jobs.
+
+    The pool claims *size* workspace directories ``workspace-<n>`` in the
+    *root_dir*. Every claimed directory is guarded by a lock file
+    ``workspace-<n>.lock`` for the lifetime of the pool, so that pools of
+    several processes sharing the same *root_dir* never hand out the
+    same workspace. The workspaces are created with
+    :func:`create_empty_workspace_with_ease_setup` in a background
+    thread and handed out by :meth:`lease`. A workspace that cannot be
+    created fails one lease and is created again for the next one.
+
+    .. code-block:: python
+
+        with WorkspacePool(Path("/tmp/workspaces"), size=4) as pool:
+            with pool.lease() as workspace:
+                ...
+
+    Attributes
+    ----------
+    root_dir
+        Directory holding the workspaces of the pool
+    size
+        Number of workspaces in the pool
+    template_cache_dir
+        Directory holding the cached workspace templates, see
+        :func:`create_empty_workspace_with_ease_setup`
+
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        size: int,
+        template_cache_dir: Path | None = None,
+    ):
+        self.root_dir: Path = root_dir.resolve()
+        self.size: int = size
+        self.template_cache_dir: Path | None = template_cache_dir
+        self._locks: dict[Path, _FileLock] = {}
+        self._leased: set[Path] = set()
+        self._mutex: threading.Lock = threading.Lock()
+        self._ready: queue.Queue[tuple[Path, Exception | None]] = queue.Queue()
+        self._dirty: queue.Queue[Path | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "WorkspacePool":
+        """Claim the workspaces and start to provision them."""
+        with self._mutex:
+            if self._thread is not None:
+                return self
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            index: int = 0
+            while len(self._locks) < self.size:
+                path: Path = self.root_dir / f"workspace-{index}"
+                lock: _FileLock = _FileLock(path.with_suffix(".lock"))
+                if path not in self._locks and lock.acquire(blocking=False):
+                    self._locks[path] = lock
+                    self._dirty.put(path)
+                index += 1
+            self._thread = threading.Thread(
+                target=self._provision, name="WorkspacePool", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def lease(self, timeout: float | None = None) -> WorkspaceLease:
+        """Lease a ready workspace.
+
+        Parameters
+        ----------
+        timeout : optional
+            Time in seconds to wait for a ready workspace (the default
+            is None, which means to wait forever)
+
+        Returns
+        -------
+        WorkspaceLease
+            Lease of the workspace
+
+        Raises
+        ------
+        easeexceptions.EaseNoWorkspaceAvailableError
+            When no workspace became ready within the *timeout* or the
+            workspace could not be created
+
+        """
+        self.start()
+        try:
+            path, error = self._ready.get(timeout=timeout)
+        except queue.Empty as e:
+            raise exp.EaseNoWorkspaceAvailableError(self.root_dir) from e
+        if error is not None:
+            self._dirty.put(path)
+            raise exp.EaseNoWorkspaceAvailableError(self.root_dir) from error
+        logger.debug("Lease workspace '%s'.", path)
+        with self._mutex:
+            self._leased.add(path)
+        return WorkspaceLease(self, path)
+
+    def close(self):
+        """Stop provisioning and release the claimed workspaces.
+
+        Leased workspaces stay claimed until their leases are released.
+
+        """
+        with self._mutex:
+            thread: threading.Thread | None = self._thread
+            self._thread = None
+        if thread is not None:
+            self._dirty.put(None)
+            thread.join()
+        with self._mutex:
+            for queue_ in (self._dirty, self._ready):
+                while not queue_.empty():
+                    queue_.get_nowait()
+            for path in set(self._locks) - self._leased:
+                self._locks.pop(path).release()
+
+    def _give_back(self, path: Path, reset: bool):
+        logger.debug(
+            "Workspace '%s' is given back%s.",
+            path,
+            " to be reset" if reset else "",
+        )
+        with self._mutex:
+            self._leased.discard(path)
+            if self._thread is None:
+                self._locks.pop(path).release()
+            elif reset:
+                self._dirty.put(path)
+            else:
+                self._ready.put((path, None))
+
+    def _provision(self):
+        while (path := self._dirty.get()) is not None:
+            try:
+                create_empty_workspace_with_ease_setup(
+                    path, template_cache_dir=self.template_cache_dir
+                )
+            except Exception as e:
+                logger.exception("Cannot provision workspace '%s'!", path)
+                self._ready.put((path, e))
+                continue
+            self._ready.put((path, None))
+
+    def __enter__(self) -> "WorkspacePool":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def bridge_call_summary() -> dict[str, t.Any]:
+    """Return the recorded calls over the py4j bridge per helper function.
+
+    See :func:`enable_bridge_instrumentation`.
+
+    Returns
+    -------
+    dict[str, t.Any]
+        Per public helper function: the number of invocations, the
+        number of bridge calls, their latency distribution in ms and the
+        number of calls per Java method. Calls made outside of any
+        helper are listed under ``"<script>"``.
+
+    """
+    if _BRIDGE_STATISTICS is None:
+        return {}
+    return _BRIDGE_STATISTICS.summary()
+
+
+@_instrumented
 def click_button_with_label(
     label: str, timeout: int = 5000, interval: int = 500
 ):
     """Wait for a button to be available and enabled and click the button.
 
     The function waits until the button is available and enabled, or the timeout is
-    reached. The interval is the delay between attempts to find and click the button.
+    reached. The interval is the upper bound of the delay between attempts to find
+    the button, see :func:`wait_until`.
 
     Parameters
     ----------
@@ -569,15 +2061,92 @@ def click_button_with_label(
     timeout
         Timeout in ms until we wait to find a button named *label* in an enabled state
     interval
-        The interval is the delay between attempts to find and click the button
+        Upper bound in ms for the delay between attempts to find the button
 
     """
-    if BOT is None:
+    bot: t.Any = get_bot()
+    if bot is None:
         raise exp.EaseNoSWTWorkbenchBotError
-    BOT.waitUntil(ButtonWithLabelIsAvailable(label), timeout, interval)
-    BOT.waitUntil(ButtonWithLabelIsEnabled(label), timeout, interval)
+    condition: ButtonWithLabelIsAvailableAndEnabled = (
+        ButtonWithLabelIsAvailableAndEnabled(label)
+    )
+    wait_until(condition, timeout, interval)
     logger.debug("Click the identified button labelled '%s'...", label)
-    BOT.button(label).click()
+    condition.widget.click()
+
+
+@_instrumented
+def click_menu(path: cabc.Sequence[str]):
+    """Click the menu item at the end of a menu *path*.
+
+    The handles of the menu items are cached, see :class:`MenuCache`.
+
+    Parameters
+    ----------
+    path
+        Labels of the menus down to the menu item, e.g.
+        ``("File", "Import...")``
+
+    """
+    logger.debug("Click menu %s...", " > ".join(path))
+    MENU_CACHE.click(path)
+
+
+def _update_git_mirror(git_repo_url: str, mirror_cache_dir: Path) -> Path:
+    """Create or update the bare mirror of a Git repository in a cache.
+
+    The mirror is guarded by an exclusive lock on a lock file next to
+    it while it is created or fetched.
+
+    Parameters
+    ----------
+    git_repo_url
+        URL to the remote Git repository
+    mirror_cache_dir
+        Directory holding the mirrors
+
+    Returns
+    -------
+    Path
+        Path to the bare mirror of the repository
+
+    """
+    name: str = hashlib.sha256(git_repo_url.encode("utf8")).hexdigest()[:16]
+    mirror_dir: Path = mirror_cache_dir.resolve() / f"{name}.git"
+    with _FileLock(mirror_dir.with_suffix(".lock")):
+        try:
+            if (mirror_dir / "HEAD").is_file():
+                logger.info(
+                    "Fetch '%s' into mirror '%s'...", git_repo_url, mirror_dir
+                )
+                subprocess.run(
+                    ["git", "fetch", "--prune", "origin"],
+                    capture_output=True,
+                    check=True,
+                    cwd=mirror_dir,
+                )
+            else:
+                shutil.rmtree(mirror_dir, ignore_errors=True)
+                logger.info(
+                    "Create mirror '%s' of '%s'...", mirror_dir, git_repo_url
+                )
+                subprocess.run(
+                    [
+                        "git",
+                        "clone",
+                        "--mirror",
+                        git_repo_url,
+                        str(mirror_dir),
+                    ],
+                    capture_output=True,
+                    check=True,
+                )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Update of the mirror of '{git_repo_url}' in '{mirror_dir}' "
+                f"failed: {e.stderr}"
+            ) from e
+    return mirror_dir
 
 
 def clone_project_from_git(
@@ -585,6 +2154,9 @@ def clone_project_from_git(
     git_repo_branch: str,
     target_git_clone_dir: Path,
     depth: int = 1,
+    mirror_cache_dir: Path | None = None,
+    filter_spec: str | None = None,
+    sparse_paths: cabc.Sequence[str] | None = None,
 ):
     """Clone a Capella model from Git into a target directory.
 
@@ -592,6 +2164,17 @@ def clone_project_from_git(
     provided the function expects that Gitlab user credentials for ssh are set on the
     computer executing this script.
 
+    Only the branch *git_repo_branch* is fetched and checked out. If
+    that branch does not exist in the remote repository, the default
+    branch is cloned and a new local branch *git_repo_branch* is created
+    from it.
+
+    With a mirror cache the repository is kept as bare mirror on the
+    local disk. Only new objects are fetched into the mirror and the
+    clone is made from the mirror, which hardlinks the objects instead
+    of downloading them. The remote ``origin`` of the clone still points
+    to *git_repo_url*.
+
     Parameters
     ----------
     git_repo_url
@@ -601,50 +2184,111 @@ def clone_project_from_git(
     target_git_clone_dir
         Target directory path for the git clone of the repository
     depth : optional
-        Depth for a shallow clone (the default is 1)
+        Depth for a shallow clone (the default is 1). It is ignored when
+        cloning from a mirror.
+    mirror_cache_dir : optional
+        Directory holding bare mirrors of the cloned repositories. The
+        default is the value of the environment variable
+        ``EASE_GIT_MIRROR_CACHE``. When neither is set, the repository
+        is cloned from *git_repo_url*.
+    filter_spec : optional
+        Filter for a partial clone, e.g. ``"blob:none"`` to fetch file
+        contents only on checkout (the default is None, which means a
+        full clone). It is ignored when cloning from a mirror.
+    sparse_paths : optional
+        Patterns (as in ``.gitignore``) of the paths to check out, e.g.
+        ``["*.aird", "*.capella", "*.capellafragment"]`` (the default is
+        None, which means to check out all files)
 
     """
+    if mirror_cache_dir is None:
+        mirror_cache_dir_str: str = os.getenv("EASE_GIT_MIRROR_CACHE", "")
+        if mirror_cache_dir_str:
+            mirror_cache_dir = Path(mirror_cache_dir_str)
     if target_git_clone_dir.is_dir():
         shutil.rmtree(target_git_clone_dir, ignore_errors=True)
+    git_cmd: list[str] = ["git", "clone"]
+    source: str = git_repo_url
+    mirror_lock: t.ContextManager = contextlib.nullcontext()
+    if mirror_cache_dir is None:
+        if depth is not None:
+            git_cmd += ["--depth", str(depth)]
+        if filter_spec is not None:
+            git_cmd += [f"--filter={filter_spec}"]
+        git_cmd += ["--single-branch"]
+    else:
+        source = str(_update_git_mirror(git_repo_url, mirror_cache_dir))
+        mirror_lock = _FileLock(Path(source).with_suffix(".lock"), shared=True)
+    if sparse_paths:
+        git_cmd += ["--no-checkout"]
     logger.info(
-        "Clone of project from '%s' (branch '%s') "
-        "with depth set to 1 into directory '%s'...",
-        git_repo_url,
+        "Clone of project from '%s' (branch '%s') into directory '%s'...",
+        source,
         git_repo_branch,
         target_git_clone_dir,
     )
+    branch_exists: bool = True
     try:
-        git_cmd: list[str] = ["git", "clone"]
-        if depth is not None:
-            git_cmd += ["--depth", str(depth)]
-        git_cmd += ["--single-branch", git_repo_url, str(target_git_clone_dir)]
-        subprocess.run(
-            git_cmd,
-            capture_output=True,
-            check=True,
-        )
+        with mirror_lock:
+            try:
+                subprocess.run(
+                    git_cmd
+                    + [
+                        "--branch",
+                        git_repo_branch,
+                        source,
+                        str(target_git_clone_dir),
+                    ],
+                    capture_output=True,
+                    check=True,
+                    # Untranslated messages for the check of stderr below:
+                    env={**os.environ, "LC_ALL": "C"},
+                )
+            except subprocess.CalledProcessError as e:
+                if b"not found in upstream" not in e.stderr:
+                    raise
+                logger.info(
+                    "Branch '%s' does not exist in '%s'. "
+                    "Clone the default branch instead...",
+                    git_repo_branch,
+                    git_repo_url,
+                )
+                branch_exists = False
+                shutil.rmtree(target_git_clone_dir, ignore_errors=True)
+                subprocess.run(
+                    git_cmd + [source, str(target_git_clone_dir)],
+                    capture_output=True,
+                    check=True,
+                )
+        if mirror_cache_dir is not None:
+            subprocess.run(
+                ["git", "remote", "set-url", "origin", git_repo_url],
+                capture_output=True,
+                check=True,
+                cwd=target_git_clone_dir,
+            )
+        if sparse_paths:
+            logger.debug("Check out only the paths %s...", sparse_paths)
+            subprocess.run(
+                ["git", "sparse-checkout", "set", "--no-cone", *sparse_paths],
+                capture_output=True,
+                check=True,
+                cwd=target_git_clone_dir,
+            )
+            subprocess.run(
+                ["git", "reset", "--hard", "HEAD"],
+                capture_output=True,
+                check=True,
+                cwd=target_git_clone_dir,
+            )
         logger.info("Cloning Git project completed.")
     except subprocess.CalledProcessError as e:
         raise RuntimeError(
             f"Clone of project from '{git_repo_url}' "
             f"(branch '{git_repo_branch}') failed: {e.stderr}"
         ) from e
-    try:
-        subprocess.run(
-            ["git", "switch", git_repo_branch],
-            check=True,
-            capture_output=True,
-            cwd=target_git_clone_dir,
-        )
-        logger.info("Switched to branch '%s'.", git_repo_branch)
+    if branch_exists:
         return
-    except subprocess.CalledProcessError as e:
-        logger.info(
-            "Switching to branch '%s' for '%s' failed: %s",
-            git_repo_branch,
-            git_repo_url,
-            e.stderr,
-        )
     try:
         subprocess.run(
             ["git", "switch", "-c", git_repo_branch],
@@ -660,30 +2304,322 @@ def clone_project_from_git(
         ) from e
 
 
+def clone_projects_from_git(
+    jobs: cabc.Iterable[GitCloneJob],
+    max_workers: int = 4,
+    mirror_cache_dir: Path | None = None,
+) -> list[GitCloneResult]:
+    """Clone several Capella models from Git concurrently.
+
+    Every job is run by :func:`clone_project_from_git` in one of at most
+    *max_workers* threads. A failing job does not cancel the others.
+
+    Parameters
+    ----------
+    jobs
+        The clone jobs
+    max_workers : optional
+        Maximum number of concurrent clones (the default is 4)
+    mirror_cache_dir : optional
+        Directory holding bare mirrors of the cloned repositories, see
+        :func:`clone_project_from_git`
+
+    Returns
+    -------
+    list[GitCloneResult]
+        Results in the order of the *jobs*
+
+    """
+
+    def run(job: GitCloneJob) -> GitCloneResult:
+        start: float = time.perf_counter()
+        try:
+            clone_project_from_git(
+                job.git_repo_url,
+                job.git_repo_branch,
+                job.target_git_clone_dir,
+                job.depth,
+                mirror_cache_dir=mirror_cache_dir,
+                filter_spec=job.filter_spec,
+                sparse_paths=job.sparse_paths,
+            )
+        except Exception as e:
+            logger.error(
+                "Clone of project from '%s' failed: %s", job.git_repo_url, e
+            )
+            return GitCloneResult(job, time.perf_counter() - start, e)
+        return GitCloneResult(job, time.perf_counter() - start)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="clone"
+    ) as executor:
+        results: list[GitCloneResult] = list(executor.map(run, jobs))
+    logger.info("Cloned %d Git project(s):", len(results))
+    for result in results:
+        logger.info(
+            "\t- %s '%s' (branch '%s') in %.1f s",
+            "Failed" if result.error else "Cloned",
+            result.job.git_repo_url,
+            result.job.git_repo_branch,
+            result.duration,
+        )
+    return results
+
+
+@_instrumented
 def close_eclipse_view(title: str) -> None:
     """Close the Eclipse view specified by its *title*.
 
     If that view is not open the logger will report that on debug level.
 
-    Parameters
-    ----------
-    title
-        Title of the view to be opened
+    Parameters
+    ----------
+    title
+        Title of the view to be opened
+
+    """
+    view: t.Any = workbench_state().views().get(title)
+    if view is None:
+        logger.debug(
+            "Cannot close view titled '%s'. View cannot be found.", title
+        )
+        return
+    view.close()
+
+
+def _active_shell_title(bot: t.Any) -> str | None:
+    """Return the title of the active shell or None if it is unknown."""
+    try:
+        return bot.activeShell().getText()
+    except Exception:
+        return None
+
+
+def _close_shells_above(bot: t.Any, title: str) -> None:
+    """Close the active shells until the shell titled *title* is active.
+
+    At most ten shells are closed. A shell that cannot be closed ends
+    the loop.
+
+    """
+    for _ in range(10):
+        try:
+            shell: t.Any = bot.activeShell()
+            shell_title: str = shell.getText()
+            if shell_title == title:
+                return
+            logger.debug("Close the shell '%s'...", shell_title)
+            shell.close()
+        except Exception:
+            logger.debug("Cannot close the active shell.")
+            return
+
+
+def _compare_projects(
+    left: str, right: str, jsonl_path: Path, page_size: int, timeout: int
+) -> int:
+    title: str = COMPARE_EDITOR_TITLE.format(left=left, right=right)
+    tree: t.Any = project_explorer_tree()
+    tree.select(left, right)
+    tree.contextMenu("Compare With").menu("Each Other as models").click()
+    try:
+        return write_compare_result(title, jsonl_path, page_size, timeout)
+    finally:
+        with contextlib.suppress(Exception):
+            get_bot().editorByTitle(title).close()
+
+
+@_instrumented
+def compare_models(
+    project_pairs: cabc.Iterable[tuple[str, str]],
+    output_dir: Path,
+    page_size: int = 500,
+    timeout: int = 600000,
+) -> list[CompareModelsResult]:
+    """Compare pairs of projects in the workspace one after the other.
+
+    For every pair ``Compare With -> Each Other as models`` is run from
+    the project explorer, the synthesis tree of the compare result is
+    written to a JSON Lines file (see :func:`write_compare_result`) in
+    the *output_dir* and the compare editor is closed again. A failing
+    comparison does not stop the others, the dialogs it left open are
+    closed.
+
+    Parameters
+    ----------
+    project_pairs
+        Names of the left and the right project of every comparison,
+        e.g. imported with :func:`import_project_from_folder`
+    output_dir
+        Directory for the JSON Lines files named ``<left>--<right>.jsonl``
+    page_size : optional
+        Maximal number of items of a synthesis tree collected per call
+    timeout : optional
+        Timeout in ms until we wait for a compare result
+
+    Returns
+    -------
+    list[CompareModelsResult]
+        Results in the order of the *project_pairs*
+
+    """
+    bot: t.Any = get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    workbench_title: str | None = _active_shell_title(bot)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results: list[CompareModelsResult] = []
+    for left, right in project_pairs:
+        logger.info("Compare '%s' with '%s'...", left, right)
+        start: float = time.perf_counter()
+        jsonl_path: Path = output_dir / f"{left}--{right}.jsonl"
+        try:
+            items: int = _compare_projects(
+                left, right, jsonl_path, page_size, timeout
+            )
+        except Exception as e:
+            logger.error("Compare '%s' with '%s' failed: %s", left, right, e)
+            if workbench_title is not None:
+                _close_shells_above(bot, workbench_title)
+            results.append(
+                CompareModelsResult(
+                    left, right, time.perf_counter() - start, error=e
+                )
+            )
+            continue
+        results.append(
+            CompareModelsResult(
+                left, right, time.perf_counter() - start, items, jsonl_path
+            )
+        )
+    logger.info("Compared %d pair(s) of projects:", len(results))
+    for result in results:
+        logger.info(
+            "\t- %s '%s' with '%s' (%d items) in %.1f s",
+            "Failed to compare" if result.error else "Compared",
+            result.left,
+            result.right,
+            result.items,
+            result.duration,
+        )
+    return results
+
+
+def _compare_records_item_by_item(
+    items: cabc.Iterable[t.Any], path: tuple[str, ...]
+) -> cabc.Iterator[CompareRecord]:
+    for item in items:
+        label: str = item.getText()
+        children: list[t.Any] = list(item.expand().getItems())
+        kind: str = "group" if not path else "match" if children else "diff"
+        yield CompareRecord(path, kind, label)
+        yield from _compare_records_item_by_item(children, (*path, label))
+
+
+def compare_result_records(
+    label: str, page_size: int = 500, timeout: int = 60000
+) -> cabc.Iterator[CompareRecord]:
+    """Yield the items of the synthesis tree of a compare result.
+
+    The compare result is the editor opened by ``Compare with -> Each
+    Other as models``. Its synthesis tree is walked depth first and
+    lazily: In an EASE context every page of up to *page_size* items is
+    collected by one ``UIThreadRunnable.syncExec`` call, which expands
+    collapsed items on the way and goes on where the previous page
+    ended. The labels of sibling items are fetched at once, so an item
+    costs about two bridge calls and an item with children four more.
+    Otherwise the items are fetched item by item through SWTBot. See
+    :func:`write_compare_result` to stream the records into a file.
+
+    Parameters
+    ----------
+    label
+        Title of the compare result editor
+    page_size : optional
+        Maximal number of items collected per call
+    timeout : optional
+        Timeout in ms until we wait for the compare result
+
+    Yields
+    ------
+    CompareRecord
+        The items of the synthesis tree
+
+    """
+    condition: CompareResultIsAvailable = CompareResultIsAvailable(label)
+    wait_until(condition, timeout)
+    tree: t.Any = condition.tree
+    try:
+        sync_exec: t.Any = (
+            org.eclipse.swtbot.swt.finder.finders.UIThreadRunnable.syncExec  # type: ignore
+        )
+        to_string: t.Any = java.util.Arrays.toString  # type: ignore
+        new_event: t.Any = org.eclipse.swt.widgets.Event  # type: ignore
+        expand_event_type: int = org.eclipse.swt.SWT.Expand  # type: ignore
+    except NameError:
+        yield from _compare_records_item_by_item(tree.getAllItems(), ())
+        return
+    walk: _TreeRecordsWalk = _TreeRecordsWalk(
+        _get_java_field(tree, "widget"),
+        page_size,
+        to_string,
+        new_event,
+        expand_event_type,
+    )
+    while not walk.done:
+        sync_exec(walk)
+        yield from walk.records
+
+
+def _t4c_connection_steps(
+    t4c_repo_host: str, t4c_repo_port_no: str, t4c_repo_name: str
+) -> list[FlowStep]:
+    """Return the flow steps filling the T4C repository fields."""
+    return [
+        FillTextFields(
+            {
+                "Repository Host:": t4c_repo_host,
+                "Port Number:": t4c_repo_port_no,
+                "Repository Name:": t4c_repo_name,
+            }
+        ),
+    ]
+
+
+def _t4c_login_steps(t4c_username: str, t4c_password: str) -> list[FlowStep]:
+    """Return the flow steps testing the T4C connection and logging in.
+
+    The login dialog only shows up, when the session is not
+    authenticated yet. Otherwise "Next >" gets enabled right away and
+    the flow goes on without waiting for the login dialog. As "Next >"
+    may be enabled on the wizard page beneath the login dialog, the
+    dialog is looked for first.
 
     """
-    found_view: bool = False
-    view: t.Any
-    for view in BOT.views():
-        found_view = view.getTitle() == title
-        if found_view:
-            view.close()
-            break
-    if not found_view:
-        logger.debug(
-            "Cannot close view titled '%s'. View cannot be found.", title
-        )
+    return [
+        ClickButton("Test connection"),
+        WaitForAny(
+            (
+                (
+                    TextfieldWithLabelIsAvailable("User name"),
+                    (
+                        FillTextFields(
+                            {
+                                "User name": t4c_username,
+                                "Password": t4c_password,
+                            }
+                        ),
+                        ClickButton("OK"),
+                    ),
+                ),
+                (ButtonWithLabelIsEnabled("Next >"), ()),
+            ),
+            timeout=10000,
+        ),
+    ]
 
 
+@_instrumented
 def connect_to_remote_t4c_model(
     t4c_repo_host: str,
     t4c_repo_port_no: str,
@@ -717,48 +2653,218 @@ def connect_to_remote_t4c_model(
         t4c_repo_host,
         t4c_repo_port_no,
     )
-    BOT.menu("File").menu("New").menu("Other...").click()
-    t4c_node: t.Any = BOT.tree().getTreeItem("Team for Capella")
-    t4c_node.expand()
-    connect_to_remote_model: t.Any = t4c_node.getNode(
-        "Connect to remote model"
+    run_flow(
+        [
+            ClickMenu(("File", "New", "Other...")),
+            OpenTreeNode(("Team for Capella", "Connect to remote model")),
+            *_t4c_connection_steps(
+                t4c_repo_host, t4c_repo_port_no, t4c_repo_name
+            ),
+            *_t4c_login_steps(t4c_username, t4c_password),
+            ClickButton("Next >"),
+            SelectComboItem(
+                "Shared Project to Connect to:",
+                f"/{t4c_project_name}/{t4c_project_name}.aird",
+            ),
+            ClickButton("Finish"),
+        ]
     )
-    connect_to_remote_model.doubleClick()
-    fill_text_field_with_label("Repository Host:", t4c_repo_host)
-    fill_text_field_with_label("Port Number:", t4c_repo_port_no)
-    fill_text_field_with_label("Repository Name:", t4c_repo_name)
-    click_button_with_label("Test connection")
-    try:
-        BOT.waitUntil(TextfieldWithLabelIsAvailable("User name"), 5000, 500)
-        fill_text_field_with_label("User name", t4c_username)
-        fill_text_field_with_label("Password", t4c_password)
-        click_button_with_label("OK")
-    except Exception:
-        pass
-    click_button_with_label(label="Next >", timeout=5000, interval=500)
-    label: str = "Shared Project to Connect to:"
-    BOT.waitUntil(ComboBoxWithLabelIsAvailable(label), 5000, 500)
-    BOT.comboBoxWithLabel(label).setSelection(
-        f"/{t4c_project_name}/{t4c_project_name}.aird"
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """Copy a file and share its data blocks with *src* if possible.
+
+    A reflink (copy-on-write clone) is tried first. Where the file
+    system does not support reflinks, a regular copy is made.
+
+    """
+    if _FICLONE is not None:
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _ease_workspace_files(ease_scripts_location_path: Path) -> dict[str, str]:
+    """Return the files of a pristine EASE workspace and their content.
+
+    Parameters
+    ----------
+    ease_scripts_location_path
+        Absolute path to the default location for EASE scripts
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of file paths (relative to the workspace) to the content
+        of the files
+
+    """
+    settings_dir: str = ".metadata/.plugins/org.eclipse.core.runtime/.settings"
+    python_exe: str = sys.executable.replace("\\", "\\\\")
+    module_dir_pipe_separated: str = (
+        str(ease_scripts_location_path)
+        .replace(os.sep, "|")
+        .replace(":", "\\:")
+    )
+    if not module_dir_pipe_separated.startswith("|"):
+        module_dir_pipe_separated = f"|{module_dir_pipe_separated}"
+
+    module_dir: str = (
+        str(ease_scripts_location_path)
+        .replace(os.sep, "/")
+        .replace(":", "\\:")
     )
-    click_button_with_label("Finish")
+    if not module_dir.startswith("/"):
+        module_dir = f"/{module_dir}"
+    return {
+        # needed to save the state of the workbench:
+        ".metadata/.plugins/org.eclipse.core.resources/.root/1.tree": "",
+        # path to Python interpreter to be used by EASE:
+        f"{settings_dir}/org.eclipse.ease.lang.python.py4j.prefs": (
+            "eclipse.preferences.version=1\n"
+            f"org.eclipse.ease.lang.python.py4j.INTERPRETER={python_exe}\n"
+        ),
+        # default location for EASE scripts:
+        f"{settings_dir}/org.eclipse.ease.ui.scripts.prefs": (
+            "eclipse.preferences.version=1\n"
+            f"file\\:||{module_dir_pipe_separated}/default=true\n"
+            f"file\\:||{module_dir_pipe_separated}/location=file\\://{module_dir}\n"
+            f"file\\:||{module_dir_pipe_separated}/recursive=true\n"
+        ),
+        # allow scripts to run code in UI thread:
+        f"{settings_dir}/org.eclipse.ease.prefs": (
+            "eclipse.preferences.version=1\n"
+            "scripts/scriptRemoteAccess=false\n"
+            "scripts/scriptUIAccess=true\n"
+        ),
+        # disable UI theme:
+        f"{settings_dir}/org.eclipse.e4.ui.workbench.renderers.swt.prefs": (
+            "eclipse.preferences.version=1\nenableMRU=true\nthemeEnabled=false\n"
+        ),
+        # disable exit prompt:
+        f"{settings_dir}/org.eclipse.ui.ide.prefs": (
+            "EXIT_PROMPT_ON_CLOSE_LAST_WINDOW=false\n"
+            "eclipse.preferences.version=1\n"
+            "quickStart=false\n"
+        ),
+    }
+
+
+def _ease_workspace_template(cache_dir: Path, files: dict[str, str]) -> Path:
+    """Return the cached workspace template for *files*.
+
+    The template is built when it is not in the *cache_dir* yet. It is
+    written into a temporary directory first and renamed afterwards, so
+    that concurrent processes never see a half written template.
+
+    Parameters
+    ----------
+    cache_dir
+        Directory holding the cached workspace templates
+    files
+        Files of the workspace as returned by
+        :func:`_ease_workspace_files`
 
+    Returns
+    -------
+    Path
+        Path to the template directory
 
-def create_empty_workspace_with_ease_setup():
+    """
+    fingerprint: t.Any = hashlib.sha256()
+    for value in (sys.executable, os.getenv("EASE_SCRIPTS_LOCATION", "")):
+        fingerprint.update(f"{value}\0".encode("utf8"))
+    for file_path, content in sorted(files.items()):
+        fingerprint.update(f"{file_path}\0{content}\0".encode("utf8"))
+    template_dir: Path = cache_dir / fingerprint.hexdigest()
+    if template_dir.is_dir():
+        logger.debug("Use cached workspace template '%s'.", template_dir)
+        return template_dir
+    logger.info("Create workspace template '%s'...", template_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dir: Path = Path(
+        tempfile.mkdtemp(prefix=f".{template_dir.name}-", dir=cache_dir)
+    )
+    try:
+        _write_ease_workspace_files(tmp_dir, files)
+        tmp_dir.rename(template_dir)
+    except OSError:
+        if not template_dir.is_dir():
+            raise
+        logger.debug(
+            "Workspace template '%s' has been created concurrently.",
+            template_dir,
+        )
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return template_dir
+
+
+def _write_ease_workspace_files(workspace_path_: Path, files: dict[str, str]):
+    """Write the *files* of an EASE workspace into *workspace_path_*."""
+    for file_path_str, content in files.items():
+        file_path: Path = workspace_path_ / file_path_str
+        if not file_path.parent.is_dir():
+            logger.debug("Create directory '%s'...", file_path.parent)
+            file_path.parent.mkdir(parents=True)
+        logger.debug("Create file '%s'...", file_path)
+        file_path.write_text(content, encoding="utf8")
+
+
+def create_empty_workspace_with_ease_setup(
+    workspace: Path | None = None,
+    template_cache_dir: Path | None = None,
+    hardlink: bool = False,
+    ease_scripts_location: Path | None = None,
+):
     """Create a workspace as needed for EASE scripts running on startup of Eclipse.
 
     The following environment variables must be set
 
-    * ``EASE_WORKSPACE`` and
-    * ``EASE_SCRIPTS_LOCATION``
+    * ``EASE_WORKSPACE`` (unless a *workspace* is given) and
+    * ``EASE_SCRIPTS_LOCATION`` (unless an *ease_scripts_location* is
+      given)
 
     Find more information in the module docstring for :mod:`pyease.ease`.
 
+    When a template cache directory is given, the pristine workspace is
+    built only once per fingerprint of its inputs (Python interpreter,
+    ``EASE_SCRIPTS_LOCATION`` and the content of the preference files)
+    and every new workspace is a reflink copy (or a plain copy, where
+    the file system does not support reflinks) of that template.
+
+    Parameters
+    ----------
+    workspace : optional
+        Directory path of the workspace to create. The default is the
+        value of the environment variable ``EASE_WORKSPACE``.
+    template_cache_dir : optional
+        Directory holding the cached workspace templates. The default is
+        the value of the environment variable
+        ``EASE_WORKSPACE_TEMPLATE_CACHE``. When neither is set, every
+        file of the workspace is written from scratch.
+    hardlink : optional
+        Hardlink the files of the template into the workspace instead of
+        copying them (the default is False). Only use this when nothing
+        writes into the files of the workspace in place, since every
+        change would also alter the template.
+    ease_scripts_location : optional
+        Directory path of the default location for EASE scripts. The
+        default is the value of the environment variable
+        ``EASE_SCRIPTS_LOCATION``.
+
     """
-    workspace_str: str = os.getenv("EASE_WORKSPACE", "")
-    if not workspace_str:
-        raise OSError("Set the environment variable 'EASE_WORKSPACE'!")
-    workspace_path_: Path = Path(workspace_str).resolve()
+    if workspace is None:
+        workspace_str: str = os.getenv("EASE_WORKSPACE", "")
+        if not workspace_str:
+            raise OSError("Set the environment variable 'EASE_WORKSPACE'!")
+        workspace = Path(workspace_str)
+    workspace_path_: Path = workspace.resolve()
     if workspace_path_.is_dir():
         if not os.access(workspace_path_, os.W_OK):
             raise OSError(
@@ -782,12 +2888,14 @@ def create_empty_workspace_with_ease_setup():
                 "Cannot create the workspace directory '%s'!", workspace_path_
             )
 
-    ease_scripts_location_str: str = os.getenv("EASE_SCRIPTS_LOCATION", "")
-    if not ease_scripts_location_str:
-        raise OSError("Set the environment variable 'EASE_SCRIPTS_LOCATION'!")
-    ease_scripts_location_path: Path = Path(
-        ease_scripts_location_str
-    ).resolve()
+    if ease_scripts_location is None:
+        ease_scripts_location_str: str = os.getenv("EASE_SCRIPTS_LOCATION", "")
+        if not ease_scripts_location_str:
+            raise OSError(
+                "Set the environment variable 'EASE_SCRIPTS_LOCATION'!"
+            )
+        ease_scripts_location = Path(ease_scripts_location_str)
+    ease_scripts_location_path: Path = ease_scripts_location.resolve()
     parent_dir: Path = ease_scripts_location_path.resolve().parent
     if not parent_dir.is_dir():
         raise ValueError(
@@ -796,103 +2904,143 @@ def create_empty_workspace_with_ease_setup():
             "not exist!"
         )
     logger.info("Set preferences for EASE:")
-    # Create file that is needed to save the state of the workbench:
-    root_dir: Path = Path(
-        workspace_path_ / ".metadata/.plugins/org.eclipse.core.resources/.root"
-    )
-    logger.debug("Create directory '%s'...", root_dir)
-    root_dir.mkdir(parents=True)
-    tree_file_path: Path = Path(root_dir / "1.tree")
-    logger.debug(
-        "Create empty file '%s' needed to save the state of the workbench...",
-        tree_file_path,
-    )
-    tree_file_path.touch()
-
-    # Create settings dir for the preferences we prepare in the following:
-    settings_dir: Path = workspace_path_ / (
-        ".metadata/.plugins/org.eclipse.core.runtime/.settings"
-    )
-    logger.debug("Create directory '%s'...", settings_dir)
-    settings_dir.mkdir(parents=True)
-
-    # set path to Python interpreter to be used by EASE:
-    py4j_file_path: Path = (
-        settings_dir / "org.eclipse.ease.lang.python.py4j.prefs"
-    )
-    logger.debug("Create file '%s'...", py4j_file_path)
     logger.info("\t- Python interpreter: '%s'", sys.executable)
-    python_exe: str = sys.executable.replace("\\", "\\\\")
-    Path(py4j_file_path).write_text(
-        "eclipse.preferences.version=1\n"
-        f"org.eclipse.ease.lang.python.py4j.INTERPRETER={python_exe}\n",
-        encoding="utf8",
-    )
-
-    # set default location for EASE scripts:
-    ease_scripts_file_path: Path = (
-        settings_dir / "org.eclipse.ease.ui.scripts.prefs"
-    )
-    logger.debug("Create file '%s'...", ease_scripts_file_path)
     logger.info(
         "\t- Default location for EASE scripts: '%s'",
         ease_scripts_location_path,
     )
-    module_dir_pipe_separated: str = (
-        str(ease_scripts_location_path)
-        .replace(os.sep, "|")
-        .replace(":", "\\:")
-    )
-    if not module_dir_pipe_separated.startswith("|"):
-        module_dir_pipe_separated = f"|{module_dir_pipe_separated}"
-
-    module_dir: str = (
-        str(ease_scripts_location_path)
-        .replace(os.sep, "/")
-        .replace(":", "\\:")
-    )
-    if not module_dir.startswith("/"):
-        module_dir = f"/{module_dir}"
-    Path(ease_scripts_file_path).write_text(
-        "eclipse.preferences.version=1\n"
-        f"file\\:||{module_dir_pipe_separated}/default=true\n"
-        f"file\\:||{module_dir_pipe_separated}/location=file\\://{module_dir}\n"
-        f"file\\:||{module_dir_pipe_separated}/recursive=true\n",
-        encoding="utf8",
-    )
-
-    # allow scripts to run code in UI thread:
-    ease_prefs_file_path: Path = settings_dir / "org.eclipse.ease.prefs"
     logger.info("\t- Allow scripts to run code in UI thread")
-    logger.debug("Create file '%s'...", ease_prefs_file_path)
-    Path(ease_prefs_file_path).write_text(
-        "eclipse.preferences.version=1\n"
-        "scripts/scriptRemoteAccess=false\n"
-        "scripts/scriptUIAccess=true\n",
-        encoding="utf8",
-    )
-    # disable UI theme:
-    swt_prefs_file_path: Path = settings_dir / (
-        "org.eclipse.e4.ui.workbench.renderers.swt.prefs"
-    )
-    logger.debug("Create file '%s'...", swt_prefs_file_path)
     logger.info("Set general Eclipse preferences:")
     logger.info("\t- Disable UI theme")
-    Path(swt_prefs_file_path).write_text(
-        "eclipse.preferences.version=1\nenableMRU=true\nthemeEnabled=false\n"
-    )
-    # disable exit prompt:
-    ide_prefs_file_path: Path = settings_dir / "org.eclipse.ui.ide.prefs"
-    logger.debug("Create file '%s'...", ide_prefs_file_path)
     logger.info("\t- Disable exit prompt")
-    Path(ide_prefs_file_path).write_text(
-        "EXIT_PROMPT_ON_CLOSE_LAST_WINDOW=false\n"
-        "eclipse.preferences.version=1\n"
-        "quickStart=false\n",
-        encoding="utf8",
+    files: dict[str, str] = _ease_workspace_files(ease_scripts_location_path)
+
+    if template_cache_dir is None:
+        template_cache_dir_str: str = os.getenv(
+            "EASE_WORKSPACE_TEMPLATE_CACHE", ""
+        )
+        if template_cache_dir_str:
+            template_cache_dir = Path(template_cache_dir_str)
+    if template_cache_dir is None:
+        _write_ease_workspace_files(workspace_path_, files)
+        return
+    template_dir: Path = _ease_workspace_template(
+        template_cache_dir.resolve(), files
+    )
+    logger.debug(
+        "%s workspace template '%s' into '%s'...",
+        "Hardlink" if hardlink else "Copy",
+        template_dir,
+        workspace_path_,
+    )
+    shutil.copytree(
+        template_dir,
+        workspace_path_,
+        copy_function=os.link if hardlink else _clone_file,
+        dirs_exist_ok=True,
+    )
+
+
+def disable_queue_logging():
+    """Log on the calling thread again.
+
+    The background listener is stopped after it has written all queued
+    records, and the sinks are attached to the root logger again.
+
+    """
+    global _LOG_LISTENER
+    if _LOG_LISTENER is None:
+        return
+    listener: logging.handlers.QueueListener = _LOG_LISTENER
+    _LOG_LISTENER = None
+    for handler in logger.handlers[:]:
+        if isinstance(handler, _EnqueueHandler):
+            logger.removeHandler(handler)
+    for handler in _LOG_SINKS:
+        logger.addHandler(handler)
+    listener.stop()
+
+
+def enable_bridge_instrumentation(json_path: Path | None = None):
+    """Record every call of the ``SWTWorkbenchBot`` over the py4j bridge.
+
+    The global ``BOT`` and all objects returned by it (widgets, views,
+    etc.) are wrapped by a proxy measuring the latency of every call.
+    The calls are attributed to the public helper function of this
+    module from which they are made. At exit a summary (see
+    :func:`bridge_call_summary`) is logged and optionally written as
+    JSON file.
+
+    The instrumentation is enabled by :func:`init` when the environment
+    variable ``EASE_BRIDGE_STATISTICS`` is set. Its value is the path to
+    the JSON file or ``1`` to only log the summary.
+
+    Parameters
+    ----------
+    json_path : optional
+        Path to the JSON file to write the summary to at exit
+
+    """
+    global BOT, _BRIDGE_STATISTICS
+    if _BRIDGE_STATISTICS is not None:
+        return
+    _BRIDGE_STATISTICS = _BridgeStatistics()
+    if "BOT" in globals():
+        BOT = _bridge_proxy(BOT)
+    atexit.register(_dump_bridge_call_summary, json_path)
+
+
+def _dump_bridge_call_summary(json_path: Path | None):
+    summary: dict[str, t.Any] = bridge_call_summary()
+    if not summary:
+        return
+    logger.info("Calls over the py4j bridge per helper function:")
+    for helper, helper_summary in summary.items():
+        logger.info(
+            "\t- %s: %d invocation(s), %d bridge call(s), total %.1f ms, "
+            "median %.2f ms, p90 %.2f ms, max %.2f ms",
+            helper,
+            helper_summary["invocations"],
+            helper_summary["bridge_calls"],
+            helper_summary["total_ms"],
+            helper_summary["median_ms"],
+            helper_summary["p90_ms"],
+            helper_summary["max_ms"],
+        )
+    if json_path is not None:
+        json_path.write_text(json.dumps(summary, indent=2), encoding="utf8")
+        logger.info("Wrote bridge call summary to '%s'.", json_path)
+
+
+def enable_queue_logging():
+    """Log through a queue served by a background thread.
+
+    The calling thread, often the py4j callback thread SWTBot waits on,
+    then only puts the log records into a queue. A
+    :class:`logging.handlers.QueueListener` filters, formats and writes
+    them to all sinks (console, docker log and the files added by
+    :func:`log_to_file`). The queue is drained at exit, or on
+    :func:`disable_queue_logging`.
+
+    Queue logging is enabled by :func:`init_logging`, when an
+    environment variable ``EASE_QUEUE_LOGGING`` is set to ``"1"``.
+
+    """
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return
+    atexit.register(disable_queue_logging)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for handler in _LOG_SINKS:
+        logger.removeHandler(handler)
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        log_queue, *_LOG_SINKS, respect_handler_level=True
     )
+    _LOG_LISTENER.start()
+    logger.addHandler(_EnqueueHandler(log_queue))
 
 
+@_instrumented
 def fill_text_field_with_label(label: str, text: str):
     """Fill a text field by its label.
 
@@ -909,19 +3057,81 @@ def fill_text_field_with_label(label: str, text: str):
         When there is no WTWorkbenchBot available
 
     """
-    if BOT is None:
+    bot: t.Any = get_bot()
+    if bot is None:
         raise exp.EaseNoSWTWorkbenchBotError
     logger.debug("Wait for text field labelled '%s'...", label)
-    BOT.waitUntil(TextfieldWithLabelIsAvailable(label), 5000, 100)
-    textfield: t.Any = BOT.textWithLabel(label)
+    condition: TextfieldWithLabelIsAvailable = TextfieldWithLabelIsAvailable(
+        label
+    )
+    wait_until(condition, 5000, 100)
     logger.debug(
         "Set the content of the text field labelled '%s' to '%s'...",
         label,
         text,
     )
-    textfield.setText(text)
+    condition.widget.setText(text)
+
+
+@_instrumented
+def fill_text_fields_with_labels(
+    texts: cabc.Mapping[str, str], timeout: int = 5000, interval: int = 100
+):
+    """Fill several text fields on the same page by their labels.
+
+    Only the first text field is waited for. The others are looked up
+    right after it, as the page is ready then. So every text field costs
+    one lookup and one ``setText`` call through SWTBot, which checks
+    that the field is enabled, but the waiting is done once per page
+    instead of once per text field.
+
+    Parameters
+    ----------
+    texts
+        The texts to set by the labels of the text fields
+    timeout : optional
+        Timeout in ms until we wait for the first text field
+    interval : optional
+        Upper bound in ms for the delay between two probes
+
+    Raises
+    ------
+    easeexceptions.EaseNoSWTWorkbenchBotError
+        When there is no WTWorkbenchBot available
+
+    """
+    bot: t.Any = get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    if not texts:
+        return
+    labels: list[str] = list(texts)
+    logger.debug("Wait for text field labelled '%s'...", labels[0])
+    condition: TextfieldWithLabelIsAvailable = TextfieldWithLabelIsAvailable(
+        labels[0]
+    )
+    wait_until(condition, timeout, interval)
+    logger.debug("Set the content of the text fields %s...", labels)
+    condition.widget.setText(texts[labels[0]])
+    for label in labels[1:]:
+        bot.textWithLabel(label).setText(texts[label])
+
+
+def get_bot() -> t.Any:
+    """Return the ``SWTWorkbenchBot``, create it on first use.
+
+    Returns
+    -------
+    t.Any
+        The ``SWTWorkbenchBot`` or None, when not in an EASE context
+
+    """
+    if "BOT" not in globals():
+        init()
+    return BOT
 
 
+@_instrumented
 def import_project_from_folder(path: Path):
     """Import project from folder into Capella workspace.
 
@@ -931,27 +3141,277 @@ def import_project_from_folder(path: Path):
         Path to directory with project
 
     """
-    logger.info("Import project from folder ('%s')...", path)
-    BOT.menu("File").menu("Import...").click()
-    general_node: t.Any = BOT.tree().getTreeItem("General")
-    general_node.select()
-    general_node.expand()
-    general_node.getNode("Projects from Folder or Archive").doubleClick()
-    combo_box: t.Any = BOT.comboBox(0)
-    combo_box.setText(str(path))
-    click_button_with_label(label="Finish", timeout=60000, interval=500)
-    BOT.waitUntil(MenuIsAvailable("File"), 600000, 500)
+    logger.info("Import project from folder ('%s')...", path)
+    run_flow(
+        [
+            ClickMenu(("File", "Import...")),
+            OpenTreeNode(
+                ("General", "Projects from Folder or Archive"), select=True
+            ),
+            SetComboText(0, str(path)),
+            ClickButton("Finish", timeout=60000),
+            WaitFor(MenuIsAvailable("File"), 600000, 500),
+        ]
+    )
+
+
+def _t4c_model_cache_entry(
+    model_cache_dir: Path | None,
+    t4c_repo_host: str,
+    t4c_repo_port_no: str,
+    t4c_repo_name: str,
+    t4c_project_name: str,
+    t4c_username: str,
+    revision: str | None,
+) -> Path | None:
+    """Return the directory of a T4C model in the model cache.
+
+    The directory contains the project directory named like the T4C
+    project. Every T4C user has entries of their own, as the access
+    rights of users may differ. The default *model_cache_dir* is the
+    value of the environment variable ``EASE_T4C_MODEL_CACHE``. None is
+    returned, when there is no cache directory or no *revision*.
+
+    """
+    if model_cache_dir is None and os.getenv("EASE_T4C_MODEL_CACHE"):
+        model_cache_dir = Path(os.environ["EASE_T4C_MODEL_CACHE"])
+    if model_cache_dir is None or revision is None:
+        return None
+    key: str = (
+        f"{t4c_username}@{t4c_repo_host}:{t4c_repo_port_no}/{t4c_repo_name}/"
+        f"{t4c_project_name}@{revision}"
+    )
+    name: str = hashlib.sha256(key.encode("utf8")).hexdigest()[:16]
+    return model_cache_dir.resolve() / name
+
+
+def _cache_t4c_model(project_dir: Path, cache_entry: Path) -> None:
+    """Copy an imported project into the model cache.
+
+    The project is copied into a temporary directory first and renamed
+    afterwards, so that a cache entry is complete once it exists.
+
+    """
+    cache_entry.parent.mkdir(parents=True, exist_ok=True)
+    with _FileLock(cache_entry.with_suffix(".lock")):
+        if cache_entry.is_dir():
+            return
+        logger.debug(
+            "Store project '%s' in the model cache '%s'...",
+            project_dir,
+            cache_entry,
+        )
+        tmp_dir: Path = Path(
+            tempfile.mkdtemp(prefix=".tmp-", dir=cache_entry.parent)
+        )
+        try:
+            shutil.copytree(
+                project_dir,
+                tmp_dir / project_dir.name,
+                symlinks=True,
+                copy_function=_clone_file,
+            )
+            os.rename(tmp_dir, cache_entry)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            logger.exception(
+                "Cannot store project '%s' in the model cache!", project_dir
+            )
+
+
+def _import_cached_t4c_model(cache_entry: Path, t4c_project_name: str) -> bool:
+    """Import a T4C model from the model cache, if it is there.
+
+    A directory left over in the workspace directory by a project of the
+    same name is replaced.
+
+    """
+    if not cache_entry.is_dir():
+        return False
+    project_dir: Path = workspace_path() / t4c_project_name
+    logger.info(
+        "Use T4C model '%s' from the model cache '%s'...",
+        t4c_project_name,
+        cache_entry,
+    )
+    if project_dir.exists():
+        logger.warning("Replace the existing directory '%s'.", project_dir)
+        shutil.rmtree(project_dir)
+    shutil.copytree(
+        cache_entry / t4c_project_name,
+        project_dir,
+        symlinks=True,
+        copy_function=_clone_file,
+    )
+    import_project_from_folder(project_dir)
+    return True
+
+
+def _import_t4c_model(
+    t4c_repo_host: str,
+    t4c_repo_port_no: str,
+    t4c_repo_name: str,
+    t4c_project_name: str,
+    t4c_username: str,
+    t4c_password: str,
+    authenticate: bool = True,
+):
+    """Import a T4C model with the import wizard.
+
+    Without *authenticate* the connection test and login are skipped,
+    unless the wizard does not enable "Next >" without them. This is
+    decided as soon as the page is ready, without a timeout.
+
+    """
+    logger.info(
+        "Connect to T4C model '%s' in repository '%s@%s:%s'...",
+        t4c_project_name,
+        t4c_repo_name,
+        t4c_repo_host,
+        t4c_repo_port_no,
+    )
+    runner: FlowRunner = FlowRunner()
+    runner.run(
+        [
+            ClickMenu(("File", "Import...")),
+            OpenTreeNode(
+                ("Team for Capella", "Import model from remote repository")
+            ),
+            *_t4c_connection_steps(
+                t4c_repo_host, t4c_repo_port_no, t4c_repo_name
+            ),
+        ]
+    )
+    login_steps: tuple[FlowStep, ...] = (
+        *_t4c_login_steps(t4c_username, t4c_password),
+        ClickButton("Next >"),
+    )
+    if authenticate:
+        runner.run(login_steps)
+    else:
+        # Tested in this order, "Next >" is only available but not
+        # enabled, when T4C does not accept the session:
+        runner.run(
+            [
+                WaitForAny(
+                    (
+                        (
+                            ButtonWithLabelIsEnabled("Next >"),
+                            (ClickButton("Next >"),),
+                        ),
+                        (ButtonWithLabelIsAvailable("Next >"), login_steps),
+                    )
+                )
+            ]
+        )
+    runner.run(
+        [
+            SelectComboItem(
+                "Shared Project to Import Locally:",
+                f"/{t4c_project_name}/{t4c_project_name}.aird",
+            ),
+            ClickButton("Finish"),
+            WaitFor(MenuIsAvailable("File"), 600000, 500),
+        ]
+    )
+
+
+def _project_location(project_name: str) -> Path:
+    """Return the directory of a project in the workspace."""
+    # 3rd party:
+    from eclipse.system.resources import getWorkspace  # type: ignore
+
+    project: t.Any = getWorkspace().getRoot().getProject(project_name)
+    return Path(project.getLocation().toString())
+
+
+@_instrumented
+def import_model_from_remote_repository(
+    t4c_repo_host: str,
+    t4c_repo_port_no: str,
+    t4c_repo_name: str,
+    t4c_project_name: str,
+    t4c_username: str,
+    t4c_password: str,
+    revision: str | None = None,
+    model_cache_dir: Path | None = None,
+):
+    """Import model from remote (T4C) repository (to local workspace).
+
+    With a *revision* of the T4C project (e.g. the commit id reported by
+    the T4C server) and a model cache directory the imported project is
+    stored in the cache. A later import of the same revision copies the
+    project from the cache into the workspace and imports it via
+    :func:`import_project_from_folder` without connecting to the T4C
+    server. Without a *revision* the model is always imported from the
+    server, as a cached model might be outdated. The cache is kept per
+    T4C user.
+
+    Parameters
+    ----------
+    t4c_repo_host
+        Host name of the T4C server
+    t4c_repo_port_no
+        Port number to which the T4C server listens to
+    t4c_repo_name
+        T4C repository name
+    t4c_project_name
+        T4C project name
+    t4c_username
+        T4C user name of the *t4c_repo_name*
+    t4c_password
+        T4C password of the *t4c_repo_name*
+    revision : optional
+        Revision or commit id of the T4C project
+    model_cache_dir : optional
+        Directory of the model cache. The default is the value of the
+        environment variable ``EASE_T4C_MODEL_CACHE``. When neither is
+        set, no cache is used.
+
+    """
+    cache_entry: Path | None = _t4c_model_cache_entry(
+        model_cache_dir,
+        t4c_repo_host,
+        t4c_repo_port_no,
+        t4c_repo_name,
+        t4c_project_name,
+        t4c_username,
+        revision,
+    )
+    if cache_entry is not None and _import_cached_t4c_model(
+        cache_entry, t4c_project_name
+    ):
+        return
+    _import_t4c_model(
+        t4c_repo_host,
+        t4c_repo_port_no,
+        t4c_repo_name,
+        t4c_project_name,
+        t4c_username,
+        t4c_password,
+    )
+    if cache_entry is not None:
+        _cache_t4c_model(_project_location(t4c_project_name), cache_entry)
 
 
-def import_model_from_remote_repository(
+@_instrumented
+def import_models_from_remote_repository(
     t4c_repo_host: str,
     t4c_repo_port_no: str,
     t4c_repo_name: str,
-    t4c_project_name: str,
+    t4c_project_names: cabc.Iterable[str],
     t4c_username: str,
     t4c_password: str,
-):
-    """Import model from remote (T4C) repository (to local workspace).
+    revisions: cabc.Mapping[str, str] | None = None,
+    model_cache_dir: Path | None = None,
+) -> list[T4CImportResult]:
+    """Import several models from one remote (T4C) repository.
+
+    The T4C import wizard takes one project per pass. The connection is
+    tested and authenticated in the first pass only, later passes go
+    straight to the project selection as long as T4C accepts the
+    session. A failing import does not cancel the others, the wizard
+    and dialogs it left open are closed.
 
     Parameters
     ----------
@@ -961,49 +3421,165 @@ def import_model_from_remote_repository(
         Port number to which the T4C server listens to
     t4c_repo_name
         T4C repository name
-    t4c_project_name
-        T4C project name
+    t4c_project_names
+        T4C project names
     t4c_username
         T4C user name of the *t4c_repo_name*
     t4c_password
         T4C password of the *t4c_repo_name*
+    revisions : optional
+        Revisions of the T4C projects by project name, see
+        :func:`import_model_from_remote_repository`
+    model_cache_dir : optional
+        Directory of the model cache, see
+        :func:`import_model_from_remote_repository`
+
+    Returns
+    -------
+    list[T4CImportResult]
+        Results in the order of the *t4c_project_names*
 
     """
+    bot: t.Any = get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    workbench_title: str | None = _active_shell_title(bot)
+    revisions = revisions or {}
+    authenticated: bool = False
+    results: list[T4CImportResult] = []
+    for t4c_project_name in t4c_project_names:
+        start: float = time.perf_counter()
+        cache_entry: Path | None = _t4c_model_cache_entry(
+            model_cache_dir,
+            t4c_repo_host,
+            t4c_repo_port_no,
+            t4c_repo_name,
+            t4c_project_name,
+            t4c_username,
+            revisions.get(t4c_project_name),
+        )
+        try:
+            if cache_entry is not None and _import_cached_t4c_model(
+                cache_entry, t4c_project_name
+            ):
+                results.append(
+                    T4CImportResult(
+                        t4c_project_name, time.perf_counter() - start, True
+                    )
+                )
+                continue
+            _import_t4c_model(
+                t4c_repo_host,
+                t4c_repo_port_no,
+                t4c_repo_name,
+                t4c_project_name,
+                t4c_username,
+                t4c_password,
+                authenticate=not authenticated,
+            )
+            authenticated = True
+            if cache_entry is not None:
+                _cache_t4c_model(
+                    _project_location(t4c_project_name), cache_entry
+                )
+        except Exception as e:
+            logger.error(
+                "Import of T4C model '%s' failed: %s", t4c_project_name, e
+            )
+            if workbench_title is not None:
+                _close_shells_above(bot, workbench_title)
+            results.append(
+                T4CImportResult(
+                    t4c_project_name, time.perf_counter() - start, error=e
+                )
+            )
+            continue
+        results.append(
+            T4CImportResult(t4c_project_name, time.perf_counter() - start)
+        )
     logger.info(
-        "Connect to T4C model '%s' in repository '%s@%s:%s'...",
-        t4c_project_name,
+        "Imported %d T4C model(s) from repository '%s@%s:%s':",
+        len(results),
         t4c_repo_name,
         t4c_repo_host,
         t4c_repo_port_no,
     )
-    BOT.menu("File").menu("Import...").click()
-    t4c_node: t.Any = BOT.tree().getTreeItem("Team for Capella")
-    t4c_node.expand()
-    connect_to_remote_model: t.Any = t4c_node.getNode(
-        "Import model from remote repository"
-    )
-    connect_to_remote_model.doubleClick()
-    fill_text_field_with_label("Repository Host:", t4c_repo_host)
-    fill_text_field_with_label("Port Number:", t4c_repo_port_no)
-    fill_text_field_with_label("Repository Name:", t4c_repo_name)
-    click_button_with_label("Test connection")
+    for result in results:
+        logger.info(
+            "\t- %s '%s'%s in %.1f s",
+            "Failed" if result.error else "Imported",
+            result.project,
+            " from the model cache" if result.cached else "",
+            result.duration,
+        )
+    return results
+
+
+def init():
+    """Set up logging and the ``SWTWorkbenchBot``.
+
+    Importing this module has no side effects. The logging setup (see
+    :func:`init_logging`) and the ``SWTWorkbenchBot`` are created by
+    this function, which is called on first use of the bot (see
+    :func:`get_bot`) or can be called explicitly at the start of an EASE
+    script. Further calls have no effect.
+
+    The bridge instrumentation (see :func:`enable_bridge_instrumentation`)
+    is enabled here, when an environment variable
+    ``EASE_BRIDGE_STATISTICS`` is set, and the wait mode (see
+    :func:`set_wait_mode`), when ``EASE_WAIT_MODE`` is set.
+
+    """
+    global BOT, IS_EASE_CTXT
+    init_logging()
+    if "IS_EASE_CTXT" in globals():
+        return
+    bot: t.Any
     try:
-        BOT.waitUntil(TextfieldWithLabelIsAvailable("User name"), 5000, 500)
-        fill_text_field_with_label("User name", t4c_username)
-        fill_text_field_with_label("Password", t4c_password)
-        click_button_with_label("OK")
-    except Exception:
-        pass
-    click_button_with_label(label="Next >", timeout=5000, interval=500)
-    label: str = "Shared Project to Import Locally:"
-    BOT.waitUntil(ComboBoxWithLabelIsAvailable(label), 5000, 500)
-    BOT.comboBoxWithLabel(label).setSelection(
-        f"/{t4c_project_name}/{t4c_project_name}.aird"
-    )
-    click_button_with_label("Finish")
-    BOT.waitUntil(MenuIsAvailable("File"), 600000, 500)
+        bot = org.eclipse.swtbot.eclipse.finder.SWTWorkbenchBot()  # type: ignore
+    except NameError:
+        bot = None
+    IS_EASE_CTXT = bot is not None
+    wait_mode_env: str = os.getenv("EASE_WAIT_MODE", "")
+    if wait_mode_env:
+        set_wait_mode(wait_mode_env)
+    bridge_statistics_env: str = os.getenv("EASE_BRIDGE_STATISTICS", "")
+    if bridge_statistics_env:
+        enable_bridge_instrumentation(
+            None
+            if bridge_statistics_env == "1"
+            else Path(bridge_statistics_env)
+        )
+    if "BOT" not in globals():
+        BOT = _bridge_proxy(bot) if _BRIDGE_STATISTICS is not None else bot
+
+
+def init_logging():
+    """Attach the console and docker log handlers to the root logger.
+
+    The level is INFO (default) or DEBUG, when an environment variable
+    ``"DEBUG"`` has been set to ``"1"``. Queue logging (see
+    :func:`enable_queue_logging`) is enabled, when an environment
+    variable ``EASE_QUEUE_LOGGING`` is set to ``"1"``. Further calls
+    have no effect.
+
+    """
+    global _LOGGING_INITIALIZED
+    if _LOGGING_INITIALIZED:
+        return
+    _LOGGING_INITIALIZED = True
+    logger.setLevel("DEBUG" if DEBUG else "INFO")
+    _add_log_sink(logging.StreamHandler(sys.stderr))
+    with contextlib.suppress(OSError):  # e.g. not permitted
+        if DOCKER_LOG_PATH.exists():
+            _add_log_sink(
+                logging.FileHandler(filename=DOCKER_LOG_PATH, mode="w")
+            )
+    if os.getenv("EASE_QUEUE_LOGGING", "0") == "1":
+        enable_queue_logging()
 
 
+@_instrumented
 def is_eclipse_view_shown(title: str) -> bool:
     """Check if an Eclipse view specified by its *title* is currently shown.
 
@@ -1018,12 +3594,10 @@ def is_eclipse_view_shown(title: str) -> bool:
         True, when a view with the *title* is currently shown
 
     """
-    for view in BOT.views():
-        if view.getTitle() == title:
-            return True
-    return False
+    return title in workbench_state().views()
 
 
+@_instrumented
 def is_projects_in_workspace() -> bool:
     """Check if we have any project(s) in the workspace.
 
@@ -1046,43 +3620,147 @@ def is_projects_in_workspace() -> bool:
         return False
 
 
-def kill_capella_process(signal: int = 9):
-    """Kill Capella process.
+def _proc_stat(pid: int) -> tuple[str, int, int] | None:
+    """Return state, parent PID and process group of process *pid*."""
+    try:
+        stat: str = (_PROC_DIR / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The command (2nd field) is in parentheses and may contain blanks:
+    fields: list[str] = stat[stat.rindex(")") + 2 :].split()
+    return fields[0], int(fields[1]), int(fields[2])
+
+
+def _proc_cmdline(pid: int) -> str:
+    try:
+        cmdline: bytes = (_PROC_DIR / str(pid) / "cmdline").read_bytes()
+    except OSError:
+        return ""
+    return cmdline.replace(b"\0", b" ").decode("utf8", "replace")
+
+
+def _process_group_members(pgid: int) -> list[int]:
+    members: list[int] = []
+    for entry in _PROC_DIR.iterdir() if _PROC_DIR.is_dir() else ():
+        if not entry.name.isdigit():
+            continue
+        stat: tuple[str, int, int] | None = _proc_stat(int(entry.name))
+        if stat is not None and stat[2] == pgid and stat[0] not in "ZX":
+            members.append(int(entry.name))
+    return members
+
+
+def _is_alive(pid: int) -> bool:
+    popen: subprocess.Popen | None = _CAPELLA_PROCESSES.get(pid)
+    if popen is not None:
+        return popen.poll() is None or bool(_process_group_members(pid))
+    if not _PROC_DIR.is_dir():
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        return True
+    stat: tuple[str, int, int] | None = _proc_stat(pid)
+    return stat is not None and stat[0] not in "ZX"
+
+
+def _capella_ancestor_pid() -> int | None:
+    """Return the PID of the Capella process running this interpreter."""
+    pid: int = os.getppid()
+    while pid > 1:
+        cmdline: str = _proc_cmdline(pid).lower()
+        if "capella" in cmdline and "python" not in cmdline:
+            return pid
+        stat: tuple[str, int, int] | None = _proc_stat(pid)
+        if stat is None:
+            break
+        pid = stat[1]
+    return None
+
+
+def _send_signal(pid: int, signal_: int) -> None:
+    try:
+        if pid in _CAPELLA_PROCESSES and hasattr(os, "killpg"):
+            os.killpg(pid, signal_)
+        else:
+            os.kill(pid, signal_)
+    except ProcessLookupError:
+        pass
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while _is_alive(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def _stop_process(pid: int, signal_: int, timeout: float) -> bool:
+    _send_signal(pid, signal_)
+    if not _wait_for_exit(pid, timeout) and signal_ != _SIGKILL:
+        logger.warning(
+            "Capella process with PID %d did not exit within %s s after "
+            "signal %d, send SIGKILL...",
+            pid,
+            timeout,
+            signal_,
+        )
+        _send_signal(pid, _SIGKILL)
+        _wait_for_exit(pid, timeout)
+    if _is_alive(pid):
+        logger.error("Could not stop Capella process with PID %d!", pid)
+        return False
+    _CAPELLA_PROCESSES.pop(pid, None)
+    logger.info("Stopped Capella process with PID %d.", pid)
+    return True
+
+
+def kill_capella_process(
+    signal: int = signal.SIGTERM,
+    timeout: float = 10.0,
+    pid: int | None = None,
+) -> list[int]:
+    """Stop Capella processes and wait until they have exited.
 
     The EASE commands
 
     * ``eclipse.system.ui.exitApplication()``
     * ``eclipse.system.ui.shutdown()``
 
-    might not stop the Capella process. Here is an agressive solution to kill
-    the Capella process and according Java processes if needed.
+    might not stop the Capella process. This function stops the Capella
+    processes started by :func:`start_capella_process` together with
+    their process groups (the JVM and its children) or, if there are
+    none, the Capella process running the current interpreter. Other
+    Capella processes on the host are left alone. With a *pid* only
+    the process with that PID is stopped.
+
+    The process is sent *signal*. When it has not exited after
+    *timeout* seconds it is killed by ``SIGKILL``.
 
     Parameters
     ----------
     signal : optional
-        Kill signal that will be sent to Capella.
+        Signal that will be sent to Capella first
+    timeout : optional
+        Time in seconds to wait for the exit after each signal
+    pid : optional
+        PID of the only process to stop
+
+    Returns
+    -------
+    list[int]
+        The PIDs of the stopped processes
 
     """
-    for line in (
-        subprocess.check_output(["ps", "-eo", "pid,command"])
-        .decode("utf8")
-        .splitlines()
-    ):
-        if "capella" in line.lower() and "python" not in line.lower():
-            match: t.Optional[re.Match] = re.match(r"(.*?)(\d+)(.*?)", line)
-            if match is None:
-                logger.error("Cannot identify PID of Capella process!")
-                return
-            pid: str = match.group(2)
-            try:
-                subprocess.check_call(["kill", "-" + str(signal), pid])
-                logger.info(
-                    "Killed Capella process with PID %s by sending signal %d.",
-                    pid,
-                    signal,
-                )
-            except subprocess.CalledProcessError as e:
-                logger.exception("Could not kill Capella process: %s", e)
+    pids: list[int] = list(_CAPELLA_PROCESSES) if pid is None else [pid]
+    if not pids:
+        ancestor_pid: int | None = _capella_ancestor_pid()
+        pids = [] if ancestor_pid is None else [ancestor_pid]
+    if not pids:
+        logger.warning("Cannot identify a Capella process to stop!")
+    return [pid_ for pid_ in pids if _stop_process(pid_, signal, timeout)]
 
 
 def log_intro_messages():
@@ -1092,6 +3770,7 @@ def log_intro_messages():
     Give a hint that one can enable debug level logging via an environment variable.
 
     """
+    init()
     logger.info("Executed by: '%s'.", sys.executable)
     logger.info(
         "Running with debug mode %s %s EASE context.",
@@ -1104,6 +3783,10 @@ def log_intro_messages():
             "level logging!\n"
         )
     if IS_EASE_CTXT:
+        # 3rd party:
+        from eclipse.system.platform import getSystemProperty  # type: ignore
+        from eclipse.system.ui import isHeadless  # type: ignore
+
         logger.info(
             "Capella is%s run headless.", "" if isHeadless() else " not"
         )
@@ -1123,6 +3806,9 @@ def log_to_file(log_file_path_: Path, mode: str = "w"):
     This function also filters some identified log messages which come with EASE itself
     to concentrate on own log messages only.
 
+    With queue logging (see :func:`enable_queue_logging`) the file is
+    written by the background listener as well.
+
     Parameters
     ----------
     log_file_path
@@ -1132,17 +3818,16 @@ def log_to_file(log_file_path_: Path, mode: str = "w"):
         Write mode
 
     """
+    init_logging()
     file_hdl: logging.Handler = logging.FileHandler(
         filename=str(log_file_path_), mode=mode
     )
-    file_hdl.setLevel("DEBUG" if DEBUG else "INFO")
-    file_hdl.setFormatter(formatter)
-    file_hdl.addFilter(_MyLoggingFilter())
-    logger.addHandler(file_hdl)
+    _add_log_sink(file_hdl)
     if mode == "w":
         logger.info("Log to '%s'...", log_file_path_)
 
 
+@_instrumented
 def open_eclipse_perspective(name: str):
     """Open a named perspective in Eclipse.
 
@@ -1152,35 +3837,22 @@ def open_eclipse_perspective(name: str):
         Name of the perspective
 
     """
-    if BOT is None:
-        raise exp.EaseNoSWTWorkbenchBotError
-    BOT.menu("Window").menu("Perspective").menu("Open Perspective").menu(
-        "Other..."
-    ).click()
-    logger.debug("Try to find Eclipse perspective '%s'...", name)
-    if not BOT.table().containsItem(name):
-        logger.debug(
-            "Cannot find Eclipse perspective '%s' "
-            "will search for '%s (default)'...",
-            name,
-            name,
-        )
-        name = f"{name} (default)"
-    if not BOT.table().containsItem(name):
-        raise RuntimeError(
-            f"Cannot find any Eclipse perspective '{name}' or "
-            f"'{name} (default)'!"
-        )
-    try:
-        BOT.table().getTableItem(name).select()
-    except Exception as e:
-        raise RuntimeError(
-            f"Failed when selecting Eclipse perspective '{name}' to be opened!"
-        ) from e
+    if workbench_state().perspective() == name:
+        logger.debug("Eclipse perspective '%s' is already open.", name)
+        return
     logger.info("Open Eclipse perspective '%s'...", name)
-    click_button_with_label("Open")
+    run_flow(
+        [
+            ClickMenu(
+                ("Window", "Perspective", "Open Perspective", "Other...")
+            ),
+            SelectTableItem((name, f"{name} (default)")),
+            ClickButton("Open"),
+        ]
+    )
 
 
+@_instrumented
 def open_eclipse_view(category: str, title: str):
     """Show (open) the Eclipse view specified by its *category* and *title*.
 
@@ -1192,18 +3864,21 @@ def open_eclipse_view(category: str, title: str):
         Title of the view to be opened
 
     """
-    if BOT is None:
+    bot: t.Any = get_bot()
+    if bot is None:
         raise exp.EaseNoSWTWorkbenchBotError
     if is_eclipse_view_shown(title):
         return
     logger.debug("Show Eclipse view '%s/%s'...", category, title)
-    BOT.menu("Window").menu("Show View").menu("Other...").click()
-    category_node: t.Any = BOT.tree().getTreeItem(category)
-    category_node.expand()
-    view_node: t.Any = category_node.getNode(title)
-    view_node.doubleClick()
+    run_flow(
+        [
+            ClickMenu(("Window", "Show View", "Other...")),
+            OpenTreeNode((category, title)),
+        ]
+    )
 
 
+@_instrumented
 def project_explorer_tree() -> t.Any:
     """Return the handle for the tree in the project explorer view.
 
@@ -1213,12 +3888,404 @@ def project_explorer_tree() -> t.Any:
         Handle for the tree in the project explorer view
 
     """
-    project_explorer_view: t.Any = BOT.viewByTitle("Project Explorer")
+    bot: t.Any = get_bot()
+    project_explorer_view: t.Any = bot.viewByTitle("Project Explorer")
     project_explorer_bot: t.Any = project_explorer_view.bot()
     project_explorer_tree_: t.Any = project_explorer_bot.tree()
     return project_explorer_tree_
 
 
+@_instrumented
+def reset_workspace():
+    """Close all editors and remove all projects from the workspace.
+
+    Changes of dirty editors are discarded without a prompt. The
+    content of projects located in the workspace directory is deleted.
+    Projects imported from other folders (see
+    :func:`import_project_from_folder`) are only removed from the
+    workspace, their folders are kept.
+
+    Raises
+    ------
+    easeexceptions.EaseNoSWTWorkbenchBotError
+        When there is no SWTWorkbenchBot available
+
+    """
+    bot: t.Any = get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    try:
+        org.eclipse.swtbot.swt.finder.finders.UIThreadRunnable.syncExec(  # type: ignore
+            _AllEditorsCloser(org.eclipse.ui.PlatformUI.getWorkbench())  # type: ignore
+        )
+    except NameError:
+        bot.closeAllEditors()
+    # 3rd party:
+    from eclipse.system.resources import getWorkspace  # type: ignore
+
+    workspace_dir: Path = workspace_path()
+    project: t.Any
+    for project in getWorkspace().getRoot().getProjects():
+        in_workspace_dir: bool = Path(
+            project.getLocation().toString()
+        ).is_relative_to(workspace_dir)
+        logger.debug(
+            "Remove project '%s' from the workspace%s...",
+            project.getName(),
+            " and delete it" if in_workspace_dir else "",
+        )
+        project.delete(in_workspace_dir, True, None)
+
+
+def run_flow(steps: cabc.Iterable[FlowStep]):
+    """Run the steps of a flow, see :class:`FlowRunner`.
+
+    Parameters
+    ----------
+    steps
+        The steps of the flow, e.g.
+        ``[ClickMenu(("Window", "Show View", "Other...")),
+        OpenTreeNode(("General", "Console"))]``
+
+    Raises
+    ------
+    easeexceptions.EaseNoSWTWorkbenchBotError
+        When there is no SWTWorkbenchBot available
+
+    """
+    FlowRunner().run(steps)
+
+
+def set_wait_mode(mode: str):
+    """Set how :func:`wait_until` waits for conditions.
+
+    The modes are
+
+    ``"adaptive"``
+        Probe the conditions from Python with an adaptive backoff (the
+        default, see :class:`BackoffPolicy`)
+    ``"fixed"``
+        Probe the conditions from Python every *interval* ms, i.e. with
+        the timing of ``SWTBot.waitUntil``, see
+        :data:`FIXED_WAIT_POLICY`
+    ``"swtbot"``
+        Delegate to ``SWTBot.waitUntil``, which calls back from Java
+        into Python for every probe
+
+    The mode is also set by :func:`init` from an environment variable
+    ``EASE_WAIT_MODE``.
+
+    Parameters
+    ----------
+    mode
+        One of ``"adaptive"``, ``"fixed"`` and ``"swtbot"``
+
+    Raises
+    ------
+    ValueError
+        When the *mode* is unknown
+
+    """
+    global WAIT_POLICY
+    policies: dict[str, BackoffPolicy | None] = {
+        "adaptive": BackoffPolicy(),
+        "fixed": FIXED_WAIT_POLICY,
+        "swtbot": None,
+    }
+    if mode not in policies:
+        raise ValueError(
+            f"Unknown wait mode '{mode}', use one of {list(policies)}!"
+        )
+    WAIT_POLICY = policies[mode]
+    logger.debug("Wait for conditions in mode '%s'.", mode)
+
+
+def start_capella_process(
+    args: cabc.Sequence[str | os.PathLike], **kwargs: t.Any
+) -> subprocess.Popen:
+    """Start Capella in a process group of its own and track it.
+
+    :func:`kill_capella_process` stops the tracked processes.
+
+    Parameters
+    ----------
+    args
+        Command line, e.g. the path to the Capella executable followed
+        by its arguments
+    kwargs
+        Further keyword arguments for :class:`subprocess.Popen`
+
+    Returns
+    -------
+    subprocess.Popen
+        The started process
+
+    """
+    popen: subprocess.Popen = subprocess.Popen(
+        args, start_new_session=hasattr(os, "killpg"), **kwargs
+    )
+    _CAPELLA_PROCESSES[popen.pid] = popen
+    logger.info("Started Capella process with PID %d.", popen.pid)
+    return popen
+
+
+@_instrumented
+def tree_item_labels(tree: t.Any) -> list[str]:
+    """Return the labels of the (top level) items of a tree.
+
+    In an EASE context the labels are collected by one
+    ``UIThreadRunnable.syncExec`` call in the UI thread: The items are
+    fetched as one array and rendered to one string by
+    ``java.util.Arrays.toString``. This costs about six bridge calls
+    regardless of the number of items, instead of one ``getText`` call
+    per item. Otherwise the labels are fetched item by item.
+
+    Parameters
+    ----------
+    tree
+        ``SWTBotTree`` instance
+
+    Returns
+    -------
+    list[str]
+        Labels of the tree items
+
+    """
+    global _BULK_TREE_ITEM_LABELS
+    if _BULK_TREE_ITEM_LABELS:
+        try:
+            sync_exec: t.Any = (
+                org.eclipse.swtbot.swt.finder.finders.UIThreadRunnable.syncExec  # type: ignore
+            )
+            to_string: t.Any = java.util.Arrays.toString  # type: ignore
+        except NameError:
+            _BULK_TREE_ITEM_LABELS = False
+        else:
+            try:
+                labels: _TreeItemLabels = _TreeItemLabels(
+                    _get_java_field(tree, "widget"), to_string
+                )
+                sync_exec(labels)
+                return labels.labels
+            except Exception:
+                logger.debug(
+                    "Cannot fetch the labels of the tree items at once."
+                )
+    return [tree_item.getText() for tree_item in tree.getAllItems()]
+
+
+@contextlib.contextmanager
+def _search_timeout(timeout: int) -> cabc.Iterator[None]:
+    """Set the SWTBot search timeout to *timeout* ms in the context.
+
+    The timeout is the static field ``SWTBotPreferences.TIMEOUT``, which
+    is set by reflection. Outside of an EASE context nothing is set.
+
+    """
+    try:
+        field: t.Any = org.eclipse.swtbot.swt.finder.utils.SWTBotPreferences._java_lang_class.getField(  # type: ignore
+            "TIMEOUT"
+        )
+        previous: int = field.getLong(None)
+        field.setLong(None, timeout)
+    except NameError:
+        yield
+        return
+    except Exception:
+        logger.debug("Cannot set the SWTBot search timeout.")
+        yield
+        return
+    try:
+        yield
+    finally:
+        field.setLong(None, previous)
+
+
+@_instrumented
+def wait_for_any(
+    conditions: cabc.Sequence[t.Any],
+    timeout: int = 5000,
+    interval: int = 500,
+    policy: BackoffPolicy | None = None,
+    bot: t.Any = None,
+) -> t.Any:
+    """Wait until the first of several conditions is met.
+
+    All *conditions* are tested in every probe of one wait, see
+    :class:`AnyConditionIsMet` and :func:`wait_until`. Meanwhile the
+    SWTBot search timeout is zero, so that the probes do not block on
+    missing widgets.
+
+    Parameters
+    ----------
+    conditions
+        Conditions implementing the ``ICondition`` interface like
+        :class:`ButtonWithLabelIsEnabled`
+    timeout : optional
+        Timeout in ms until we wait for any condition to be met
+    interval : optional
+        Upper bound in ms for the delay between two probes
+    policy : optional
+        Polling schedule (the default is :data:`WAIT_POLICY`)
+    bot : optional
+        ``SWTBot`` instance with which the conditions are initialised
+        (the default is the ``SWTWorkbenchBot`` of this module)
+
+    Returns
+    -------
+    t.Any
+        The first condition met
+
+    Raises
+    ------
+    easeexceptions.EaseWaitTimeoutError
+        When none of the *conditions* is met within the *timeout*
+
+    """
+    condition: AnyConditionIsMet = AnyConditionIsMet(*conditions)
+    with _search_timeout(0):
+        wait_until(condition, timeout, interval, policy, bot)
+    logger.debug("Condition '%s' was met first.", type(condition.met).__name__)
+    return condition.met
+
+
+def _is_swtbot_timeout(e: Exception) -> bool:
+    """Tell if *e* is a ``TimeoutException`` of ``SWTBot.waitUntil``.
+
+    Over py4j the Java exception is wrapped in a ``Py4JJavaError``.
+
+    """
+    java_exception: t.Any = getattr(e, "java_exception", None)
+    if java_exception is None:
+        return type(e).__name__ == "TimeoutException"
+    try:
+        return (
+            java_exception.getClass().getName()
+            == "org.eclipse.swtbot.swt.finder.widgets.TimeoutException"
+        )
+    except Exception:
+        return False
+
+
+@_instrumented
+def wait_until(
+    condition: t.Any,
+    timeout: int = 5000,
+    interval: int = 500,
+    policy: BackoffPolicy | None = None,
+    bot: t.Any = None,
+) -> float:
+    """Wait until a condition is met.
+
+    The condition is probed by the polling engine of this module using
+    the *policy* (an adaptive backoff). The observed wait time is logged
+    and recorded in :data:`WAIT_TIMES` under the class name of the
+    *condition*, which keeps the last 1000 wait times per class. When
+    :data:`WAIT_POLICY` is None and no *policy* is given, the waiting is
+    delegated to ``SWTBot.waitUntil``, which calls back into Python for
+    every probe (see :func:`set_wait_mode`). Its timeout is raised as
+    :class:`easeexceptions.EaseWaitTimeoutError` as well.
+
+    Parameters
+    ----------
+    condition
+        Condition implementing the ``ICondition`` interface like
+        :class:`ButtonWithLabelIsAvailable`
+    timeout : optional
+        Timeout in ms until we wait for the *condition* to be met
+    interval : optional
+        Upper bound in ms for the delay between two probes of the
+        *condition*
+    policy : optional
+        Polling schedule (the default is :data:`WAIT_POLICY`)
+    bot : optional
+        ``SWTBot`` instance with which the condition is initialised (the
+        default is the ``SWTWorkbenchBot`` of this module)
+
+    Returns
+    -------
+    float
+        The time in ms it took until the *condition* was met
+
+    Raises
+    ------
+    easeexceptions.EaseNoSWTWorkbenchBotError
+        When there is no SWTWorkbenchBot available
+    easeexceptions.EaseWaitTimeoutError
+        When the *condition* is not met within the *timeout*
+
+    """
+    bot = bot or get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    policy = policy or WAIT_POLICY
+    name: str = type(condition).__name__
+    start: float = time.perf_counter()
+    if policy is None:
+        try:
+            bot.waitUntil(condition, timeout, interval)
+        except Exception as e:
+            if not _is_swtbot_timeout(e):
+                raise
+            raise exp.EaseWaitTimeoutError(
+                condition.getFailureMessage(), timeout
+            ) from e
+    else:
+        condition.init(bot)
+        deadline: float = start + timeout / 1000
+        delay: float = min(policy.first_interval, interval) / 1000
+        max_delay: float = min(policy.max_interval, interval) / 1000
+        while True:
+            try:
+                if condition.test():
+                    break
+            except Exception:
+                pass
+            remaining: float = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise exp.EaseWaitTimeoutError(
+                    condition.getFailureMessage(), timeout
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * policy.factor, max_delay)
+    waited: float = (time.perf_counter() - start) * 1000
+    if name not in WAIT_TIMES:
+        WAIT_TIMES[name] = collections.deque(maxlen=_WAIT_TIMES_MAXLEN)
+    WAIT_TIMES[name].append(waited)
+    logger.debug("Condition '%s' was met after %.0f ms.", name, waited)
+    return waited
+
+
+def _workbench() -> t.Any:
+    """Return the ``IWorkbench``, or None outside of an EASE context."""
+    try:
+        return org.eclipse.ui.PlatformUI.getWorkbench()  # type: ignore
+    except NameError:
+        return None
+    except Exception:
+        logger.debug("Cannot get the workbench.")
+        return None
+
+
+def workbench_state() -> WorkbenchState:
+    """Return the cached state of the workbench.
+
+    The state is created on first use and registers its listeners on
+    the workbench windows, see :class:`WorkbenchState`. The state of a
+    previous bot unregisters its listeners.
+
+    """
+    global _WORKBENCH_STATE
+    bot: t.Any = get_bot()
+    if bot is None:
+        raise exp.EaseNoSWTWorkbenchBotError
+    if _WORKBENCH_STATE is None or _WORKBENCH_STATE.bot is not bot:
+        if _WORKBENCH_STATE is not None:
+            _WORKBENCH_STATE.close()
+        _WORKBENCH_STATE = WorkbenchState(bot, _workbench())
+    return _WORKBENCH_STATE
+
+
 def workspace_path() -> Path:
     """Return the path to the current Eclipse workspace.
 
@@ -1228,9 +4295,61 @@ def workspace_path() -> Path:
         Absolute (resolved) path to the current Eclipse workspace
 
     """
+    # 3rd party:
+    from eclipse.system.resources import getWorkspace  # type: ignore
+
     return Path(getWorkspace().getLocation().toString())
 
 
+def write_compare_result(
+    label: str, jsonl_path: Path, page_size: int = 500, timeout: int = 60000
+) -> int:
+    """Write the synthesis tree of a compare result as JSON Lines.
+
+    Every item is written as one line ``{"path": [...], "kind": ...,
+    "label": ...}`` as soon as it is fetched, see
+    :func:`compare_result_records`. The memory needed does not depend
+    on the size of the compare result.
+
+    Parameters
+    ----------
+    label
+        Title of the compare result editor
+    jsonl_path
+        Path to the JSON Lines file to write
+    page_size : optional
+        Maximal number of items collected per call
+    timeout : optional
+        Timeout in ms until we wait for the compare result
+
+    Returns
+    -------
+    int
+        The number of written items
+
+    """
+    count: int = 0
+    with open(jsonl_path, "w", encoding="utf8") as jsonl_file:
+        for record in compare_result_records(label, page_size, timeout):
+            jsonl_file.write(json.dumps(record._asdict()) + "\n")
+            count += 1
+    logger.info(
+        "Wrote %d items of compare result '%s' to '%s'.",
+        count,
+        label,
+        jsonl_path,
+    )
+    return count
+
+
+def __getattr__(name: str) -> t.Any:
+    """Initialise the module on first access of ``BOT``/ ``IS_EASE_CTXT``."""
+    if name in ("BOT", "IS_EASE_CTXT"):
+        init()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     log_file_dir: str = os.getenv("EASE_LOG_FILE_DIR", str(Path()))
     log_file_path: Path = Path(log_file_dir) / "ease.log"
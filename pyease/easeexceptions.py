@@ -47,6 +47,18 @@ class EaseButtonNotFoundError(EaseError):
         return msg
 
 
+class EaseJobTimeoutError(EaseError):
+    """Raised when a job of the job loop is not done within a timeout."""
+
+    def __init__(self, job_id: str, timeout: float | None):
+        super().__init__()
+        self.job_id: str = job_id
+        self.timeout: float | None = timeout
+
+    def __str__(self):
+        return f"Job '{self.job_id}' is not done after {self.timeout} s!"
+
+
 class EaseNoSWTWorkbenchBotError(EaseError):
     """Raised when there is no SWTWorkbenchBot."""
 
@@ -54,4 +66,27 @@ class EaseNoSWTWorkbenchBotError(EaseError):
         return "There is not SWTWorkbenchBot available!"
 
 
+class EaseNoWorkspaceAvailableError(EaseError):
+    """Raised when a workspace pool has no ready workspace in time."""
+
+    def __init__(self, root_dir: t.Any):
+        super().__init__()
+        self.root_dir: t.Any = root_dir
+
+    def __str__(self):
+        return f"No workspace of the pool in '{self.root_dir}' is available!"
+
+
+class EaseWaitTimeoutError(EaseError):
+    """Raised when a condition is not met within a timeout."""
+
+    def __init__(self, failure_message: str, timeout: int):
+        super().__init__()
+        self.failure_message: str = failure_message
+        self.timeout: int = timeout
+
+    def __str__(self):
+        return f"Timeout after {self.timeout} ms: {self.failure_message}"
+
+
 # pylint: enable=super-init-not-called
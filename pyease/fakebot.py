@@ -0,0 +1,1154 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Module with an in-process stand-in for the ``SWTWorkbenchBot``.
+
+The fake bot models the widgets of a Capella workbench that the helper
+functions of :mod:`pyease.ease` work with: shells with buttons, text
+fields, combo boxes, trees and tables, the menu bar, views and editors.
+Every call on the bot or on one of its widgets counts as one call over
+the py4j bridge and takes a configurable latency. Widgets can appear
+and become enabled with a delay.
+
+With that the speed of the helper functions can be measured and
+regression-tested without a running Capella:
+
+.. code-block:: python
+
+    from pyease import ease, fakebot
+
+    ease.BOT = fakebot.capella_workbench(latency=0.001)
+    ease.open_eclipse_view("General", "Outline")
+    print(ease.BOT.calls)
+
+The Java classes used in an EASE context besides the bot, like
+``UIThreadRunnable``, are faked by :func:`java_packages`.
+
+"""
+from __future__ import annotations
+
+# Standard library:
+import collections
+import collections.abc as cabc
+import time
+import types
+import typing as t
+
+_W = t.TypeVar("_W")
+
+
+class WidgetNotFoundError(Exception):
+    """Raised when a widget cannot be found (``WidgetNotFoundException``)."""
+
+
+class TimeoutException(Exception):
+    """Raised when ``waitUntil`` times out, named like the SWTBot one."""
+
+
+class _FakeField:
+    """Fake ``java.lang.reflect.Field`` ``widget`` of a fake widget."""
+
+    def __init__(self, bot: FakeBot):
+        self._bot: FakeBot = bot
+
+    def get(self, obj: FakeWidget) -> FakeWidget:
+        self._bot.bridge_call("get")
+        return obj
+
+
+class _FakeClass:
+    """Fake ``java.lang.Class`` of a fake widget.
+
+    Its only field is ``widget``, the SWT widget of an SWTBot widget,
+    which is the fake widget itself.
+
+    """
+
+    def __init__(self, bot: FakeBot):
+        self._bot: FakeBot = bot
+
+    def getField(self, name: str) -> _FakeField:
+        self._bot.bridge_call("getField")
+        if name != "widget":
+            raise AttributeError(f"No field '{name}'!")
+        return _FakeField(self._bot)
+
+
+class FakeWidget:
+    """Base class of all fake widgets.
+
+    Attributes
+    ----------
+    text
+        Label or text of the widget
+    visible_at
+        Point in time (``time.perf_counter``) from which on the widget
+        can be found
+    enabled_at
+        Point in time from which on the widget is enabled
+
+    The SWT widget of a fake widget is the fake widget itself. Like the
+    field ``widget`` of a py4j proxy, it is not an attribute but can be
+    read by reflection (``getClass().getField("widget").get(...)``).
+
+    """
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str = "",
+        delay: float = 0.0,
+        enabled_delay: float = 0.0,
+    ):
+        now: float = time.perf_counter()
+        self._bot: FakeBot = bot
+        self.text: str = text
+        self.visible_at: float = now + delay
+        self.enabled_at: float = now + max(delay, enabled_delay)
+        self.disposed: bool = False
+
+    @property
+    def visible(self) -> bool:
+        """Tell if the widget can be found (without a bridge call)."""
+        return not self.disposed and time.perf_counter() >= self.visible_at
+
+    def getClass(self) -> _FakeClass:
+        self._bot.bridge_call("getClass")
+        return _FakeClass(self._bot)
+
+    def getText(self) -> str:
+        self._bot.bridge_call("getText")
+        return self.text
+
+    def isEnabled(self) -> bool:
+        self._bot.bridge_call("isEnabled")
+        return time.perf_counter() >= self.enabled_at
+
+    def isActive(self) -> bool:
+        self._bot.bridge_call("isActive")
+        return self.visible
+
+
+def _visible(widgets: cabc.Iterable[_W], text: str) -> _W | None:
+    for widget in widgets:
+        if widget.visible and widget.text == text:  # type: ignore
+            return widget
+    return None
+
+
+class FakeButton(FakeWidget):
+    """Fake ``SWTBotButton`` running an action when clicked.
+
+    The button is only enabled while *enabled_if* returns True, if
+    given.
+
+    """
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str,
+        on_click: cabc.Callable[[], None] | None = None,
+        enabled_if: cabc.Callable[[], bool] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, text, **kwargs)
+        self.on_click: cabc.Callable[[], None] | None = on_click
+        self.enabled_if: cabc.Callable[[], bool] | None = enabled_if
+        self.clicks: int = 0
+
+    def _enabled(self) -> bool:
+        return time.perf_counter() >= self.enabled_at and (
+            self.enabled_if is None or self.enabled_if()
+        )
+
+    def isEnabled(self) -> bool:
+        self._bot.bridge_call("isEnabled")
+        return self._enabled()
+
+    def click(self) -> FakeButton:
+        self._bot.bridge_call("click")
+        if not self._enabled():
+            raise RuntimeError(f"Button '{self.text}' is not enabled!")
+        self.clicks += 1
+        if self.on_click is not None:
+            self.on_click()
+        return self
+
+
+class FakeText(FakeWidget):
+    """Fake ``SWTBotText`` only accepting a text while enabled."""
+
+    def setText(self, text: str) -> None:
+        self._bot.bridge_call("setText")
+        if time.perf_counter() < self.enabled_at:
+            raise RuntimeError(f"Text field '{self.text}' is not enabled!")
+        self.text = text
+
+
+class FakeCombo(FakeText):
+    """Fake ``SWTBotCombo``."""
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str,
+        items: cabc.Iterable[str] = (),
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, text, **kwargs)
+        self.items: list[str] = list(items)
+        self.selection: str | None = None
+
+    def setSelection(self, item: str) -> None:
+        self._bot.bridge_call("setSelection")
+        if item not in self.items:
+            raise RuntimeError(f"Item '{item}' cannot be found!")
+        self.selection = item
+
+
+class FakeMenu(FakeWidget):
+    """Fake ``SWTBotMenu`` with sub menus."""
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str,
+        on_click: cabc.Callable[[], None] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, text, **kwargs)
+        self.on_click: cabc.Callable[[], None] | None = on_click
+        self.items: list[FakeMenu] = []
+
+    def add(
+        self, text: str, on_click: cabc.Callable[[], None] | None = None
+    ) -> FakeMenu:
+        """Add a sub menu (without a bridge call)."""
+        item: FakeMenu = FakeMenu(self._bot, text, on_click)
+        self.items.append(item)
+        return item
+
+    def dispose(self) -> None:
+        """Dispose the menu and its sub menus (without a bridge call)."""
+        self.disposed = True
+        for item in self.items:
+            item.dispose()
+
+    def _assert_not_disposed(self) -> None:
+        if self.disposed:
+            raise WidgetNotFoundError(f"Menu '{self.text}' is disposed")
+
+    def find(self, text: str) -> FakeMenu | None:
+        """Find a visible (sub) menu recursively (without a bridge call)."""
+        for item in self.items:
+            if item.visible and item.text == text:
+                return item
+        for item in self.items:
+            found: FakeMenu | None = item.find(text)
+            if found is not None:
+                return found
+        return None
+
+    def menu(self, text: str) -> FakeMenu:
+        self._bot.bridge_call("menu")
+        self._assert_not_disposed()
+        return self._bot.search(lambda: self.find(text), f"menu '{text}'")
+
+    def click(self) -> FakeMenu:
+        self._bot.bridge_call("click")
+        self._assert_not_disposed()
+        if self.on_click is not None:
+            self.on_click()
+        return self
+
+
+class FakeTreeItem(FakeWidget):
+    """Fake ``SWTBotTreeItem``."""
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str,
+        children: cabc.Iterable[FakeTreeItem] = (),
+        on_double_click: cabc.Callable[[], None] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, text, **kwargs)
+        self.children: list[FakeTreeItem] = list(children)
+        self.on_double_click: cabc.Callable[[], None] | None = on_double_click
+        self.expanded: bool = False
+        self.selected: bool = False
+
+    def __str__(self) -> str:
+        """Render the item like the SWT ``Widget.toString``."""
+        return f"TreeItem {{{self.text}}}"
+
+    def expand(self) -> FakeTreeItem:
+        self._bot.bridge_call("expand")
+        self.expanded = True
+        return self
+
+    def select(self) -> FakeTreeItem:
+        self._bot.bridge_call("select")
+        self.selected = True
+        return self
+
+    def getItemCount(self) -> int:
+        self._bot.bridge_call("getItemCount")
+        return len([child for child in self.children if child.visible])
+
+    def getExpanded(self) -> bool:
+        self._bot.bridge_call("getExpanded")
+        return self.expanded
+
+    def setExpanded(self, expanded: bool) -> None:
+        self._bot.bridge_call("setExpanded")
+        self.expanded = expanded
+
+    def getNode(self, text: str) -> FakeTreeItem:
+        self._bot.bridge_call("getNode")
+        return self._bot.search(
+            lambda: _visible(self.children, text), f"node '{text}'"
+        )
+
+    def getItems(self) -> list[FakeTreeItem]:
+        self._bot.bridge_call("getItems")
+        return [child for child in self.children if child.visible]
+
+    def doubleClick(self) -> FakeTreeItem:
+        self._bot.bridge_call("doubleClick")
+        if self.on_double_click is not None:
+            self.on_double_click()
+        return self
+
+
+class FakeTree(FakeWidget):
+    """Fake ``SWTBotTree``."""
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        items: cabc.Iterable[FakeTreeItem] = (),
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, **kwargs)
+        self.items: list[FakeTreeItem] = list(items)
+        self.context_menu: FakeMenu = FakeMenu(bot, "")
+        self.selection: list[str] = []
+        self.events: list[tuple[int, t.Any]] = []
+
+    def contextMenu(self, text: str) -> FakeMenu:
+        self._bot.bridge_call("contextMenu")
+
+        def find() -> FakeMenu | None:
+            # A dialog blocks the context menus of the trees beneath it:
+            if (
+                len(self._bot.shells) > 1
+                and self is not self._bot.active_shell.tree
+            ):
+                return None
+            return self.context_menu.find(text)
+
+        return self._bot.search(find, f"context menu '{text}'")
+
+    def select(self, *texts: str) -> FakeTree:
+        self._bot.bridge_call("select")
+        for text in texts:
+            if _visible(self.items, text) is None:
+                raise WidgetNotFoundError(f"Could not find tree item '{text}'")
+        self.selection = list(texts)
+        return self
+
+    def getAllItems(self) -> list[FakeTreeItem]:
+        self._bot.bridge_call("getAllItems")
+        return [item for item in self.items if item.visible]
+
+    def getItems(self) -> list[FakeTreeItem]:
+        """Return the top level items like the SWT ``Tree.getItems``."""
+        self._bot.bridge_call("getItems")
+        return [item for item in self.items if item.visible]
+
+    def notifyListeners(self, event_type: int, event: FakeEvent) -> None:
+        """Record the type and the item of an event in :attr:`events`."""
+        self._bot.bridge_call("notifyListeners")
+        self.events.append((event_type, event.item))
+
+    def getTreeItem(self, text: str) -> FakeTreeItem:
+        self._bot.bridge_call("getTreeItem")
+        return self._bot.search(
+            lambda: _visible(self.items, text), f"tree item '{text}'"
+        )
+
+
+class FakeEvent:
+    """Fake SWT ``Event``."""
+
+    def __init__(self, bot: FakeBot):
+        bot.bridge_call("Event")
+        self.item: t.Any = None
+
+
+SWT_EXPAND: int = 17
+"""Value of the SWT constant ``SWT.Expand``."""
+
+
+class FakeTableItem(FakeWidget):
+    """Fake ``SWTBotTableItem``."""
+
+    def select(self) -> FakeTableItem:
+        self._bot.bridge_call("select")
+        self._bot.selected_table_item = self.text
+        return self
+
+
+class FakeTable(FakeWidget):
+    """Fake ``SWTBotTable``."""
+
+    def __init__(
+        self, bot: FakeBot, items: cabc.Iterable[str] = (), **kwargs: t.Any
+    ):
+        super().__init__(bot, **kwargs)
+        self.items: list[str] = list(items)
+
+    def containsItem(self, text: str) -> bool:
+        self._bot.bridge_call("containsItem")
+        return text in self.items
+
+    def getTableItem(self, text: str) -> FakeTableItem:
+        self._bot.bridge_call("getTableItem")
+        if text not in self.items:
+            raise WidgetNotFoundError(f"Could not find table item '{text}'")
+        return FakeTableItem(self._bot, text)
+
+
+class _FakeViewBot:
+    """Fake ``SWTBot`` scoped to a view or an editor."""
+
+    def __init__(self, bot: FakeBot, tree: FakeTree | None):
+        self._bot: FakeBot = bot
+        self._tree: FakeTree | None = tree
+
+    def tree(self, index: int = 0) -> FakeTree:
+        self._bot.bridge_call("tree")
+        tree: FakeTree | None = self._tree
+        return self._bot.search(
+            lambda: tree if tree is not None and tree.visible else None,
+            "tree",
+        )
+
+
+class FakeView(FakeWidget):
+    """Fake ``SWTBotView`` (also used for editors)."""
+
+    def __init__(
+        self,
+        bot: FakeBot,
+        text: str,
+        tree: FakeTree | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(bot, text, **kwargs)
+        self.tree: FakeTree | None = tree
+
+    def getTitle(self) -> str:
+        self._bot.bridge_call("getTitle")
+        return self.text
+
+    def getReference(self) -> FakeView:
+        self._bot.bridge_call("getReference")
+        return self
+
+    def bot(self) -> _FakeViewBot:
+        self._bot.bridge_call("bot")
+        return _FakeViewBot(self._bot, self.tree)
+
+    def close(self) -> None:
+        self._bot.bridge_call("close")
+        self.disposed = True
+        self._bot.window.fire("partClosed", self)
+
+
+class FakePerspective(FakeWidget):
+    """Fake ``SWTBotPerspective``."""
+
+    def getLabel(self) -> str:
+        self._bot.bridge_call("getLabel")
+        return self.text
+
+
+class FakeWorkbenchWindow:
+    """Fake ``IWorkbenchWindow`` notifying part and perspective listeners.
+
+    The window is its own part service (``getPartService``).
+
+    """
+
+    def __init__(self, bot: FakeBot):
+        self._bot: FakeBot = bot
+        self.listeners: list[t.Any] = []
+
+    def getPartService(self) -> FakeWorkbenchWindow:
+        self._bot.bridge_call("getPartService")
+        return self
+
+    def addPartListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("addPartListener")
+        self.listeners.append(listener)
+
+    def addPerspectiveListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("addPerspectiveListener")
+        self.listeners.append(listener)
+
+    def removePartListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("removePartListener")
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def removePerspectiveListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("removePerspectiveListener")
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def fire(self, event: str, *args: t.Any) -> None:
+        """Notify the listeners of an *event* (without a bridge call)."""
+        for listener in self.listeners:
+            if hasattr(listener, event):
+                getattr(listener, event)(*args)
+
+
+class FakeWorkbench:
+    """Fake ``IWorkbench`` notifying window listeners."""
+
+    def __init__(self, window: FakeWorkbenchWindow):
+        self._bot: FakeBot = window._bot
+        self.windows: list[FakeWorkbenchWindow] = [window]
+        self.listeners: list[t.Any] = []
+
+    def addWindowListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("addWindowListener")
+        self.listeners.append(listener)
+
+    def getWorkbenchWindows(self) -> list[FakeWorkbenchWindow]:
+        self._bot.bridge_call("getWorkbenchWindows")
+        return list(self.windows)
+
+    def removeWindowListener(self, listener: t.Any) -> None:
+        self._bot.bridge_call("removeWindowListener")
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def open_window(self) -> FakeWorkbenchWindow:
+        """Open another window (without a bridge call)."""
+        window: FakeWorkbenchWindow = FakeWorkbenchWindow(self._bot)
+        self.windows.append(window)
+        for listener in list(self.listeners):
+            listener.windowOpened(window)
+        return window
+
+
+class FakeShellWidget(FakeWidget):
+    """Fake ``SWTBotShell`` of a :class:`FakeShell`."""
+
+    def __init__(self, bot: FakeBot, shell: FakeShell):
+        super().__init__(bot, shell.title)
+        self.shell: FakeShell = shell
+
+    def close(self) -> None:
+        self._bot.bridge_call("close")
+        self._bot.close_shell(self.shell)
+
+
+class FakeShell:
+    """Shell (window or dialog) holding widgets (not a widget itself).
+
+    Attributes
+    ----------
+    title
+        Title of the shell
+    buttons, text_fields, combo_boxes
+        Widgets of the shell by their labels
+    tree, table
+        The tree and the table of the shell, if any
+
+    """
+
+    def __init__(self, title: str):
+        self.title: str = title
+        self.buttons: dict[str, FakeButton] = {}
+        self.text_fields: dict[str, FakeText] = {}
+        self.combo_boxes: dict[str, FakeCombo] = {}
+        self.tree: FakeTree | None = None
+        self.table: FakeTable | None = None
+
+
+class FakeBot:
+    """In-process stand-in for the ``SWTWorkbenchBot``.
+
+    Widgets are looked up in the open shells from the active (last
+    opened) one to the workbench window. Lookups raise
+    :class:`WidgetNotFoundError` immediately if a widget is not (yet)
+    visible.
+
+    Attributes
+    ----------
+    latency
+        Time in seconds every bridge call takes
+    search_timeout
+        Time in seconds a lookup waits for a widget to appear, like the
+        SWTBot preference ``org.eclipse.swtbot.search.timeout``
+    calls
+        Number of calls over the (fake) bridge
+    calls_per_method
+        Number of calls over the (fake) bridge per method name
+    shells
+        Open shells, the workbench window being the first one
+    menu_bar
+        Root of the menus of the workbench window
+    views
+        Views of the workbench window
+    editors
+        Open editors
+    perspective
+        Label of the active perspective
+    window
+        The workbench window notifying listeners of opened and closed
+        views and of activated perspectives
+    workbench
+        The workbench of the window
+
+    """
+
+    def __init__(self, latency: float = 0.0, search_timeout: float = 5.0):
+        self.latency: float = latency
+        self.search_timeout: float = search_timeout
+        self.calls: int = 0
+        self.calls_per_method: collections.Counter[str] = collections.Counter()
+        self.shells: list[FakeShell] = [FakeShell("Capella")]
+        self.menu_bar: FakeMenu = FakeMenu(self, "")
+        self.views_: list[FakeView] = []
+        self.editors: list[FakeView] = []
+        self.perspective: str = "Capella"
+        self.selected_table_item: str | None = None
+        self.window: FakeWorkbenchWindow = FakeWorkbenchWindow(self)
+        self.workbench: FakeWorkbench = FakeWorkbench(self.window)
+
+    def bridge_call(self, method: str):
+        """Count a call over the bridge and wait for the latency."""
+        self.calls += 1
+        self.calls_per_method[method] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset_calls(self):
+        """Reset the call counters."""
+        self.calls = 0
+        self.calls_per_method.clear()
+
+    @property
+    def active_shell(self) -> FakeShell:
+        """Return the active shell (without a bridge call)."""
+        return self.shells[-1]
+
+    def activate_perspective(self, label: str):
+        """Activate a perspective (without a bridge call)."""
+        self.perspective = label
+        self.window.fire("perspectiveActivated", None, label)
+
+    def open_view(
+        self, view: FakeView, window: FakeWorkbenchWindow | None = None
+    ):
+        """Open a view in the *window* (without a bridge call)."""
+        self.views_.append(view)
+        (window or self.window).fire("partOpened", view)
+
+    def open_shell(self, title: str) -> FakeShell:
+        """Open a new active shell (without a bridge call)."""
+        shell: FakeShell = FakeShell(title)
+        self.shells.append(shell)
+        return shell
+
+    def close_shell(self, shell: FakeShell | None = None):
+        """Close the *shell* or the active one (without a bridge call)."""
+        shell = shell or self.active_shell
+        if shell is self.shells[0]:
+            raise RuntimeError("Cannot close the workbench window!")
+        self.shells.remove(shell)
+        for widget in (
+            *shell.buttons.values(),
+            *shell.text_fields.values(),
+            *shell.combo_boxes.values(),
+            shell.tree,
+            shell.table,
+        ):
+            if widget is not None:
+                widget.disposed = True
+
+    def search(self, find: cabc.Callable[[], _W | None], what: str) -> _W:
+        """Search a widget like SWTBot within the search timeout.
+
+        The search runs on the Java side of the bridge and therefore
+        does not count as further bridge calls.
+
+        Parameters
+        ----------
+        find
+            Function returning the widget or None, if it is not visible
+        what
+            Description of the widget for the error message
+
+        Raises
+        ------
+        WidgetNotFoundError
+            When the widget is not found within the search timeout
+
+        """
+        deadline: float = time.perf_counter() + self.search_timeout
+        while (widget := find()) is None:
+            if time.perf_counter() >= deadline:
+                raise WidgetNotFoundError(f"Could not find {what}")
+            time.sleep(0.001)
+        return widget
+
+    def _find(self, kind: str, label: str) -> t.Any:
+        def find() -> FakeWidget | None:
+            for shell in reversed(self.shells):
+                widget: FakeWidget | None = getattr(shell, kind).get(label)
+                if widget is not None and widget.visible:
+                    return widget
+            return None
+
+        return self.search(find, f"widget '{label}'")
+
+    def _find_single(self, kind: str) -> t.Any:
+        def find() -> FakeWidget | None:
+            for shell in reversed(self.shells):
+                widget: FakeWidget | None = getattr(shell, kind)
+                if widget is not None and widget.visible:
+                    return widget
+            return None
+
+        return self.search(find, f"a widget of kind {kind}")
+
+    def button(self, label: str) -> FakeButton:
+        self.bridge_call("button")
+        return self._find("buttons", label)
+
+    def textWithLabel(self, label: str) -> FakeText:
+        self.bridge_call("textWithLabel")
+        return self._find("text_fields", label)
+
+    def comboBoxWithLabel(self, label: str) -> FakeCombo:
+        self.bridge_call("comboBoxWithLabel")
+        return self._find("combo_boxes", label)
+
+    def comboBox(self, index: int = 0) -> FakeCombo:
+        self.bridge_call("comboBox")
+
+        def find() -> FakeCombo | None:
+            for shell in reversed(self.shells):
+                combo_boxes: list[FakeCombo] = [
+                    combo_box
+                    for combo_box in shell.combo_boxes.values()
+                    if combo_box.visible
+                ]
+                if len(combo_boxes) > index:
+                    return combo_boxes[index]
+            return None
+
+        return self.search(find, f"combo box {index}")
+
+    def activeShell(self) -> FakeShellWidget:
+        """Return a fake ``SWTBotShell`` of the active shell."""
+        self.bridge_call("activeShell")
+        return FakeShellWidget(self, self.active_shell)
+
+    def menu(self, label: str) -> FakeMenu:
+        return self.menu_bar.menu(label)
+
+    def tree(self, index: int = 0) -> FakeTree:
+        self.bridge_call("tree")
+        return self._find_single("tree")
+
+    def table(self, index: int = 0) -> FakeTable:
+        self.bridge_call("table")
+        return self._find_single("table")
+
+    def views(self) -> list[FakeView]:
+        self.bridge_call("views")
+        return [view for view in self.views_ if view.visible]
+
+    def viewByTitle(self, title: str) -> FakeView:
+        self.bridge_call("viewByTitle")
+        return self.search(
+            lambda: _visible(self.views_, title), f"view '{title}'"
+        )
+
+    def editorByTitle(self, title: str) -> FakeView:
+        self.bridge_call("editorByTitle")
+        return self.search(
+            lambda: _visible(self.editors, title), f"editor '{title}'"
+        )
+
+    def activePerspective(self) -> FakePerspective:
+        self.bridge_call("activePerspective")
+        return FakePerspective(self, self.perspective)
+
+    def waitUntil(self, condition: t.Any, timeout: int, interval: int):
+        """Wait like ``SWTBot.waitUntil`` with a fixed interval."""
+        self.bridge_call("waitUntil")
+        condition.init(self)
+        deadline: float = time.perf_counter() + timeout / 1000
+        while True:
+            try:
+                if condition.test():
+                    return
+            except Exception:
+                pass
+            if time.perf_counter() >= deadline:
+                raise TimeoutException(condition.getFailureMessage())
+            time.sleep(interval / 1000)
+
+
+def java_packages(bot: FakeBot) -> dict[str, t.Any]:
+    """Return fakes of the Java packages ``org`` and ``java``.
+
+    In an EASE context these packages are global names of the script.
+    Here they offer the classes used by :mod:`pyease.ease` besides the
+    bot, bound to the *bot* to count their calls over the bridge:
+
+    * ``org.eclipse.swtbot.swt.finder.finders.UIThreadRunnable``, whose
+      ``syncExec`` runs a ``Result`` or ``VoidResult`` right away,
+    * ``org.eclipse.swt.SWT`` with the constant ``Expand``,
+    * ``org.eclipse.swt.widgets.Event`` (see :class:`FakeEvent`),
+    * ``org.eclipse.swtbot.swt.finder.utils.SWTBotPreferences``, whose
+      field ``TIMEOUT`` (by reflection) is the bot's search timeout and
+    * ``java.util.Arrays``, whose ``toString`` renders an array of fake
+      widgets like Java.
+
+    Parameters
+    ----------
+    bot
+        The fake bot
+
+    Returns
+    -------
+    dict[str, t.Any]
+        The fake packages by their names
+
+    """
+
+    def sync_exec(result: t.Any) -> t.Any:
+        bot.bridge_call("syncExec")
+        return result.run()
+
+    def to_string(array: cabc.Sequence[t.Any]) -> str:
+        bot.bridge_call("toString")
+        return f"[{', '.join(map(str, array))}]"
+
+    def get_timeout(obj: None) -> int:
+        bot.bridge_call("getLong")
+        return round(bot.search_timeout * 1000)
+
+    def set_timeout(obj: None, value: int):
+        bot.bridge_call("setLong")
+        bot.search_timeout = value / 1000
+
+    def get_field(name: str) -> t.Any:
+        bot.bridge_call("getField")
+        if name != "TIMEOUT":
+            raise AttributeError(f"No field '{name}'!")
+        return ns(getLong=get_timeout, setLong=set_timeout)
+
+    ns = types.SimpleNamespace
+    preferences = ns(_java_lang_class=ns(getField=get_field))
+    finder = ns(
+        finders=ns(UIThreadRunnable=ns(syncExec=sync_exec)),
+        utils=ns(SWTBotPreferences=preferences),
+    )
+    swt = ns(
+        SWT=ns(Expand=SWT_EXPAND),
+        widgets=ns(Event=lambda: FakeEvent(bot)),
+    )
+    return {
+        "org": ns(eclipse=ns(swt=swt, swtbot=ns(swt=ns(finder=finder)))),
+        "java": ns(util=ns(Arrays=ns(toString=to_string))),
+    }
+
+
+def capella_workbench(
+    latency: float = 0.0,
+    dialog_delay: float = 0.0,
+    login_required: bool = False,
+    projects: cabc.Iterable[str] = ("In-Flight Entertainment System",),
+    t4c_projects: cabc.Iterable[str] = ("model",),
+) -> FakeBot:
+    """Return a fake bot modelling a Capella workbench.
+
+    The workbench offers the menus, dialogs and wizards driven by the
+    helper functions of :mod:`pyease.ease`:
+
+    * ``File > New > Other... > Team for Capella > Connect to remote
+      model`` and ``File > Import... > Team for Capella > Import model
+      from remote repository`` with the T4C wizard,
+    * ``File > Import... > General > Projects from Folder or Archive``,
+    * ``Window > Show View > Other...``,
+    * ``Window > Perspective > Open Perspective > Other...`` and
+    * ``Compare With > Each Other as models`` in the context menu of the
+      view "Project Explorer", opening a compare result editor.
+
+    Parameters
+    ----------
+    latency : optional
+        Time in seconds every bridge call takes
+    dialog_delay : optional
+        Time in seconds until the widgets of a newly opened dialog or
+        wizard page appear
+    login_required : optional
+        Show a login dialog after "Test connection" in the T4C wizard
+        and keep "Next >" disabled until the first login
+    projects : optional
+        Projects shown in the view "Project Explorer"
+    t4c_projects : optional
+        Projects offered by the T4C repository
+
+    Returns
+    -------
+    FakeBot
+        The fake bot
+
+    """
+    bot: FakeBot = FakeBot(latency)
+    t4c_projects = list(t4c_projects)
+    project_explorer_tree: FakeTree = FakeTree(
+        bot, [FakeTreeItem(bot, project) for project in projects]
+    )
+    bot.views_.append(
+        FakeView(bot, "Project Explorer", tree=project_explorer_tree)
+    )
+
+    def compare_with_each_other():
+        if len(project_explorer_tree.selection) != 2:
+            raise RuntimeError("Select two projects to compare!")
+        left, right = project_explorer_tree.selection
+        bot.editors.append(
+            FakeView(
+                bot,
+                f"Compare ('{left}' - '{right}')",
+                tree=FakeTree(
+                    bot,
+                    [
+                        FakeTreeItem(
+                            bot,
+                            "Differences",
+                            [
+                                FakeTreeItem(
+                                    bot, right, [FakeTreeItem(bot, "Changed")]
+                                )
+                            ],
+                        )
+                    ],
+                ),
+                delay=dialog_delay,
+            )
+        )
+
+    project_explorer_tree.context_menu.add("Compare With").add(
+        "Each Other as models", compare_with_each_other
+    )
+
+    def finish(shell: FakeShell, project_label: str | None = None):
+        def run():
+            if project_label is not None:
+                combo_box: FakeCombo = shell.combo_boxes[project_label]
+                if combo_box.selection is None:
+                    raise RuntimeError("No project selected!")
+                project: str = combo_box.selection.split("/")[1]
+                project_explorer_tree.items.append(FakeTreeItem(bot, project))
+            bot.close_shell(shell)
+
+        return run
+
+    session: dict[str, bool] = {"authenticated": not login_required}
+
+    def login():
+        if session["authenticated"]:
+            return
+        shell: FakeShell = bot.open_shell("Login")
+        for label in ("User name", "Password"):
+            shell.text_fields[label] = FakeText(bot, "", delay=dialog_delay)
+
+        def ok():
+            session["authenticated"] = True
+            bot.close_shell(shell)
+
+        shell.buttons["OK"] = FakeButton(bot, "OK", ok, delay=dialog_delay)
+
+    def t4c_wizard(shell: FakeShell, project_label: str):
+        def run():
+            shell.tree = None
+            for label in (
+                "Repository Host:",
+                "Port Number:",
+                "Repository Name:",
+            ):
+                shell.text_fields[label] = FakeText(
+                    bot, "", delay=dialog_delay
+                )
+            shell.buttons["Test connection"] = FakeButton(
+                bot, "Test connection", login, delay=dialog_delay
+            )
+            shell.buttons["Next >"] = FakeButton(
+                bot,
+                "Next >",
+                next_page,
+                lambda: session["authenticated"],
+                delay=dialog_delay,
+            )
+            shell.buttons["Finish"] = FakeButton(
+                bot,
+                "Finish",
+                finish(shell, project_label),
+                delay=dialog_delay,
+            )
+
+        def next_page():
+            shell.combo_boxes[project_label] = FakeCombo(
+                bot,
+                "",
+                [f"/{project}/{project}.aird" for project in t4c_projects],
+                delay=dialog_delay,
+            )
+
+        return run
+
+    def wizard_selection(title: str, category: str, node: str, label: str):
+        def run():
+            shell: FakeShell = bot.open_shell(title)
+            item: FakeTreeItem = FakeTreeItem(
+                bot, node, on_double_click=t4c_wizard(shell, label)
+            )
+            shell.tree = FakeTree(
+                bot, [FakeTreeItem(bot, category, [item])], delay=dialog_delay
+            )
+
+        return run
+
+    def import_from_folder():
+        shell: FakeShell = bot.open_shell("Import")
+
+        def page():
+            shell.tree = None
+            shell.combo_boxes["Import source:"] = FakeCombo(
+                bot, "", delay=dialog_delay
+            )
+
+            def run():
+                path: str = shell.combo_boxes["Import source:"].text
+                project: str = path.rstrip("/").rsplit("/", 1)[-1]
+                if _visible(project_explorer_tree.items, project):
+                    raise RuntimeError(f"Project '{project}' exists!")
+                project_explorer_tree.items.append(FakeTreeItem(bot, project))
+                bot.close_shell(shell)
+
+            shell.buttons["Finish"] = FakeButton(
+                bot, "Finish", run, delay=dialog_delay
+            )
+
+        shell.tree = FakeTree(
+            bot,
+            [
+                FakeTreeItem(
+                    bot,
+                    "General",
+                    [
+                        FakeTreeItem(
+                            bot,
+                            "Projects from Folder or Archive",
+                            on_double_click=page,
+                        )
+                    ],
+                ),
+                FakeTreeItem(
+                    bot,
+                    "Team for Capella",
+                    [
+                        FakeTreeItem(
+                            bot,
+                            "Import model from remote repository",
+                            on_double_click=t4c_wizard(
+                                shell, "Shared Project to Import Locally:"
+                            ),
+                        )
+                    ],
+                ),
+            ],
+            delay=dialog_delay,
+        )
+
+    def show_view():
+        shell: FakeShell = bot.open_shell("Show View")
+
+        def open_view(title: str):
+            def run():
+                bot.open_view(FakeView(bot, title))
+                bot.close_shell(shell)
+
+            return run
+
+        shell.tree = FakeTree(
+            bot,
+            [
+                FakeTreeItem(
+                    bot,
+                    category,
+                    [
+                        FakeTreeItem(
+                            bot, title, on_double_click=open_view(title)
+                        )
+                        for title in titles
+                    ],
+                )
+                for category, titles in {
+                    "General": ("Console", "Outline", "Properties"),
+                    "Capella": ("Semantic Browser",),
+                }.items()
+            ],
+            delay=dialog_delay,
+        )
+
+    def open_perspective():
+        shell: FakeShell = bot.open_shell("Open Perspective")
+        shell.table = FakeTable(
+            bot, ["Capella (default)", "Debug", "Java"], delay=dialog_delay
+        )
+
+        def run():
+            if bot.selected_table_item is None:
+                raise RuntimeError("No perspective selected!")
+            bot.activate_perspective(
+                bot.selected_table_item.replace(" (default)", "")
+            )
+            bot.close_shell(shell)
+
+        shell.buttons["Open"] = FakeButton(
+            bot, "Open", run, delay=dialog_delay
+        )
+
+    file_menu: FakeMenu = bot.menu_bar.add("File")
+    file_menu.add("New").add(
+        "Other...",
+        wizard_selection(
+            "New",
+            "Team for Capella",
+            "Connect to remote model",
+            "Shared Project to Connect to:",
+        ),
+    )
+    file_menu.add("Import...", import_from_folder)
+    window_menu: FakeMenu = bot.menu_bar.add("Window")
+    window_menu.add("Show View").add("Other...", show_view)
+    window_menu.add("Perspective").add("Open Perspective").add(
+        "Other...", open_perspective
+    )
+    return bot
@@ -0,0 +1,440 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Module with a job loop running many jobs in one Capella.
+
+Starting Capella dominates the time of most EASE scripts. The job loop
+:func:`serve` is started once as EASE startup script (see
+:func:`write_startup_script`) and stays alive in Capella. It runs the
+jobs put into a spool directory by the :class:`JobLoopClient` one after
+the other. A job is either an EASE script or a call of a helper function
+of :mod:`pyease.ease`. The workspace is reset (see
+:func:`pyease.ease.reset_workspace`) after every script, but not after
+a call, which may prepare the workspace for the next job, unless told
+otherwise per job.
+
+The spool directory contains
+
+``inbox/<job id>.json``
+    Submitted jobs, run in the order of their ids
+``running/<job id>.json``
+    The job being run
+``done/<job id>.json``
+    Results of the jobs
+``heartbeat``
+    File touched every second, while the job loop is alive
+``stop``
+    File telling the job loop to return after the current job
+
+"""
+# Standard library:
+import json
+import logging
+import os
+import runpy
+import sys
+import threading
+import time
+import typing as t
+import uuid
+from pathlib import Path
+
+# local:
+import pyease.easeexceptions as exp
+from pyease import ease
+
+DONE: str = "done"
+HEARTBEAT: str = "heartbeat"
+INBOX: str = "inbox"
+RUNNING: str = "running"
+STOP: str = "stop"
+STARTUP_SCRIPT: str = "pyease_jobloop.py"
+
+_STARTUP_SCRIPT_TEMPLATE: str = """\
+# name: pyease job loop
+# onStartup: true
+from pathlib import Path
+
+from pyease import jobloop
+
+jobloop.serve(Path({spool_dir!r}), reset_workspace={reset_workspace!r})
+"""
+
+logger: logging.Logger = logging.getLogger()
+
+
+class JobResult(t.NamedTuple):
+    """Result of a job run by the job loop."""
+
+    job_id: str
+    duration: float
+    """Time in seconds the job took"""
+    value: t.Any = None
+    """Return value of a called helper function"""
+    error: str | None = None
+
+
+class JobLoopClient:
+    """Submit jobs to a job loop and collect their results.
+
+    Attributes
+    ----------
+    spool_dir
+        Spool directory of the job loop
+    poll_interval
+        Time in seconds between two checks for a result
+
+    """
+
+    def __init__(self, spool_dir: Path, poll_interval: float = 0.05):
+        """Initialise the client.
+
+        Parameters
+        ----------
+        spool_dir
+            Spool directory of the job loop
+        poll_interval : optional
+            Time in seconds between two checks for a result
+
+        """
+        self.spool_dir: Path = spool_dir
+        self.poll_interval: float = poll_interval
+        for name in (INBOX, RUNNING, DONE):
+            (spool_dir / name).mkdir(parents=True, exist_ok=True)
+
+    def call(
+        self,
+        helper: str,
+        *args: t.Any,
+        timeout: float | None = None,
+        reset_workspace: bool = False,
+    ) -> JobResult:
+        """Call a helper function in the job loop and wait for it.
+
+        See :meth:`submit_call` and :meth:`result`.
+
+        """
+        return self.result(
+            self.submit_call(helper, *args, reset_workspace=reset_workspace),
+            timeout,
+        )
+
+    def is_alive(self, heartbeat_timeout: float = 30.0) -> bool:
+        """Return True, if the job loop had a heartbeat recently.
+
+        Parameters
+        ----------
+        heartbeat_timeout : optional
+            Time in seconds since the last heartbeat
+
+        """
+        try:
+            mtime: float = (self.spool_dir / HEARTBEAT).stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - mtime <= heartbeat_timeout
+
+    def poll(self, job_id: str) -> JobResult | None:
+        """Return the result of a job or None, if it is not done yet.
+
+        Parameters
+        ----------
+        job_id
+            Id of the job returned on submission
+
+        """
+        done_path: Path = self.spool_dir / DONE / f"{job_id}.json"
+        try:
+            done: dict[str, t.Any] = json.loads(
+                done_path.read_text(encoding="utf8")
+            )
+        except FileNotFoundError:
+            return None
+        done_path.unlink()
+        return JobResult(
+            job_id, done["duration"], done["value"], done["error"]
+        )
+
+    def result(self, job_id: str, timeout: float | None = None) -> JobResult:
+        """Wait for the result of a job.
+
+        Parameters
+        ----------
+        job_id
+            Id of the job returned on submission
+        timeout : optional
+            Time in seconds to wait, the default is no limit
+
+        Raises
+        ------
+        easeexceptions.EaseJobTimeoutError
+            When the job is not done within the *timeout*
+
+        """
+        deadline: float = time.monotonic() + (
+            float("inf") if timeout is None else timeout
+        )
+        while (result := self.poll(job_id)) is None:
+            if time.monotonic() >= deadline:
+                raise exp.EaseJobTimeoutError(job_id, timeout)
+            time.sleep(self.poll_interval)
+        return result
+
+    def run_script(
+        self,
+        script: Path,
+        *args: str,
+        timeout: float | None = None,
+        reset_workspace: bool = True,
+    ) -> JobResult:
+        """Run an EASE script in the job loop and wait for it.
+
+        See :meth:`submit_script` and :meth:`result`.
+
+        """
+        return self.result(
+            self.submit_script(script, *args, reset_workspace=reset_workspace),
+            timeout,
+        )
+
+    def stop(self) -> None:
+        """Let the job loop return after the current job."""
+        (self.spool_dir / STOP).touch()
+
+    def submit_call(
+        self,
+        helper: str,
+        *args: t.Any,
+        job_id: str | None = None,
+        reset_workspace: bool = False,
+    ) -> str:
+        """Submit a call of a helper function of :mod:`pyease.ease`.
+
+        Parameters
+        ----------
+        helper
+            Name of the helper function, e.g.
+            ``"import_project_from_folder"``
+        args
+            JSON serialisable arguments for the helper function
+        job_id : optional
+            Id of the job, the default is a new unique id
+        reset_workspace : optional
+            Reset the workspace after the call (the default is False,
+            so that the call can prepare the workspace for later jobs)
+
+        Returns
+        -------
+        str
+            The job id
+
+        """
+        return self._submit(
+            {
+                "kind": "call",
+                "helper": helper,
+                "args": list(args),
+                "reset_workspace": reset_workspace,
+            },
+            job_id,
+        )
+
+    def submit_script(
+        self,
+        script: Path,
+        *args: str,
+        job_id: str | None = None,
+        reset_workspace: bool = True,
+    ) -> str:
+        """Submit an EASE script.
+
+        Parameters
+        ----------
+        script
+            Path to the EASE script
+        args
+            Arguments for the script, available as ``sys.argv[1:]``
+        job_id : optional
+            Id of the job, the default is a new unique id
+        reset_workspace : optional
+            Reset the workspace after the script (the default is True)
+
+        Returns
+        -------
+        str
+            The job id
+
+        """
+        return self._submit(
+            {
+                "kind": "script",
+                "script": str(script.resolve()),
+                "args": list(args),
+                "reset_workspace": reset_workspace,
+            },
+            job_id,
+        )
+
+    def _submit(self, job: dict[str, t.Any], job_id: str | None) -> str:
+        job["id"] = job_id or new_job_id()
+        _write_json(self.spool_dir / INBOX / f"{job['id']}.json", job)
+        return job["id"]
+
+
+def new_job_id() -> str:
+    """Return a unique job id, which sorts by the time of its creation."""
+    return f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+
+
+def _run_call(job: dict[str, t.Any]) -> t.Any:
+    helper: str = job["helper"]
+    if helper.startswith("_") or not callable(getattr(ease, helper, None)):
+        raise ValueError(f"Unknown helper function '{helper}'!")
+    logger.info("Call '%s'...", helper)
+    value: t.Any = getattr(ease, helper)(*job["args"])
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        value = str(value)
+    return value
+
+
+def _run_script(job: dict[str, t.Any]) -> None:
+    logger.info("Run EASE script '%s'...", job["script"])
+    argv: list[str] = sys.argv
+    sys.argv = [job["script"], *job["args"]]
+    try:
+        runpy.run_path(job["script"], run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"SystemExit: {e.code}") from e
+    finally:
+        sys.argv = argv
+
+
+def _run_job(job: dict[str, t.Any]) -> dict[str, t.Any]:
+    start: float = time.perf_counter()
+    value: t.Any = None
+    error: str | None = None
+    try:
+        if job["kind"] == "call":
+            value = _run_call(job)
+        else:
+            _run_script(job)
+    except Exception as e:
+        logger.exception("Job '%s' failed!", job["id"])
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "id": job["id"],
+        "duration": time.perf_counter() - start,
+        "value": value,
+        "error": error,
+    }
+
+
+def _write_json(path: Path, data: dict[str, t.Any]) -> None:
+    # Write atomically, as the reader polls for the file:
+    tmp_path: Path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf8")
+    os.replace(tmp_path, path)
+
+
+def serve(
+    spool_dir: Path,
+    reset_workspace: bool = True,
+    heartbeat_interval: float = 1.0,
+    poll_interval: float = 0.1,
+) -> None:
+    """Run the jobs put into a spool directory until told to stop.
+
+    Parameters
+    ----------
+    spool_dir
+        Spool directory, see the module docstring
+    reset_workspace : optional
+        Reset the workspace after the jobs asking for it (by default the
+        scripts), when running in an EASE context (the default is True).
+        With False the workspace is never reset.
+    heartbeat_interval : optional
+        Time in seconds between two touches of the heartbeat file
+    poll_interval : optional
+        Time in seconds between two checks for new jobs
+
+    """
+    for name in (INBOX, RUNNING, DONE):
+        (spool_dir / name).mkdir(parents=True, exist_ok=True)
+    stop_path: Path = spool_dir / STOP
+    stopped: threading.Event = threading.Event()
+
+    def beat():
+        while not stopped.is_set():
+            (spool_dir / HEARTBEAT).touch()
+            stopped.wait(heartbeat_interval)
+
+    threading.Thread(target=beat, name="pyease-heartbeat", daemon=True).start()
+    logger.info("Serve jobs from '%s'...", spool_dir)
+    try:
+        while not stop_path.exists():
+            job_paths: list[Path] = sorted((spool_dir / INBOX).glob("*.json"))
+            if not job_paths:
+                time.sleep(poll_interval)
+                continue
+            running_path: Path = spool_dir / RUNNING / job_paths[0].name
+            os.replace(job_paths[0], running_path)
+            job: dict[str, t.Any] = json.loads(
+                running_path.read_text(encoding="utf8")
+            )
+            result: dict[str, t.Any] = _run_job(job)
+            # Reset before the result is written, so that the next job
+            # submitted on the result finds the workspace reset:
+            if (
+                reset_workspace
+                and job.get("reset_workspace", job["kind"] == "script")
+                and ease.IS_EASE_CTXT
+            ):
+                try:
+                    ease.reset_workspace()
+                except Exception:
+                    logger.exception("Cannot reset the workspace!")
+            _write_json(spool_dir / DONE / running_path.name, result)
+            running_path.unlink()
+    finally:
+        stopped.set()
+        stop_path.unlink(missing_ok=True)
+    logger.info("Stopped serving jobs from '%s'.", spool_dir)
+
+
+def write_startup_script(
+    ease_scripts_location: Path, spool_dir: Path, reset_workspace: bool = True
+) -> Path:
+    """Write the EASE startup script running the job loop.
+
+    Pass the *ease_scripts_location* to
+    :func:`pyease.ease.create_empty_workspace_with_ease_setup` to have
+    the job loop started with Capella.
+
+    Parameters
+    ----------
+    ease_scripts_location
+        Directory of the EASE scripts
+    spool_dir
+        Spool directory of the job loop
+    reset_workspace : optional
+        Reset the workspace after the jobs asking for it (the default is
+        True), see :func:`serve`
+
+    Returns
+    -------
+    Path
+        Path to the written startup script
+
+    """
+    ease_scripts_location.mkdir(parents=True, exist_ok=True)
+    script_path: Path = ease_scripts_location / STARTUP_SCRIPT
+    script_path.write_text(
+        _STARTUP_SCRIPT_TEMPLATE.format(
+            spool_dir=str(spool_dir), reset_workspace=reset_workspace
+        ),
+        encoding="utf8",
+    )
+    return script_path
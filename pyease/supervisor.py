@@ -0,0 +1,453 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Module to run EASE scripts on several Capella instances at once.
+
+The :class:`Supervisor` starts a number of (headless) Capella instances,
+each with a workspace of its own created by
+:func:`pyease.ease.create_empty_workspace_with_ease_setup`. Every
+instance runs the job loop of :mod:`pyease.jobloop` as EASE startup
+script. The supervisor dispatches the EASE scripts to run to the job
+loops of the idle instances. The first heartbeat of a job loop tells
+that its instance is ready.
+
+An instance that exits, stops its heartbeat or exceeds the job timeout
+is restarted with a fresh workspace and its job is dispatched again. An
+instance that does not get ready after a number of restarts in a row is
+given up. When all instances are given up, the pending scripts fail.
+
+The supervisor can also be run from the command line:
+
+.. code-block:: bash
+
+    python3 -m pyease.supervisor --capella /opt/capella/capella \\
+        --root /tmp/instances --instances 4 script1.py script2.py
+
+"""
+# Standard library:
+import argparse
+import collections
+import collections.abc as cabc
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+# local:
+from pyease import ease, jobloop
+
+logger: logging.Logger = logging.getLogger()
+
+
+class ScriptResult(t.NamedTuple):
+    """Result of an EASE script run by the :class:`Supervisor`."""
+
+    job_id: str
+    script: Path
+    instance: int | None
+    """Index of the Capella instance, which ran the script last"""
+    duration: float
+    """Time in seconds the last run took"""
+    attempts: int
+    error: str | None = None
+
+
+class _Job:
+    def __init__(self, script: Path, args: tuple[str, ...]):
+        self.job_id: str = jobloop.new_job_id()
+        self.script: Path = script
+        self.args: tuple[str, ...] = args
+        self.attempts: int = 0
+        self.started: float = 0.0
+
+
+class _Instance:
+    def __init__(self, index: int, root_dir: Path):
+        self.index: int = index
+        self.dir: Path = root_dir / f"instance-{index}"
+        self.workspace: Path = self.dir / "workspace"
+        self.scripts_dir: Path = self.dir / "scripts"
+        self.spool_dir: Path = self.dir / "spool"
+        self.client: jobloop.JobLoopClient | None = None
+        self.popen: subprocess.Popen | None = None
+        self.started: float = 0.0
+        self.ready: bool = False
+        self.job: _Job | None = None
+        self.failed_starts: int = 0
+        self.given_up: bool = False
+
+
+class Supervisor:
+    """Run EASE scripts on several Capella instances.
+
+    Attributes
+    ----------
+    capella_command
+        Command line to start Capella, ``-data <workspace>`` is appended
+    root_dir
+        Directory for the workspaces, EASE scripts and spool directories
+        of the instances
+    instances
+        Number of Capella instances
+    startup_timeout
+        Time in seconds an instance may take to get ready
+    heartbeat_timeout
+        Time in seconds after the last heartbeat, when an instance is
+        considered hung
+    job_timeout
+        Time in seconds a script may run or None for no limit
+    max_attempts
+        Number of times a script is dispatched, when the instances
+        running it crash or hang
+    max_restarts
+        Number of times in a row an instance, which does not get ready,
+        is restarted before it is given up
+    poll_interval
+        Time in seconds between two checks of the instances
+    restarts
+        Number of restarts of crashed or hung instances
+
+    """
+
+    def __init__(
+        self,
+        capella_command: cabc.Sequence[str],
+        root_dir: Path,
+        instances: int | None = None,
+        startup_timeout: float = 300.0,
+        heartbeat_timeout: float = 30.0,
+        job_timeout: float | None = 3600.0,
+        max_attempts: int = 2,
+        max_restarts: int = 3,
+        poll_interval: float = 0.1,
+    ):
+        """Initialise the supervisor.
+
+        Parameters
+        ----------
+        capella_command
+            Command line to start Capella, ``-data <workspace>`` is
+            appended
+        root_dir
+            Directory for the workspaces, EASE scripts and spool
+            directories of the instances
+        instances : optional
+            Number of Capella instances, the default is the number of
+            CPUs
+        startup_timeout : optional
+            Time in seconds an instance may take to get ready
+        heartbeat_timeout : optional
+            Time in seconds after the last heartbeat, when an instance
+            is considered hung
+        job_timeout : optional
+            Time in seconds a script may run (the default is an hour) or
+            None for no limit. The heartbeat goes on while a script
+            hangs, e.g. on a modal dialog, so only the job timeout
+            detects that.
+        max_attempts : optional
+            Number of times a script is dispatched, when the instances
+            running it crash or hang
+        max_restarts : optional
+            Number of times in a row an instance, which does not get
+            ready, is restarted before it is given up
+        poll_interval : optional
+            Time in seconds between two checks of the instances
+
+        """
+        self.capella_command: list[str] = list(capella_command)
+        self.root_dir: Path = root_dir.resolve()
+        self.instances: int = instances or os.cpu_count() or 1
+        self.startup_timeout: float = startup_timeout
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self.job_timeout: float | None = job_timeout
+        self.max_attempts: int = max_attempts
+        self.max_restarts: int = max_restarts
+        self.poll_interval: float = poll_interval
+        self.restarts: int = 0
+        self._instances: list[_Instance] = []
+        self._pending: collections.deque[_Job] = collections.deque()
+        self._results: dict[str, ScriptResult] = {}
+        self._submitted: list[str] = []
+
+    def __enter__(self) -> "Supervisor":
+        self.start()
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all Capella instances."""
+        for instance in self._instances:
+            self._stop_instance(instance)
+        self._instances.clear()
+
+    def run(self, scripts: cabc.Iterable[Path]) -> list[ScriptResult]:
+        """Run the *scripts* and return their results.
+
+        Parameters
+        ----------
+        scripts
+            Paths to the EASE scripts to run
+
+        Returns
+        -------
+        list[ScriptResult]
+            The results in the order of the *scripts*
+
+        """
+        for script in scripts:
+            self.submit(script)
+        return self.wait()
+
+    def start(self) -> None:
+        """Start the Capella instances.
+
+        The instances get ready in the background, :meth:`wait`
+        dispatches the scripts as soon as they are.
+
+        """
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        for index in range(len(self._instances), self.instances):
+            instance: _Instance = _Instance(index, self.root_dir)
+            self._instances.append(instance)
+            self._start_instance(instance)
+
+    def submit(self, script: Path, *args: str) -> str:
+        """Queue an EASE script to be run by the next idle instance.
+
+        Parameters
+        ----------
+        script
+            Path to the EASE script
+        args
+            Arguments for the script, available as ``sys.argv[1:]``
+
+        Returns
+        -------
+        str
+            The job id
+
+        """
+        job: _Job = _Job(script.resolve(), args)
+        self._pending.append(job)
+        self._submitted.append(job.job_id)
+        return job.job_id
+
+    def wait(self) -> list[ScriptResult]:
+        """Wait until all submitted scripts have been run.
+
+        Returns
+        -------
+        list[ScriptResult]
+            The results of the scripts submitted since the last call in
+            the order of their submission
+
+        """
+        if not self._instances:
+            self.start()
+        while self._pending or any(
+            instance.job is not None for instance in self._instances
+        ):
+            for instance in self._instances:
+                if not instance.given_up:
+                    self._poll_instance(instance)
+            if all(instance.given_up for instance in self._instances):
+                self._fail_pending("No Capella instance got ready")
+                break
+            time.sleep(self.poll_interval)
+        results: list[ScriptResult] = [
+            self._results.pop(job_id) for job_id in self._submitted
+        ]
+        self._submitted.clear()
+        return results
+
+    def _dispatch(self, instance: _Instance) -> None:
+        job: _Job = self._pending.popleft()
+        job.attempts += 1
+        job.started = time.monotonic()
+        instance.job = job
+        logger.debug(
+            "Dispatch '%s' to Capella instance %d...",
+            job.script,
+            instance.index,
+        )
+        assert instance.client is not None
+        instance.client.submit_script(job.script, *job.args, job_id=job.job_id)
+
+    def _fail_pending(self, error: str) -> None:
+        while self._pending:
+            job: _Job = self._pending.popleft()
+            self._results[job.job_id] = ScriptResult(
+                job.job_id, job.script, None, 0.0, job.attempts, error
+            )
+
+    def _poll_instance(self, instance: _Instance) -> None:
+        assert instance.popen is not None and instance.client is not None
+        job: _Job | None = instance.job
+        result: jobloop.JobResult | None = None
+        if job is not None:
+            result = instance.client.poll(job.job_id)
+        if job is not None and result is not None:
+            self._results[job.job_id] = ScriptResult(
+                job.job_id,
+                job.script,
+                instance.index,
+                result.duration,
+                job.attempts,
+                result.error,
+            )
+            instance.job = job = None
+        problem: str | None = None
+        heartbeat_path: Path = instance.spool_dir / jobloop.HEARTBEAT
+        if instance.popen.poll() is not None:
+            problem = f"exited with code {instance.popen.returncode}"
+        elif not instance.ready:
+            if heartbeat_path.exists():
+                instance.ready = True
+                instance.failed_starts = 0
+                logger.info(
+                    "Capella instance %d is ready after %.1f s.",
+                    instance.index,
+                    time.monotonic() - instance.started,
+                )
+            elif time.monotonic() - instance.started > self.startup_timeout:
+                problem = f"was not ready within {self.startup_timeout} s"
+        elif (
+            time.time() - heartbeat_path.stat().st_mtime
+            > self.heartbeat_timeout
+        ):
+            problem = f"had no heartbeat for {self.heartbeat_timeout} s"
+        elif (
+            job is not None
+            and self.job_timeout is not None
+            and time.monotonic() - job.started > self.job_timeout
+        ):
+            problem = f"did not finish '{job.script}' in {self.job_timeout} s"
+        if problem is not None:
+            self._restart_instance(instance, problem)
+        elif instance.ready and instance.job is None and self._pending:
+            self._dispatch(instance)
+
+    def _restart_instance(self, instance: _Instance, problem: str) -> None:
+        logger.warning("Capella instance %d %s.", instance.index, problem)
+        job: _Job | None = instance.job
+        instance.job = None
+        if job is not None and job.attempts < self.max_attempts:
+            self._pending.appendleft(job)
+        elif job is not None:
+            self._results[job.job_id] = ScriptResult(
+                job.job_id,
+                job.script,
+                instance.index,
+                time.monotonic() - job.started,
+                job.attempts,
+                f"Capella instance {instance.index} {problem}",
+            )
+        self._stop_instance(instance)
+        if not instance.ready:
+            instance.failed_starts += 1
+        if instance.failed_starts > self.max_restarts:
+            logger.error(
+                "Give up Capella instance %d, it did not get ready %d "
+                "times in a row.",
+                instance.index,
+                instance.failed_starts,
+            )
+            instance.given_up = True
+            return
+        self.restarts += 1
+        self._start_instance(instance)
+
+    def _start_instance(self, instance: _Instance) -> None:
+        shutil.rmtree(instance.spool_dir, ignore_errors=True)
+        instance.client = jobloop.JobLoopClient(instance.spool_dir)
+        jobloop.write_startup_script(instance.scripts_dir, instance.spool_dir)
+        ease.create_empty_workspace_with_ease_setup(
+            instance.workspace, ease_scripts_location=instance.scripts_dir
+        )
+        with open(instance.dir / "capella.log", "ab") as log_file:
+            instance.popen = ease.start_capella_process(
+                [*self.capella_command, "-data", str(instance.workspace)],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        instance.started = time.monotonic()
+        instance.ready = False
+
+    def _stop_instance(self, instance: _Instance) -> None:
+        if instance.popen is not None:
+            ease.kill_capella_process(pid=instance.popen.pid)
+            instance.popen = None
+
+
+def main(argv: cabc.Sequence[str] | None = None) -> int:
+    """Run EASE scripts given on the command line.
+
+    Parameters
+    ----------
+    argv : optional
+        Command line arguments, the default is ``sys.argv[1:]``
+
+    Returns
+    -------
+    int
+        Exit code, 1 when a script failed
+
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python3 -m pyease.supervisor",
+        description="Run EASE scripts on several Capella instances.",
+    )
+    parser.add_argument(
+        "--capella",
+        required=True,
+        help="command line to start Capella (without -data)",
+    )
+    parser.add_argument(
+        "--root",
+        required=True,
+        type=Path,
+        help="directory for the workspaces of the instances",
+    )
+    parser.add_argument(
+        "--instances",
+        type=int,
+        default=None,
+        help="number of Capella instances (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--job-timeout",
+        type=float,
+        default=3600.0,
+        help="time in seconds a script may run (default: 3600)",
+    )
+    parser.add_argument("scripts", nargs="+", type=Path)
+    args: argparse.Namespace = parser.parse_args(argv)
+    ease.init_logging()
+    results: list[ScriptResult]
+    with Supervisor(
+        shlex.split(args.capella),
+        args.root,
+        args.instances,
+        job_timeout=args.job_timeout,
+    ) as supervisor:
+        results = supervisor.run(args.scripts)
+    for result in results:
+        logger.info(
+            "\t- '%s': %s in %.1f s (%d attempt(s))",
+            result.script,
+            result.error or "ok",
+            result.duration,
+            result.attempts,
+        )
+    return int(any(result.error for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
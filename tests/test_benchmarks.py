@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks of the UI helpers of pyease.ease against the fake bot.
+
+Every benchmark runs a helper against :func:`pyease.fakebot.capella_workbench`
+and checks the number of calls over the (fake) py4j bridge against a
+budget. The import of pyease.ease itself is timed in a fresh interpreter.
+Run ``pytest -s tests/test_benchmarks.py`` to see the numbers.
+"""
+import subprocess
+import sys
+import time
+import typing as t
+
+import pytest
+
+from pyease import ease, fakebot
+
+LATENCY: float = 0.0005
+DIALOG_DELAY: float = 0.02
+T4C_ARGS: tuple[str, ...] = ("localhost", "2036", "repo", "model", "u", "p")
+
+
+@pytest.fixture
+def bot(monkeypatch: pytest.MonkeyPatch) -> fakebot.FakeBot:
+    bot_: fakebot.FakeBot = fakebot.capella_workbench(
+        latency=LATENCY, dialog_delay=DIALOG_DELAY, login_required=True
+    )
+    monkeypatch.setattr(ease, "BOT", bot_)
+    monkeypatch.setattr(ease, "_workbench", lambda: bot_.workbench)
+    # The listener of the workbench state is registered once per session:
+    ease.workbench_state()
+    return bot_
+
+
+def _benchmark(
+    bot: fakebot.FakeBot, func: t.Callable[..., t.Any], *args: t.Any
+) -> int:
+    bot.reset_calls()
+    start: float = time.perf_counter()
+    func(*args)
+    wall_ms: float = (time.perf_counter() - start) * 1000
+    print(
+        f"\n{func.__name__}: {bot.calls} bridge calls, {wall_ms:.1f} ms "
+        f"{dict(bot.calls_per_method)}"
+    )
+    return bot.calls
+
+
+IMPORT_SCRIPT: str = """
+import logging, sys, time
+start = time.perf_counter()
+import pyease.ease
+print((time.perf_counter() - start) * 1000)
+assert not logging.getLogger().handlers
+assert not [name for name in sys.modules if name.startswith("eclipse.")]
+"""
+
+
+def test_import_of_ease_is_fast_and_side_effect_free():
+    import_ms: float = min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(3)
+    )
+    print(f"\nimport pyease.ease: {import_ms:.1f} ms")
+
+    assert import_ms < 500
+
+
+def test_click_button_with_label(bot: fakebot.FakeBot):
+    button = fakebot.FakeButton(bot, "OK", delay=DIALOG_DELAY)
+    bot.active_shell.buttons["OK"] = button
+
+    calls: int = _benchmark(bot, ease.click_button_with_label, "OK")
+
+    assert button.clicks == 1
+    assert calls <= 3
+
+
+def test_fill_text_field_with_label(bot: fakebot.FakeBot):
+    text_field = fakebot.FakeText(bot, "", delay=DIALOG_DELAY)
+    bot.active_shell.text_fields["Name:"] = text_field
+
+    calls: int = _benchmark(
+        bot, ease.fill_text_field_with_label, "Name:", "value"
+    )
+
+    assert text_field.text == "value"
+    assert calls <= 2
+
+
+def test_open_eclipse_view(bot: fakebot.FakeBot):
+    calls: int = _benchmark(bot, ease.open_eclipse_view, "General", "Outline")
+    repeated_calls: int = _benchmark(
+        bot, ease.open_eclipse_view, "General", "Outline"
+    )
+
+    assert ease.is_eclipse_view_shown("Outline")
+    assert calls <= 13
+    assert repeated_calls <= 3
+
+
+def test_open_eclipse_perspective(bot: fakebot.FakeBot):
+    calls: int = _benchmark(bot, ease.open_eclipse_perspective, "Debug")
+    repeated_calls: int = _benchmark(
+        bot, ease.open_eclipse_perspective, "Debug"
+    )
+
+    assert bot.perspective == "Debug"
+    assert calls <= 17
+    assert repeated_calls <= 2
+
+
+def test_is_projects_in_workspace(bot: fakebot.FakeBot):
+    calls: int = _benchmark(bot, ease.is_projects_in_workspace)
+
+    assert ease.is_projects_in_workspace()
+    assert calls <= 7
+
+
+def test_connect_to_remote_t4c_model(bot: fakebot.FakeBot):
+    calls: int = _benchmark(bot, ease.connect_to_remote_t4c_model, *T4C_ARGS)
+
+    assert len(bot.shells) == 1
+    assert calls <= 38
+
+
+def test_connect_to_remote_t4c_model_without_login(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot_: fakebot.FakeBot = fakebot.capella_workbench(
+        latency=LATENCY, dialog_delay=DIALOG_DELAY
+    )
+    monkeypatch.setattr(ease, "BOT", bot_)
+    # Probing for the login dialog does not block on the search timeout:
+    for name, package in fakebot.java_packages(bot_).items():
+        monkeypatch.setattr(ease, name, package, raising=False)
+    start: float = time.perf_counter()
+
+    calls: int = _benchmark(bot_, ease.connect_to_remote_t4c_model, *T4C_ARGS)
+
+    # Not waiting for the login dialog up to its timeout:
+    assert time.perf_counter() - start < 2
+    # Three repository fields and one probe for the login dialog:
+    assert bot_.calls_per_method["textWithLabel"] == 3 + 1
+    assert calls <= 35
+
+
+def test_import_model_from_remote_repository(bot: fakebot.FakeBot):
+    calls: int = _benchmark(
+        bot, ease.import_model_from_remote_repository, *T4C_ARGS
+    )
+
+    assert ease.tree_item_labels(ease.project_explorer_tree())[-1] == "model"
+    assert calls <= 38
+
+
+def test_import_models_from_remote_repository(monkeypatch: pytest.MonkeyPatch):
+    bot_: fakebot.FakeBot = fakebot.capella_workbench(
+        latency=LATENCY,
+        dialog_delay=DIALOG_DELAY,
+        login_required=True,
+        projects=(),
+        t4c_projects=("a", "b", "c"),
+    )
+    monkeypatch.setattr(ease, "BOT", bot_)
+    host, port, repo, _, user, password = T4C_ARGS
+
+    calls: int = _benchmark(
+        bot_,
+        ease.import_models_from_remote_repository,
+        host,
+        port,
+        repo,
+        ["a", "b", "c"],
+        user,
+        password,
+    )
+
+    assert ease.tree_item_labels(ease.project_explorer_tree()) == [
+        "a",
+        "b",
+        "c",
+    ]
+    # Three repository fields per pass, the login dialog only once:
+    assert bot_.calls_per_method["textWithLabel"] == 3 * 3 + 3
+    assert calls <= 90
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from pyease import ease, fakebot, jobloop
+
+
+def test_job_loop_runs_calls_and_scripts_until_stopped(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setattr(ease, "BOT", fakebot.capella_workbench())
+    spool_dir = tmp_path / "spool"
+    script = tmp_path / "script.py"
+    script.write_text("import sys; open(sys.argv[1], 'w').close()")
+    loop = threading.Thread(
+        target=jobloop.serve, args=(spool_dir,), kwargs={"poll_interval": 0.01}
+    )
+    loop.start()
+    client = jobloop.JobLoopClient(spool_dir, poll_interval=0.01)
+    try:
+        view_job_id = client.submit_call(
+            "open_eclipse_view", "General", "Outline"
+        )
+        shown = client.call("is_eclipse_view_shown", "Outline", timeout=10)
+        script_result = client.run_script(
+            script, str(tmp_path / "done"), timeout=10
+        )
+        unknown = client.call("_write_ease_workspace_files", timeout=10)
+        view_result = client.result(view_job_id, timeout=10)
+        assert client.is_alive()
+    finally:
+        client.stop()
+        loop.join(10)
+
+    assert view_result.error is None
+    assert shown.value is True
+    assert script_result.error is None
+    assert (tmp_path / "done").exists()
+    assert unknown.error == (
+        "ValueError: Unknown helper function '_write_ease_workspace_files'!"
+    )
+    assert not loop.is_alive()
+
+
+def test_job_loop_resets_the_workspace_only_after_scripts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    resets: list[bool] = []
+    monkeypatch.setattr(ease, "BOT", fakebot.capella_workbench())
+    monkeypatch.setattr(ease, "IS_EASE_CTXT", True, raising=False)
+    monkeypatch.setattr(ease, "reset_workspace", lambda: resets.append(True))
+    spool_dir = tmp_path / "spool"
+    script = tmp_path / "script.py"
+    script.write_text("pass")
+    loop = threading.Thread(
+        target=jobloop.serve, args=(spool_dir,), kwargs={"poll_interval": 0.01}
+    )
+    loop.start()
+    client = jobloop.JobLoopClient(spool_dir, poll_interval=0.01)
+    try:
+        client.call("is_projects_in_workspace", timeout=10)
+        assert not resets
+        client.run_script(script, timeout=10)
+        assert len(resets) == 1
+        client.run_script(script, timeout=10, reset_workspace=False)
+        client.call(
+            "is_projects_in_workspace", timeout=10, reset_workspace=True
+        )
+        assert len(resets) == 2
+    finally:
+        client.stop()
+        loop.join(10)
@@ -1,8 +1,786 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
 import pyease
+from pyease import ease, fakebot
 
 
 def test_add_some_tests_here():
     ...
+
+
+@pytest.fixture
+def ease_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("EASE_WORKSPACE", str(tmp_path / "workspace"))
+    monkeypatch.setenv("EASE_SCRIPTS_LOCATION", str(tmp_path / "scripts"))
+    monkeypatch.delenv("EASE_WORKSPACE_TEMPLATE_CACHE", raising=False)
+    return tmp_path
+
+
+def _read_tree(root: Path) -> dict[str, str]:
+    return {
+        str(path.relative_to(root)): path.read_text(encoding="utf8")
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+def test_workspace_from_template_equals_written_workspace(ease_env: Path):
+    workspace: Path = ease_env / "workspace"
+    ease.create_empty_workspace_with_ease_setup()
+    expected: dict[str, str] = _read_tree(workspace)
+
+    cache_dir: Path = ease_env / "cache"
+    ease.create_empty_workspace_with_ease_setup(template_cache_dir=cache_dir)
+    assert _read_tree(workspace) == expected
+    (workspace / "scratch").write_text("dirty", encoding="utf8")
+    ease.create_empty_workspace_with_ease_setup(template_cache_dir=cache_dir)
+
+    assert _read_tree(workspace) == expected
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_workspace_pools_sharing_a_root_never_share_workspaces(
+    ease_env: Path,
+):
+    root_dir: Path = ease_env / "pool"
+    with ease.WorkspacePool(root_dir, size=2) as pool, ease.WorkspacePool(
+        root_dir, size=1
+    ) as other_pool:
+        with pool.lease(timeout=10) as first, other_pool.lease(
+            timeout=10
+        ) as other:
+            second: ease.WorkspaceLease = pool.lease(timeout=10)
+            assert len({first, second.path, other}) == 3
+            assert (first / ".metadata").is_dir()
+            with pytest.raises(ease.exp.EaseNoWorkspaceAvailableError):
+                pool.lease(timeout=0.1)
+            second.release(reset=False)
+            assert pool.lease(timeout=10).path == second.path
+
+
+def test_workspace_pool_fails_lease_when_provisioning_fails(
+    ease_env: Path, monkeypatch: pytest.MonkeyPatch
+):
+    create = ease.create_empty_workspace_with_ease_setup
+    failures: list[Path] = []
+
+    def create_or_fail_once(path: Path, **kwargs):
+        if not failures:
+            failures.append(path)
+            raise OSError("disk full")
+        return create(path, **kwargs)
+
+    monkeypatch.setattr(
+        ease, "create_empty_workspace_with_ease_setup", create_or_fail_once
+    )
+    pool = ease.WorkspacePool(ease_env / "pool", size=1)
+    with pool:
+        with pytest.raises(ease.exp.EaseNoWorkspaceAvailableError):
+            pool.lease()
+        lease = pool.lease(timeout=10)
+        assert lease.path == failures[0]
+
+    with ease.WorkspacePool(ease_env / "pool", size=1) as other_pool:
+        assert other_pool.lease(timeout=10).path != lease.path
+    lease.release()
+    with ease.WorkspacePool(ease_env / "pool", size=1) as other_pool:
+        assert other_pool.lease(timeout=10).path == lease.path
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo: Path = tmp_path / "origin"
+    repo.mkdir()
+    _git("init", "-b", "main", cwd=repo)
+    (repo / "model.capella").write_text("main", encoding="utf8")
+    _git("add", ".", cwd=repo)
+    _git("commit", "-m", "main", cwd=repo)
+    _git("switch", "-c", "feature", cwd=repo)
+    (repo / "model.capella").write_text("feature", encoding="utf8")
+    _git("commit", "-am", "feature", cwd=repo)
+    _git("switch", "main", cwd=repo)
+    return repo
+
+
+def test_clone_from_mirror_cache_fetches_new_commits(
+    tmp_path: Path, git_repo: Path
+):
+    cache_dir: Path = tmp_path / "mirrors"
+    target: Path = tmp_path / "clone"
+    ease.clone_project_from_git(
+        str(git_repo), "feature", target, mirror_cache_dir=cache_dir
+    )
+    assert (target / "model.capella").read_text("utf8") == "feature"
+    assert _git("remote", "get-url", "origin", cwd=target) == str(git_repo)
+
+    _git("switch", "feature", cwd=git_repo)
+    (git_repo / "model.capella").write_text("update", encoding="utf8")
+    _git("commit", "-am", "update", cwd=git_repo)
+    ease.clone_project_from_git(
+        str(git_repo), "feature", target, mirror_cache_dir=cache_dir
+    )
+
+    assert (target / "model.capella").read_text("utf8") == "update"
+    assert len(list(cache_dir.glob("*.git"))) == 1
+
+
+def test_clone_projects_isolates_failing_jobs(tmp_path: Path, git_repo: Path):
+    jobs: list[ease.GitCloneJob] = [
+        ease.GitCloneJob(str(git_repo), "main", tmp_path / "a"),
+        ease.GitCloneJob(str(tmp_path / "missing"), "main", tmp_path / "b"),
+        ease.GitCloneJob(str(git_repo), "feature", tmp_path / "c"),
+    ]
+
+    results = ease.clone_projects_from_git(jobs, max_workers=2)
+
+    assert [result.job for result in results] == jobs
+    assert [result.error is None for result in results] == [True, False, True]
+    assert (tmp_path / "c" / "model.capella").is_file()
+
+
+def test_clone_checks_out_requested_branch_and_sparse_paths(
+    tmp_path: Path, git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (git_repo / "README").write_text("readme", encoding="utf8")
+    _git("add", ".", cwd=git_repo)
+    _git("commit", "-m", "readme", cwd=git_repo)
+    target: Path = tmp_path / "clone"
+
+    ease.clone_project_from_git(
+        git_repo.as_uri(),
+        "feature",
+        target,
+        filter_spec="blob:none",
+        sparse_paths=["*.capella"],
+    )
+
+    assert _git("branch", "--show-current", cwd=target) == "feature"
+    assert (target / "model.capella").read_text("utf8") == "feature"
+    ease.clone_project_from_git(
+        git_repo.as_uri(), "main", target, sparse_paths=["*.capella"]
+    )
+    assert not (target / "README").exists()
+    monkeypatch.setenv("LC_ALL", "C.UTF-8")
+    monkeypatch.setenv("LANGUAGE", "de")
+    ease.clone_project_from_git(git_repo.as_uri(), "new", target)
+    assert _git("branch", "--show-current", cwd=target) == "new"
+    assert (target / "README").is_file()
+
+
+class _ConditionMetAfter:
+    def __init__(self, probes: int):
+        self.probes: int = probes
+        self.bot = None
+
+    def init(self, bot):
+        self.bot = bot
+
+    def test(self) -> bool:
+        self.probes -= 1
+        if self.probes < 0:
+            return True
+        raise RuntimeError("Widget not found")
+
+    def getFailureMessage(self) -> str:
+        return "Condition not met!"
+
+
+def test_wait_until_backs_off_and_records_wait_times(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(ease, "BOT", object())
+    monkeypatch.setattr(ease, "WAIT_TIMES", {})
+    monkeypatch.setattr(ease, "_WAIT_TIMES_MAXLEN", 2)
+    policy = ease.BackoffPolicy(first_interval=1, factor=2, max_interval=4)
+    condition = _ConditionMetAfter(probes=3)
+
+    waited: float = ease.wait_until(condition, 1000, 500, policy)
+
+    assert condition.bot is ease.BOT
+    assert 1 + 2 + 4 <= waited < 500
+    assert list(ease.WAIT_TIMES["_ConditionMetAfter"]) == [waited]
+    for _ in range(3):
+        ease.wait_until(_ConditionMetAfter(probes=0), 1000, 500, policy)
+    assert len(ease.WAIT_TIMES["_ConditionMetAfter"]) == 2
+    with pytest.raises(ease.exp.EaseWaitTimeoutError, match="not met"):
+        ease.wait_until(_ConditionMetAfter(probes=100), 20, 5, policy)
+
+
+def test_wait_modes_share_timeouts_and_failure_messages(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = fakebot.FakeBot()
+    monkeypatch.setattr(ease, "BOT", bot)
+    monkeypatch.setattr(ease, "WAIT_POLICY", ease.WAIT_POLICY)
+
+    ease.set_wait_mode("fixed")
+    waited: float = ease.wait_until(_ConditionMetAfter(probes=2), 1000, 20)
+    assert 2 * 20 <= waited < 500
+    assert bot.calls_per_method["waitUntil"] == 0
+
+    for mode in ("adaptive", "fixed", "swtbot"):
+        ease.set_wait_mode(mode)
+        with pytest.raises(
+            ease.exp.EaseWaitTimeoutError, match="20 ms: Condition not met"
+        ):
+            ease.wait_until(_ConditionMetAfter(probes=100), 20, 5)
+    assert bot.calls_per_method["waitUntil"] == 1
+
+    def broken_wait_until(condition: object, timeout: int, interval: int):
+        time.sleep(timeout / 1000)
+        raise RuntimeError("Widget is disposed")
+
+    monkeypatch.setattr(bot, "waitUntil", broken_wait_until)
+    with pytest.raises(RuntimeError, match="disposed"):
+        ease.wait_until(_ConditionMetAfter(probes=100), 20, 5)
+    with pytest.raises(ValueError, match="Unknown wait mode"):
+        ease.set_wait_mode("busy")
+
+
+class _Button:
+    def __init__(self):
+        self.clicks: int = 0
+
+    def isEnabled(self) -> bool:
+        return True
+
+    def click(self):
+        self.clicks += 1
+
+
+class _ButtonBot:
+    def __init__(self):
+        self.lookups: int = 0
+        self.widget = _Button()
+
+    def button(self, label: str) -> _Button:
+        self.lookups += 1
+        return self.widget
+
+
+def test_click_button_with_label_looks_up_the_button_once(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = _ButtonBot()
+    monkeypatch.setattr(ease, "BOT", bot)
+
+    ease.click_button_with_label("OK")
+
+    assert bot.lookups == 1
+    assert bot.widget.clicks == 1
+
+
+class _TreeItem:
+    def __init__(self, text: str):
+        self.text: str = text
+
+    def getText(self) -> str:
+        return self.text
+
+
+class _Tree:
+    def __init__(self, *labels: str):
+        self.items: list[_TreeItem] = [_TreeItem(label) for label in labels]
+
+    def getAllItems(self) -> list[_TreeItem]:
+        return self.items
+
+
+def test_tree_item_condition_matches_any_of_several_regexes():
+    tree = _Tree("Project A", "model-x (remote)", "Project B")
+    condition = ease.TreeItemWithLabelMatchingRegExIsAvailable(
+        tree, r"model-y", r"model-\w+ \(remote\)"
+    )
+
+    assert condition.test()
+    assert condition.matched_label == "model-x (remote)"
+    assert not ease.TreeItemWithLabelMatchingRegExIsAvailable(
+        tree, "Project C"
+    ).test()
+
+
+@pytest.fixture
+def java_bot(monkeypatch: pytest.MonkeyPatch) -> fakebot.FakeBot:
+    bot = fakebot.FakeBot(search_timeout=0)
+    monkeypatch.setattr(ease, "BOT", bot)
+    monkeypatch.setattr(ease, "_BULK_TREE_ITEM_LABELS", True)
+    for name, package in fakebot.java_packages(bot).items():
+        monkeypatch.setattr(ease, name, package, raising=False)
+    return bot
+
+
+@pytest.mark.parametrize("count", [3, 300])
+def test_tree_item_labels_cost_the_same_bridge_calls_for_any_tree(
+    java_bot: fakebot.FakeBot, count: int
+):
+    labels = [f"Project {{{index}}}" for index in range(count)]
+    tree = fakebot.FakeTree(
+        java_bot, [fakebot.FakeTreeItem(java_bot, label) for label in labels]
+    )
+
+    assert ease.tree_item_labels(tree) == labels
+    # Three calls read the field "widget" by reflection:
+    assert java_bot.calls == 3 + 3
+    assert java_bot.calls_per_method["getField"] == 1
+    assert ease.tree_item_labels(fakebot.FakeTree(java_bot)) == []
+
+    tree.items.append(fakebot.FakeTreeItem(java_bot, "a}, TreeItem {b"))
+    java_bot.reset_calls()
+    assert ease.tree_item_labels(tree) == [*labels, "a}, TreeItem {b"]
+    assert java_bot.calls_per_method["getText"] == count + 1
+
+
+def test_bridge_instrumentation_attributes_calls_to_outermost_helper(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(ease, "BOT", _ButtonBot())
+    monkeypatch.setattr(ease, "_BRIDGE_STATISTICS", None)
+    ease.enable_bridge_instrumentation()
+
+    ease.click_button_with_label("OK")
+    summary = ease.bridge_call_summary()
+
+    assert list(summary) == ["click_button_with_label"]
+    assert summary["click_button_with_label"]["invocations"] == 1
+    assert summary["click_button_with_label"]["calls_per_method"] == {
+        "button": 1,
+        "click": 1,
+        "isEnabled": 1,
+    }
+
+
+class _ThreadRecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.threads: list[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.threads.append(threading.current_thread().name)
+
+
+def test_queue_logging_writes_sinks_on_background_thread(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setattr(ease, "_LOG_SINKS", [])
+    sink = _ThreadRecordingHandler()
+    ease.enable_queue_logging()
+    try:
+        ease._add_log_sink(sink)
+        ease.log_to_file(tmp_path / "ease.log")
+        ease.logger.info("Queued %s", "message")
+        labels = ["before"]
+        ease.logger.info("Labels %s", labels)
+        labels[0] = "after"
+    finally:
+        ease.disable_queue_logging()
+        for handler in ease._LOG_SINKS:
+            ease.logger.removeHandler(handler)
+            handler.close()
+
+    assert sink.threads
+    assert threading.current_thread().name not in sink.threads
+    log = (tmp_path / "ease.log").read_text()
+    assert "Queued message" in log
+    assert "Labels ['before']" in log
+
+
+_IGNORE_SIGTERM: str = (
+    "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+    "print(flush=True); time.sleep(60)"
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+def test_kill_capella_process_stops_only_tracked_processes():
+    stubborn = ease.start_capella_process(
+        [sys.executable, "-c", _IGNORE_SIGTERM], stdout=subprocess.PIPE
+    )
+    assert stubborn.stdout is not None
+    stubborn.stdout.readline()  # SIGTERM is ignored from now on
+    graceful = ease.start_capella_process(
+        [sys.executable, "-c", "import time; time.sleep(60)"]
+    )
+    untracked = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(60)"]
+    )
+    try:
+        stopped = ease.kill_capella_process(timeout=0.5)
+
+        assert sorted(stopped) == sorted([stubborn.pid, graceful.pid])
+        assert stubborn.returncode == -signal.SIGKILL
+        assert graceful.returncode == -signal.SIGTERM
+        assert untracked.poll() is None
+    finally:
+        untracked.kill()
+        untracked.wait()
+        stubborn.stdout.close()
+
+
+def test_t4c_model_cache_imports_known_revision_from_folder(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    bot = fakebot.capella_workbench(login_required=True, projects=())
+    monkeypatch.setattr(ease, "BOT", bot)
+    imported_dir = tmp_path / "imported" / "model"
+    imported_dir.mkdir(parents=True)
+    (imported_dir / "model.aird").write_text("<aird/>")
+    monkeypatch.setattr(ease, "_project_location", lambda name: imported_dir)
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    monkeypatch.setattr(ease, "workspace_path", lambda: workspace_dir)
+    t4c_args = ("localhost", "2036", "repo", "model", "user", "secret")
+    cache_dir = tmp_path / "cache"
+
+    ease.import_model_from_remote_repository(
+        *t4c_args, revision="42", model_cache_dir=cache_dir
+    )
+    # Like reset_workspace(), leaving a stale directory behind:
+    ease.project_explorer_tree().items.clear()
+    (workspace_dir / "model").mkdir()
+    (workspace_dir / "model" / "stale.aird").write_text("<stale/>")
+    bot.reset_calls()
+    ease.import_model_from_remote_repository(
+        *t4c_args, revision="42", model_cache_dir=cache_dir
+    )
+
+    assert bot.calls_per_method["textWithLabel"] == 0
+    assert (workspace_dir / "model" / "model.aird").read_text() == "<aird/>"
+    assert not (workspace_dir / "model" / "stale.aird").exists()
+    assert ease.tree_item_labels(ease.project_explorer_tree()) == ["model"]
+    assert ease._t4c_model_cache_entry(
+        cache_dir, *t4c_args[:4], "other", "42"
+    ) != ease._t4c_model_cache_entry(cache_dir, *t4c_args[:5], "42")
+
+
+def test_wait_for_any_does_not_block_on_missing_widgets(
+    java_bot: fakebot.FakeBot,
+):
+    java_bot.search_timeout = 5.0
+    java_bot.open_shell("Wizard").buttons["Next >"] = fakebot.FakeButton(
+        java_bot, "Next >", lambda: None
+    )
+    start = time.perf_counter()
+
+    met = ease.wait_for_any(
+        (
+            ease.TextfieldWithLabelIsAvailable("User name"),
+            ease.ButtonWithLabelIsAvailable("Next >"),
+        )
+    )
+
+    assert time.perf_counter() - start < 1
+    assert isinstance(met, ease.ButtonWithLabelIsAvailable)
+    assert java_bot.search_timeout == 5.0
+
+
+def test_t4c_login_steps_prefer_the_login_dialog_over_next(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = fakebot.FakeBot(search_timeout=0)
+    monkeypatch.setattr(ease, "BOT", bot)
+    wizard = bot.open_shell("Import")
+    # "Next >" is enabled beneath the login dialog:
+    wizard.buttons["Next >"] = fakebot.FakeButton(bot, "Next >")
+    login = fakebot.FakeShell("Login")
+    for label in ("User name", "Password"):
+        login.text_fields[label] = fakebot.FakeText(bot)
+    login.buttons["OK"] = fakebot.FakeButton(
+        bot, "OK", lambda: bot.close_shell(login)
+    )
+    wizard.buttons["Test connection"] = fakebot.FakeButton(
+        bot, "Test connection", lambda: bot.shells.append(login)
+    )
+
+    ease.FlowRunner().run(ease._t4c_login_steps("user", "secret"))
+
+    assert login not in bot.shells
+    assert login.text_fields["User name"].text == "user"
+
+
+def test_failed_t4c_import_closes_its_dialogs(monkeypatch: pytest.MonkeyPatch):
+    bot = fakebot.capella_workbench(
+        login_required=True, projects=(), t4c_projects=("model",)
+    )
+    monkeypatch.setattr(ease, "BOT", bot)
+    for name, package in fakebot.java_packages(bot).items():
+        monkeypatch.setattr(ease, name, package, raising=False)
+
+    results = ease.import_models_from_remote_repository(
+        "localhost", "2036", "repo", ["missing", "model"], "user", "secret"
+    )
+
+    assert results[0].error is not None
+    assert results[1].error is None
+    assert len(bot.shells) == 1
+    assert ease.tree_item_labels(ease.project_explorer_tree()) == ["model"]
+
+
+def test_flow_runner_resolves_shared_menu_prefixes_once(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = fakebot.capella_workbench()
+    monkeypatch.setattr(ease, "BOT", bot)
+
+    ease.FlowRunner().run(
+        [
+            ease.ClickMenu(("Window", "Show View", "Other...")),
+            ease.OpenTreeNode(("General", "Console")),
+            ease.ClickMenu(
+                ("Window", "Perspective", "Open Perspective", "Other...")
+            ),
+            ease.SelectTableItem(("Capella", "Capella (default)")),
+            ease.ClickButton("Open"),
+        ]
+    )
+
+    assert ease.is_eclipse_view_shown("Console")
+    assert bot.selected_table_item == "Capella (default)"
+    assert bot.calls_per_method["menu"] == 6
+
+
+def test_menu_cache_is_invalidated_by_shell_changes_and_disposal(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = fakebot.capella_workbench()
+    monkeypatch.setattr(ease, "BOT", bot)
+    cache = ease.MenuCache()
+    path = ("Window", "Show View", "Other...")
+
+    stale = cache.resolve(path)
+    cache.resolve(path)
+    assert bot.calls_per_method["menu"] == 3
+    shell = bot.open_shell("Dialog")
+    cache.resolve(path)
+    assert bot.calls_per_method["menu"] == 6
+
+    bot.close_shell(shell)
+    cache.resolve(path)
+    clicked: list[bool] = []
+    old_window = bot.menu_bar.find("Window")
+    assert old_window is not None
+    old_window.dispose()
+    bot.menu_bar.items.remove(old_window)
+    window = bot.menu_bar.add("Window")
+    window.add("Show View").add("Other...", lambda: clicked.append(True))
+    cache.click(path)
+
+    assert stale.disposed
+    assert clicked == [True]
+
+
+def test_workbench_state_is_kept_current_by_its_listener(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bot = fakebot.capella_workbench()
+    monkeypatch.setattr(ease, "BOT", bot)
+    monkeypatch.setattr(ease, "_workbench", lambda: bot.workbench)
+
+    assert ease.workbench_state().listening
+    assert not ease.is_eclipse_view_shown("Outline")
+    bot.reset_calls()
+    assert not ease.is_eclipse_view_shown("Outline")
+    assert bot.calls == 0
+
+    bot.open_view(fakebot.FakeView(bot, "Outline"))
+    assert ease.is_eclipse_view_shown("Outline")
+    ease.close_eclipse_view("Outline")
+    assert not ease.is_eclipse_view_shown("Outline")
+    bot.activate_perspective("Debug")
+    assert ease.workbench_state().perspective() == "Debug"
+
+
+def test_workbench_state_watches_all_windows_of_the_current_bot(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    old_bot = fakebot.capella_workbench()
+    monkeypatch.setattr(ease, "BOT", old_bot)
+    monkeypatch.setattr(ease, "_workbench", lambda: ease.BOT.workbench)
+    ease.workbench_state()
+    bot = fakebot.capella_workbench()
+    monkeypatch.setattr(ease, "BOT", bot)
+
+    assert ease.workbench_state().listening
+    assert not old_bot.window.listeners
+    assert not old_bot.workbench.listeners
+    assert not ease.is_eclipse_view_shown("Outline")
+    window = bot.workbench.open_window()
+    bot.open_view(fakebot.FakeView(bot, "Outline"), window)
+    assert ease.is_eclipse_view_shown("Outline")
+
+
+def _synthesis_tree(bot: fakebot.FakeBot) -> fakebot.FakeTree:
+    def item(label: str, *children: fakebot.FakeTreeItem):
+        return fakebot.FakeTreeItem(bot, label, children)
+
+    return fakebot.FakeTree(
+        bot,
+        [
+            item(
+                "Conflicts",
+                item("Root", item("Function changed"), item("Port added")),
+            ),
+            item("Other", item("Actor deleted")),
+        ],
+    )
+
+
+EXPECTED_COMPARE_RECORDS: list[ease.CompareRecord] = [
+    ease.CompareRecord((), "group", "Conflicts"),
+    ease.CompareRecord(("Conflicts",), "match", "Root"),
+    ease.CompareRecord(("Conflicts", "Root"), "diff", "Function changed"),
+    ease.CompareRecord(("Conflicts", "Root"), "diff", "Port added"),
+    ease.CompareRecord((), "group", "Other"),
+    ease.CompareRecord(("Other",), "diff", "Actor deleted"),
+]
+
+
+def test_write_compare_result_streams_json_lines(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    bot = fakebot.FakeBot(search_timeout=0)
+    bot.editors.append(
+        fakebot.FakeView(bot, "Compare", tree=_synthesis_tree(bot))
+    )
+    monkeypatch.setattr(ease, "BOT", bot)
+    jsonl_path = tmp_path / "compare.jsonl"
+
+    count = ease.write_compare_result("Compare", jsonl_path)
+
+    lines = jsonl_path.read_text(encoding="utf8").splitlines()
+    assert count == len(lines) == 6
+    assert [
+        ease.CompareRecord(
+            tuple(record["path"]), record["kind"], record["label"]
+        )
+        for record in map(json.loads, lines)
+    ] == EXPECTED_COMPARE_RECORDS
+
+
+def test_compare_result_records_walk_the_tree_once_in_pages(
+    java_bot: fakebot.FakeBot,
+):
+    tree = _synthesis_tree(java_bot)
+    java_bot.editors.append(fakebot.FakeView(java_bot, "Compare", tree=tree))
+
+    records = list(ease.compare_result_records("Compare", page_size=2))
+
+    assert records == EXPECTED_COMPARE_RECORDS
+    assert java_bot.calls_per_method["syncExec"] == 3
+    # One array of children per item with children, none per label:
+    assert java_bot.calls_per_method["getItems"] == 4
+    assert java_bot.calls_per_method["toString"] == 4
+    assert not java_bot.calls_per_method["getText"]
+    assert [item.text for _, item in tree.events] == [
+        "Conflicts",
+        "Root",
+        "Other",
+    ]
+
+
+class _CollapsedTreeItem(fakebot.FakeTreeItem):
+    def setExpanded(self, expanded: bool) -> None:
+        self._bot.bridge_call("setExpanded")
+
+
+def test_compare_result_records_skip_items_that_stay_collapsed(
+    java_bot: fakebot.FakeBot,
+):
+    tree = _synthesis_tree(java_bot)
+    tree.items[1] = _CollapsedTreeItem(
+        java_bot, "Other", tree.items[1].children
+    )
+    java_bot.editors.append(fakebot.FakeView(java_bot, "Compare", tree=tree))
+
+    records = list(ease.compare_result_records("Compare"))
+
+    assert records == EXPECTED_COMPARE_RECORDS[:-1]
+
+
+def test_compare_models_isolates_failing_pairs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    bot = fakebot.capella_workbench(projects=("a", "b", "c"))
+    bot.search_timeout = 0
+    monkeypatch.setattr(ease, "BOT", bot)
+
+    results = ease.compare_models(
+        [("a", "b"), ("a", "missing"), ("b", "c")], tmp_path / "compare"
+    )
+
+    assert [result.error is None for result in results] == [
+        True,
+        False,
+        True,
+    ]
+    assert [result.items for result in results] == [3, 0, 3]
+    assert results[2].jsonl_path == tmp_path / "compare" / "b--c.jsonl"
+    assert len(results[2].jsonl_path.read_text().splitlines()) == 3
+    assert not any(editor.visible for editor in bot.editors)
+
+
+def test_compare_models_closes_dialogs_of_failing_pairs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    bot = fakebot.capella_workbench(projects=("a", "b", "c"))
+    bot.search_timeout = 0
+    monkeypatch.setattr(ease, "BOT", bot)
+    write_compare_result = ease.write_compare_result
+
+    def write_or_fail(title: str, *args: object) -> int:
+        if "'a'" in title:
+            bot.open_shell("Merge")
+            raise RuntimeError("Cannot merge")
+        return write_compare_result(title, *args)  # type: ignore
+
+    monkeypatch.setattr(ease, "write_compare_result", write_or_fail)
+
+    results = ease.compare_models([("a", "b"), ("b", "c")], tmp_path)
+
+    assert [result.error is None for result in results] == [False, True]
+    assert len(bot.shells) == 1
+
+
+def test_fill_text_fields_with_labels_waits_once_per_page(
+    java_bot: fakebot.FakeBot,
+):
+    for label in ("Repository Host:", "Port Number:", "Repository Name:"):
+        java_bot.active_shell.text_fields[label] = fakebot.FakeText(java_bot)
+    java_bot.active_shell.text_fields["Port Number:"].enabled_at = 1e12
+
+    with pytest.raises(RuntimeError, match="not enabled"):
+        ease.fill_text_fields_with_labels(
+            {"Repository Host:": "localhost", "Port Number:": "2036"}
+        )
+    java_bot.reset_calls()
+    ease.fill_text_fields_with_labels(
+        {"Repository Host:": "localhost", "Repository Name:": "repo"}
+    )
+
+    fields = java_bot.active_shell.text_fields
+    assert fields["Repository Host:"].text == "localhost"
+    assert fields["Repository Name:"].text == "repo"
+    # One lookup and one setText per text field, no further waiting:
+    assert java_bot.calls_per_method == {"textWithLabel": 2, "setText": 2}
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and the pyease contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyease import supervisor
+
+# Stands in for Capella: runs the EASE startup scripts of the workspace
+FAKE_CAPELLA: str = r"""
+import runpy, sys
+from pathlib import Path
+
+workspace = Path(sys.argv[sys.argv.index("-data") + 1])
+prefs = workspace / (
+    ".metadata/.plugins/org.eclipse.core.runtime/.settings/"
+    "org.eclipse.ease.ui.scripts.prefs"
+)
+for line in prefs.read_text().splitlines():
+    if "/location=file\\://" in line:
+        location = line.split("/location=file\\://")[1].replace("\\:", ":")
+for script in sorted(Path(location).glob("*.py")):
+    if "# onStartup: true" in script.read_text():
+        runpy.run_path(str(script), run_name="__main__")
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+def test_supervisor_runs_scripts_and_restarts_crashed_instances(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parents[1]))
+    monkeypatch.delenv("EASE_WORKSPACE_TEMPLATE_CACHE", raising=False)
+    fake_capella = tmp_path / "capella.py"
+    fake_capella.write_text(FAKE_CAPELLA)
+    scripts: list[Path] = []
+    for name, code in (
+        ("first.py", "import sys; open(sys.argv[1], 'w').close()"),
+        ("crash.py", "import os; os._exit(3)"),
+        ("second.py", "import sys; open(sys.argv[1], 'w').close()"),
+        ("fail.py", "raise ValueError('bad model')"),
+    ):
+        scripts.append(tmp_path / name)
+        scripts[-1].write_text(code)
+
+    with supervisor.Supervisor(
+        [sys.executable, str(fake_capella)],
+        tmp_path / "instances",
+        instances=2,
+        startup_timeout=30,
+        poll_interval=0.02,
+    ) as supervisor_:
+        supervisor_.submit(scripts[0], str(tmp_path / "first.done"))
+        supervisor_.submit(scripts[1])
+        supervisor_.submit(scripts[2], str(tmp_path / "second.done"))
+        supervisor_.submit(scripts[3])
+        results = supervisor_.wait()
+
+    assert [result.script for result in results] == scripts
+    assert [result.error is None for result in results] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert results[1].attempts == 2
+    assert "exited with code 3" in str(results[1].error)
+    assert results[3].error == "ValueError: bad model"
+    assert supervisor_.restarts == 2
+    assert (tmp_path / "first.done").exists()
+    assert (tmp_path / "second.done").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+def test_supervisor_fails_scripts_when_no_instance_gets_ready(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.delenv("EASE_WORKSPACE_TEMPLATE_CACHE", raising=False)
+    script = tmp_path / "script.py"
+    script.write_text("pass")
+
+    with supervisor.Supervisor(
+        [sys.executable, "-c", "import sys; sys.exit(1)"],
+        tmp_path / "instances",
+        instances=2,
+        max_restarts=1,
+        poll_interval=0.02,
+    ) as supervisor_:
+        results = supervisor_.run([script, script])
+
+    assert [result.error for result in results] == [
+        "No Capella instance got ready"
+    ] * 2
+    assert supervisor_.restarts == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+def test_supervisor_restarts_instances_hanging_with_a_heartbeat(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parents[1]))
+    monkeypatch.delenv("EASE_WORKSPACE_TEMPLATE_CACHE", raising=False)
+    fake_capella = tmp_path / "capella.py"
+    fake_capella.write_text(FAKE_CAPELLA)
+    hang = tmp_path / "hang.py"
+    hang.write_text("import time; time.sleep(600)")
+    done = tmp_path / "done.py"
+    done.write_text("import sys; open(sys.argv[1], 'w').close()")
+
+    with supervisor.Supervisor(
+        [sys.executable, str(fake_capella)],
+        tmp_path / "instances",
+        instances=1,
+        startup_timeout=30,
+        heartbeat_timeout=1.5,
+        job_timeout=3,
+        max_attempts=1,
+        poll_interval=0.02,
+    ) as supervisor_:
+        supervisor_.submit(hang)
+        supervisor_.submit(done, str(tmp_path / "done"))
+        results = supervisor_.wait()
+
+    assert "did not finish" in str(results[0].error)
+    assert results[1].error is None
+    assert supervisor_.restarts == 1
+    assert (tmp_path / "done").exists()
+    assert supervisor.Supervisor([], tmp_path).job_timeout is not None